@@ -13,31 +13,46 @@ from .registry import (
     RegistryItem,
 )
 from .schema import load_schema, schema_version
+from .series import FilenameRange, TimestampRange
 from .typed import from_model
-from .validate import validate
-
-_TYPED_AVAILABLE = False
-typed_available = False
-models = None
-try:
-    models = importlib.import_module(".models", __name__)
-except ModuleNotFoundError as exc:
-    missing_root = (exc.name or "").split(".")[0]
-    if missing_root not in {"pydantic", "pydantic_core"} and "pydantic" not in str(exc):
-        raise
-else:
-    _TYPED_AVAILABLE = True
-    typed_available = True
+from .validate import validate, validate_many
+
+_LAZY_TYPED_ATTRS = ("models", "typed_available", "_TYPED_AVAILABLE")
+
+
+def _load_models() -> None:
+    """Import the optional Pydantic models and publish the typed-support flags."""
+
+    models = None
+    try:
+        models = importlib.import_module(".models", __name__)
+    except ModuleNotFoundError as exc:
+        missing_root = (exc.name or "").split(".")[0]
+        if missing_root not in {"pydantic", "pydantic_core"} and "pydantic" not in str(exc):
+            raise
+    globals().update(models=models, typed_available=models is not None, _TYPED_AVAILABLE=models is not None)
+
+
+def __getattr__(name: str):
+    # `models` pulls in pydantic, so it is only imported on first access.
+    if name in _LAZY_TYPED_ATTRS:
+        _load_models()
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "R3XAFile",
     "new_item",
     "unit",
     "data_set_file",
+    "TimestampRange",
+    "FilenameRange",
     "from_model",
     "load_schema",
     "schema_version",
     "validate",
+    "validate_many",
     "Registry",
     "RegistryItem",
     "models",
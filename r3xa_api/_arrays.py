@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import math
+from itertools import islice
+from typing import Any, Tuple
+
+from .series import TimestampRange
+
+
+def is_array_like(value: Any) -> bool:
+    """Return True for array objects (NumPy arrays, `array.array`, packed views) exposing `tolist()`."""
+
+    return not isinstance(value, (str, bytes, dict, list)) and callable(getattr(value, "tolist", None))
+
+
+def _as_numpy(value: Any) -> Tuple[Any, Any]:
+    try:
+        import numpy
+    except ImportError:
+        return None, None
+    try:
+        return numpy, numpy.asarray(value)
+    except (TypeError, ValueError):
+        return None, None
+
+
+def check_timestamps(values: Any) -> None:
+    """Raise `ValueError` unless numeric timestamps are finite and non-decreasing.
+
+    Array objects are checked with vectorized NumPy comparisons when NumPy is
+    installed, without building Python floats. Lists holding non-numeric entries
+    are left to schema validation.
+    """
+
+    if isinstance(values, TimestampRange):
+        if not values.is_monotonic():
+            raise ValueError("timestamps must be finite and non-decreasing")
+        return
+    if is_array_like(values):
+        numpy, array = _as_numpy(values)
+        if array is None:
+            values = values.tolist()
+        else:
+            if array.dtype.kind not in "fiu":
+                raise ValueError(f"timestamps array must be numeric, got dtype {array.dtype}")
+            if array.ndim != 1:
+                raise ValueError(f"timestamps array must be one-dimensional, got shape {array.shape}")
+            if array.dtype.kind == "f" and not numpy.isfinite(array).all():
+                raise ValueError("timestamps must be finite")
+            if array.size > 1 and (array[1:] < array[:-1]).any():
+                raise ValueError("timestamps must be non-decreasing")
+            return
+    if not all(type(value) in (int, float) for value in values):
+        return
+    if not all(map(math.isfinite, values)):
+        raise ValueError("timestamps must be finite")
+    if any(later < earlier for earlier, later in zip(values, islice(values, 1, None))):
+        raise ValueError("timestamps must be non-decreasing")
+
+
+def materialize(value: Any) -> Any:
+    """Return `value` with array-like leaves (objects exposing `tolist()`) as lists.
+
+    Containers are copied only along the paths that hold such leaves, so plain JSON
+    values come back unchanged (same objects). Lists are only descended into when
+    their first element is a container or an array-like, which keeps long scalar
+    arrays from being scanned element by element.
+    """
+
+    if isinstance(value, dict):
+        copied = None
+        for key, item in value.items():
+            new = materialize(item)
+            if new is not item:
+                if copied is None:
+                    copied = dict(value)
+                copied[key] = new
+        return value if copied is None else copied
+    if isinstance(value, list):
+        if not value or not (isinstance(value[0], (dict, list)) or is_array_like(value[0])):
+            return value
+        copied_list = None
+        for index, item in enumerate(value):
+            new = materialize(item)
+            if new is not item:
+                if copied_list is None:
+                    copied_list = list(value)
+                copied_list[index] = new
+        return value if copied_list is None else copied_list
+    if is_array_like(value):
+        return value.tolist()
+    return value
+
+
+def json_default(value: Any) -> Any:
+    """`default=` hook for JSON encoders that expands array-like values lazily."""
+
+    if is_array_like(value):
+        return value.tolist()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
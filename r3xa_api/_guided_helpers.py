@@ -0,0 +1,378 @@
+# AUTO-GENERATED FROM THE PACKAGED R3XA SCHEMA.
+# DO NOT EDIT MANUALLY.
+
+from __future__ import annotations
+
+from typing import Any, Dict
+
+SCHEMA_SHA256 = "b315739367612a9bbc12a7923d08a3ba672aab9c64a14e9c7ec9cb701aa1dac4"
+
+KIND_SPECS: Dict[str, Dict[str, Any]] = {
+    "settings/generic": {
+        "required": ("title", "description"),
+        "array_fields": ("associated_data_sources",),
+        "helper_name": "add_generic_setting",
+    },
+    "settings/specimen": {
+        "required": ("title", "description", "sizes"),
+        "array_fields": ("sizes",),
+        "helper_name": "add_specimen_setting",
+    },
+    "settings/stereorig": {
+        "required": ("title", "description", "stereo_angle"),
+        "array_fields": ("calibration_target_size", "associated_data_sources"),
+        "helper_name": "add_stereorig_setting",
+    },
+    "settings/testing_machine": {
+        "required": ("title", "description", "type"),
+        "array_fields": ("associated_data_sources",),
+        "helper_name": "add_testing_machine_setting",
+    },
+    "data_sources/camera": {
+        "required": ("title", "output_components", "output_dimension", "output_units", "image_size"),
+        "array_fields": ("input_data_sets", "output_units", "image_size", "field_of_view"),
+        "helper_name": "add_camera_source",
+    },
+    "data_sources/dic_measurement": {
+        "required": ("output_components", "output_dimension", "output_units", "matching_criterion"),
+        "array_fields": ("input_data_sets", "output_units", "subset_size"),
+        "helper_name": "add_dic_measurement_source",
+    },
+    "data_sources/generic": {
+        "required": ("title", "description", "output_components", "output_dimension", "output_units", "manufacturer", "model"),
+        "array_fields": ("input_data_sets", "output_units"),
+        "helper_name": "add_generic_source",
+    },
+    "data_sources/identification": {
+        "required": ("output_components", "output_dimension", "output_units"),
+        "array_fields": ("input_data_sets", "output_units"),
+        "helper_name": "add_identification_source",
+    },
+    "data_sources/infrared": {
+        "required": ("title", "output_components", "output_dimension", "output_units", "image_size", "bandwidth"),
+        "array_fields": ("input_data_sets", "output_units", "image_size", "field_of_view", "bandwidth"),
+        "helper_name": "add_infrared_source",
+    },
+    "data_sources/load_cell": {
+        "required": ("output_components", "output_dimension", "output_units", "capacity"),
+        "array_fields": ("input_data_sets", "output_units"),
+        "helper_name": "add_load_cell_source",
+    },
+    "data_sources/mechanical_analysis": {
+        "required": ("output_components", "output_dimension", "output_units", "manufacturer"),
+        "array_fields": ("input_data_sets", "output_units"),
+        "helper_name": "add_mechanical_analysis_source",
+    },
+    "data_sources/point_temperature": {
+        "required": ("output_components", "output_dimension", "output_units", "range"),
+        "array_fields": ("input_data_sets", "output_units", "range"),
+        "helper_name": "add_point_temperature_source",
+    },
+    "data_sources/strain_computation": {
+        "required": ("output_components", "output_dimension", "output_units", "virtual_strain_gauge_size"),
+        "array_fields": ("input_data_sets", "output_units"),
+        "helper_name": "add_strain_computation_source",
+    },
+    "data_sources/strain_gauge": {
+        "required": ("output_components", "output_dimension", "output_units", "length"),
+        "array_fields": ("input_data_sets", "output_units"),
+        "helper_name": "add_strain_gauge_source",
+    },
+    "data_sources/tomograph": {
+        "required": ("output_components", "output_dimension", "output_units", "image_size", "source"),
+        "array_fields": ("input_data_sets", "output_units", "image_size", "field_of_view"),
+        "helper_name": "add_tomograph_source",
+    },
+    "data_sets/file": {
+        "required": ("title", "description", "data_sources", "time_reference", "timestamps", "data"),
+        "array_fields": ("data_sources", "keywords"),
+        "helper_name": "add_file_data_set",
+    },
+    "data_sets/generic": {
+        "required": ("title", "description", "data_sources", "file_type", "path"),
+        "array_fields": ("data_sources",),
+        "helper_name": "add_generic_data_set",
+    },
+    "data_sets/list": {
+        "required": ("title", "description", "file_type", "data_sources", "time_reference", "timestamps", "data"),
+        "array_fields": ("data_sources", "keywords", "timestamps", "data"),
+        "helper_name": "add_list_data_set",
+    },
+}
+
+
+def add_generic_setting(self, title: Any, description: Any, **extra: Any) -> Dict[str, Any]:
+    """Add a `settings/generic` item.
+
+    Required fields: title, description.
+    Optional schema fields can be passed through `**extra`.
+    """
+    fields: Dict[str, Any] = {}
+    fields['title'] = title
+    fields['description'] = description
+    fields.update(extra)
+    return self._add_guided_item('settings/generic', fields)
+
+
+def add_specimen_setting(self, title: Any, description: Any, sizes: Any, **extra: Any) -> Dict[str, Any]:
+    """Add a `settings/specimen` item.
+
+    Required fields: title, description, sizes.
+    Optional schema fields can be passed through `**extra`.
+    """
+    fields: Dict[str, Any] = {}
+    fields['title'] = title
+    fields['description'] = description
+    fields['sizes'] = sizes
+    fields.update(extra)
+    return self._add_guided_item('settings/specimen', fields)
+
+
+def add_stereorig_setting(self, title: Any, description: Any, stereo_angle: Any, **extra: Any) -> Dict[str, Any]:
+    """Add a `settings/stereorig` item.
+
+    Required fields: title, description, stereo_angle.
+    Optional schema fields can be passed through `**extra`.
+    """
+    fields: Dict[str, Any] = {}
+    fields['title'] = title
+    fields['description'] = description
+    fields['stereo_angle'] = stereo_angle
+    fields.update(extra)
+    return self._add_guided_item('settings/stereorig', fields)
+
+
+def add_testing_machine_setting(self, title: Any, description: Any, type: Any, **extra: Any) -> Dict[str, Any]:
+    """Add a `settings/testing_machine` item.
+
+    Required fields: title, description, type.
+    Optional schema fields can be passed through `**extra`.
+    """
+    fields: Dict[str, Any] = {}
+    fields['title'] = title
+    fields['description'] = description
+    fields['type'] = type
+    fields.update(extra)
+    return self._add_guided_item('settings/testing_machine', fields)
+
+
+def add_camera_source(self, title: Any, output_components: Any, output_dimension: Any, output_units: Any, image_size: Any, **extra: Any) -> Dict[str, Any]:
+    """Add a `data_sources/camera` item.
+
+    Required fields: title, output_components, output_dimension, output_units, image_size.
+    Optional schema fields can be passed through `**extra`.
+    """
+    fields: Dict[str, Any] = {}
+    fields['title'] = title
+    fields['output_components'] = output_components
+    fields['output_dimension'] = output_dimension
+    fields['output_units'] = output_units
+    fields['image_size'] = image_size
+    fields.update(extra)
+    return self._add_guided_item('data_sources/camera', fields)
+
+
+def add_dic_measurement_source(self, output_components: Any, output_dimension: Any, output_units: Any, matching_criterion: Any, **extra: Any) -> Dict[str, Any]:
+    """Add a `data_sources/dic_measurement` item.
+
+    Required fields: output_components, output_dimension, output_units, matching_criterion.
+    Optional schema fields can be passed through `**extra`.
+    """
+    fields: Dict[str, Any] = {}
+    fields['output_components'] = output_components
+    fields['output_dimension'] = output_dimension
+    fields['output_units'] = output_units
+    fields['matching_criterion'] = matching_criterion
+    fields.update(extra)
+    return self._add_guided_item('data_sources/dic_measurement', fields)
+
+
+def add_generic_source(self, title: Any, description: Any, output_components: Any, output_dimension: Any, output_units: Any, manufacturer: Any, model: Any, **extra: Any) -> Dict[str, Any]:
+    """Add a `data_sources/generic` item.
+
+    Required fields: title, description, output_components, output_dimension, output_units, manufacturer, model.
+    Optional schema fields can be passed through `**extra`.
+    """
+    fields: Dict[str, Any] = {}
+    fields['title'] = title
+    fields['description'] = description
+    fields['output_components'] = output_components
+    fields['output_dimension'] = output_dimension
+    fields['output_units'] = output_units
+    fields['manufacturer'] = manufacturer
+    fields['model'] = model
+    fields.update(extra)
+    return self._add_guided_item('data_sources/generic', fields)
+
+
+def add_identification_source(self, output_components: Any, output_dimension: Any, output_units: Any, **extra: Any) -> Dict[str, Any]:
+    """Add a `data_sources/identification` item.
+
+    Required fields: output_components, output_dimension, output_units.
+    Optional schema fields can be passed through `**extra`.
+    """
+    fields: Dict[str, Any] = {}
+    fields['output_components'] = output_components
+    fields['output_dimension'] = output_dimension
+    fields['output_units'] = output_units
+    fields.update(extra)
+    return self._add_guided_item('data_sources/identification', fields)
+
+
+def add_infrared_source(self, title: Any, output_components: Any, output_dimension: Any, output_units: Any, image_size: Any, bandwidth: Any, **extra: Any) -> Dict[str, Any]:
+    """Add a `data_sources/infrared` item.
+
+    Required fields: title, output_components, output_dimension, output_units, image_size, bandwidth.
+    Optional schema fields can be passed through `**extra`.
+    """
+    fields: Dict[str, Any] = {}
+    fields['title'] = title
+    fields['output_components'] = output_components
+    fields['output_dimension'] = output_dimension
+    fields['output_units'] = output_units
+    fields['image_size'] = image_size
+    fields['bandwidth'] = bandwidth
+    fields.update(extra)
+    return self._add_guided_item('data_sources/infrared', fields)
+
+
+def add_load_cell_source(self, output_components: Any, output_dimension: Any, output_units: Any, capacity: Any, **extra: Any) -> Dict[str, Any]:
+    """Add a `data_sources/load_cell` item.
+
+    Required fields: output_components, output_dimension, output_units, capacity.
+    Optional schema fields can be passed through `**extra`.
+    """
+    fields: Dict[str, Any] = {}
+    fields['output_components'] = output_components
+    fields['output_dimension'] = output_dimension
+    fields['output_units'] = output_units
+    fields['capacity'] = capacity
+    fields.update(extra)
+    return self._add_guided_item('data_sources/load_cell', fields)
+
+
+def add_mechanical_analysis_source(self, output_components: Any, output_dimension: Any, output_units: Any, manufacturer: Any, **extra: Any) -> Dict[str, Any]:
+    """Add a `data_sources/mechanical_analysis` item.
+
+    Required fields: output_components, output_dimension, output_units, manufacturer.
+    Optional schema fields can be passed through `**extra`.
+    """
+    fields: Dict[str, Any] = {}
+    fields['output_components'] = output_components
+    fields['output_dimension'] = output_dimension
+    fields['output_units'] = output_units
+    fields['manufacturer'] = manufacturer
+    fields.update(extra)
+    return self._add_guided_item('data_sources/mechanical_analysis', fields)
+
+
+def add_point_temperature_source(self, output_components: Any, output_dimension: Any, output_units: Any, range: Any, **extra: Any) -> Dict[str, Any]:
+    """Add a `data_sources/point_temperature` item.
+
+    Required fields: output_components, output_dimension, output_units, range.
+    Optional schema fields can be passed through `**extra`.
+    """
+    fields: Dict[str, Any] = {}
+    fields['output_components'] = output_components
+    fields['output_dimension'] = output_dimension
+    fields['output_units'] = output_units
+    fields['range'] = range
+    fields.update(extra)
+    return self._add_guided_item('data_sources/point_temperature', fields)
+
+
+def add_strain_computation_source(self, output_components: Any, output_dimension: Any, output_units: Any, virtual_strain_gauge_size: Any, **extra: Any) -> Dict[str, Any]:
+    """Add a `data_sources/strain_computation` item.
+
+    Required fields: output_components, output_dimension, output_units, virtual_strain_gauge_size.
+    Optional schema fields can be passed through `**extra`.
+    """
+    fields: Dict[str, Any] = {}
+    fields['output_components'] = output_components
+    fields['output_dimension'] = output_dimension
+    fields['output_units'] = output_units
+    fields['virtual_strain_gauge_size'] = virtual_strain_gauge_size
+    fields.update(extra)
+    return self._add_guided_item('data_sources/strain_computation', fields)
+
+
+def add_strain_gauge_source(self, output_components: Any, output_dimension: Any, output_units: Any, length: Any, **extra: Any) -> Dict[str, Any]:
+    """Add a `data_sources/strain_gauge` item.
+
+    Required fields: output_components, output_dimension, output_units, length.
+    Optional schema fields can be passed through `**extra`.
+    """
+    fields: Dict[str, Any] = {}
+    fields['output_components'] = output_components
+    fields['output_dimension'] = output_dimension
+    fields['output_units'] = output_units
+    fields['length'] = length
+    fields.update(extra)
+    return self._add_guided_item('data_sources/strain_gauge', fields)
+
+
+def add_tomograph_source(self, output_components: Any, output_dimension: Any, output_units: Any, image_size: Any, source: Any, **extra: Any) -> Dict[str, Any]:
+    """Add a `data_sources/tomograph` item.
+
+    Required fields: output_components, output_dimension, output_units, image_size, source.
+    Optional schema fields can be passed through `**extra`.
+    """
+    fields: Dict[str, Any] = {}
+    fields['output_components'] = output_components
+    fields['output_dimension'] = output_dimension
+    fields['output_units'] = output_units
+    fields['image_size'] = image_size
+    fields['source'] = source
+    fields.update(extra)
+    return self._add_guided_item('data_sources/tomograph', fields)
+
+
+def add_file_data_set(self, title: Any, description: Any, data_sources: Any, time_reference: Any, timestamps: Any, data: Any, **extra: Any) -> Dict[str, Any]:
+    """Add a `data_sets/file` item.
+
+    Required fields: title, description, data_sources, time_reference, timestamps, data.
+    Optional schema fields can be passed through `**extra`.
+    """
+    fields: Dict[str, Any] = {}
+    fields['title'] = title
+    fields['description'] = description
+    fields['data_sources'] = data_sources
+    fields['time_reference'] = time_reference
+    fields['timestamps'] = timestamps
+    fields['data'] = data
+    fields.update(extra)
+    return self._add_guided_item('data_sets/file', fields)
+
+
+def add_generic_data_set(self, title: Any, description: Any, data_sources: Any, file_type: Any, path: Any, **extra: Any) -> Dict[str, Any]:
+    """Add a `data_sets/generic` item.
+
+    Required fields: title, description, data_sources, file_type, path.
+    Optional schema fields can be passed through `**extra`.
+    """
+    fields: Dict[str, Any] = {}
+    fields['title'] = title
+    fields['description'] = description
+    fields['data_sources'] = data_sources
+    fields['file_type'] = file_type
+    fields['path'] = path
+    fields.update(extra)
+    return self._add_guided_item('data_sets/generic', fields)
+
+
+def add_list_data_set(self, title: Any, description: Any, file_type: Any, data_sources: Any, time_reference: Any, timestamps: Any, data: Any, **extra: Any) -> Dict[str, Any]:
+    """Add a `data_sets/list` item.
+
+    Required fields: title, description, file_type, data_sources, time_reference, timestamps, data.
+    Optional schema fields can be passed through `**extra`.
+    """
+    fields: Dict[str, Any] = {}
+    fields['title'] = title
+    fields['description'] = description
+    fields['file_type'] = file_type
+    fields['data_sources'] = data_sources
+    fields['time_reference'] = time_reference
+    fields['timestamps'] = timestamps
+    fields['data'] = data
+    fields.update(extra)
+    return self._add_guided_item('data_sets/list', fields)
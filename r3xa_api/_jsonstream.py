@@ -0,0 +1,303 @@
+from __future__ import annotations
+
+import json
+import mmap
+import os
+import re
+from typing import Any, Collection, Dict, Iterator, List, TextIO, Tuple, Union
+
+
+_WHITESPACE = " \t\n\r"
+_DEFAULT_CHUNK_SIZE = 1 << 16
+
+
+class _StreamReader:
+    """Incremental JSON tokenizer over a text stream with a bounded sliding buffer."""
+
+    def __init__(self, fp: TextIO, chunk_size: int = _DEFAULT_CHUNK_SIZE) -> None:
+        self._fp = fp
+        self._chunk_size = chunk_size
+        self._decoder = json.JSONDecoder()
+        self._buf = ""
+        self._pos = 0
+        self._offset = 0
+        self._eof = False
+
+    @property
+    def offset(self) -> int:
+        """Absolute character offset of the next unread character."""
+
+        return self._offset + self._pos
+
+    def _fill(self, size: int) -> bool:
+        """Drop consumed input and append at least `size` characters; return False at EOF."""
+
+        if self._eof:
+            return False
+        if self._pos:
+            self._offset += self._pos
+            self._buf = self._buf[self._pos:]
+            self._pos = 0
+        chunk = self._fp.read(size)
+        if not chunk:
+            self._eof = True
+            return False
+        self._buf += chunk
+        return True
+
+    def peek(self) -> str:
+        """Skip whitespace and return the next character, or an empty string at EOF."""
+
+        while True:
+            while self._pos < len(self._buf) and self._buf[self._pos] in _WHITESPACE:
+                self._pos += 1
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._fill(self._chunk_size):
+                return ""
+
+    def expect(self, char: str) -> None:
+        """Consume `char` (after whitespace) or raise `ValueError`."""
+
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"Expecting {char!r} at offset {self.offset}, found {found or 'end of input'!r}")
+        self._pos += 1
+
+    def read_value(self) -> Any:
+        """Decode the next complete JSON value, reading more input as needed."""
+
+        self.peek()
+        size = self._chunk_size
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError as exc:
+                if not self._fill(max(size, len(self._buf))):
+                    raise ValueError(f"{exc.msg} at offset {self._offset + exc.pos}") from None
+                size *= 2
+                continue
+            if end == len(self._buf) and not self._eof and self._fill(size):
+                # A number or literal may continue in the next chunk.
+                continue
+            self._pos = end
+            return value
+
+
+def iter_document(
+    fp: TextIO,
+    sections: Collection[str],
+    chunk_size: int = _DEFAULT_CHUNK_SIZE,
+) -> Iterator[Tuple[str, str, Any, Any]]:
+    """Yield the members of a top-level JSON object without loading it whole.
+
+    Members named in `sections` whose value is an array are yielded item by item as
+    `("item", section, index, item)`, followed by `("member", section, None, [])`;
+    every other member is yielded once as `("member", key, None, value)`.
+    Malformed input raises `ValueError`.
+    """
+
+    reader = _StreamReader(fp, chunk_size)
+    reader.expect("{")
+    if reader.peek() == "}":
+        reader.expect("}")
+    else:
+        while True:
+            key = reader.read_value()
+            if not isinstance(key, str):
+                raise ValueError(f"Expecting property name at offset {reader.offset}")
+            reader.expect(":")
+            if key in sections and reader.peek() == "[":
+                reader.expect("[")
+                index = 0
+                if reader.peek() == "]":
+                    reader.expect("]")
+                else:
+                    while True:
+                        yield "item", key, index, reader.read_value()
+                        index += 1
+                        if reader.peek() == "]":
+                            reader.expect("]")
+                            break
+                        reader.expect(",")
+                yield "member", key, None, []
+            else:
+                yield "member", key, None, reader.read_value()
+            if reader.peek() == "}":
+                reader.expect("}")
+                break
+            reader.expect(",")
+    if reader.peek():
+        raise ValueError(f"Extra data at offset {reader.offset}")
+
+
+_WS = re.compile(rb"[ \t\n\r]*")
+_STRING = re.compile(rb'"[^"\\]*(?:\\.[^"\\]*)*"')
+_SCALAR = re.compile(rb"[^,\]}\s]+")
+_ESCAPE = re.compile(rb"\\.", re.S)
+_QUOTE_OR_ESCAPE = re.compile(rb'\\.|"', re.S)
+_BRACKETS = (b"[", b"]", b"{", b"}")
+# Largest slice copied out of a memory map at once.
+_MMAP_CHUNK_SIZE = 1 << 20
+
+Span = Tuple[int, int]
+# `bytes`, or a read-only `mmap.mmap` so a file is indexed without reading it into memory.
+Buffer = Union[bytes, mmap.mmap]
+
+
+def _count_quotes(data: Buffer, start: int, end: int) -> int:
+    """Count the unescaped `"` bytes in `data[start:end]` without copying a large mmap range."""
+
+    if isinstance(data, bytes):
+        if data.find(b"\\", start, end) == -1:
+            return data.count(b'"', start, end)
+        return _ESCAPE.sub(b"", data[start:end]).count(b'"')
+    if data.find(b"\\", start, end) == -1:
+        # `mmap` has no `count`; a single byte cannot straddle two chunks.
+        return sum(
+            data[chunk : min(chunk + _MMAP_CHUNK_SIZE, end)].count(b'"')
+            for chunk in range(start, end, _MMAP_CHUNK_SIZE)
+        )
+    return sum(1 for match in _QUOTE_OR_ESCAPE.finditer(data, start, end) if match.group() == b'"')
+
+
+def _skip_nested(data: Buffer, pos: int) -> int:
+    """Return the offset just past the array or object starting at `pos`.
+
+    Only brackets are visited: the next occurrence of each bracket byte is found
+    with `bytes.find`, and whether it sits inside a string follows from the parity
+    of the (unescaped) quotes counted since the previous bracket, so long runs of
+    numbers and strings are skipped at C speed without being decoded.
+    """
+
+    find, size = data.find, len(data)
+    upcoming = [find(bracket, pos) for bracket in _BRACKETS]
+    upcoming = [size if at == -1 else at for at in upcoming]
+    depth = 0
+    in_string = False
+    while True:
+        at = min(upcoming)
+        if at == size:
+            raise ValueError(f"Unterminated array or object at offset {pos}")
+        which = upcoming.index(at)
+        following = find(_BRACKETS[which], at + 1)
+        upcoming[which] = size if following == -1 else following
+        if _count_quotes(data, pos, at) & 1:
+            in_string = not in_string
+        pos = at + 1
+        if in_string:
+            continue
+        depth += 1 if which in (0, 2) else -1
+        if depth == 0:
+            return pos
+
+
+def _skip_value(data: Buffer, pos: int) -> int:
+    char = data[pos : pos + 1]
+    if char in (b"[", b"{"):
+        return _skip_nested(data, pos)
+    match = (_STRING if char == b'"' else _SCALAR).match(data, pos)
+    if match is None:
+        raise ValueError(f"Expecting value at offset {pos}")
+    return match.end()
+
+
+def _expect(data: Buffer, pos: int, char: bytes) -> int:
+    pos = _WS.match(data, pos).end()
+    if data[pos : pos + 1] != char:
+        found = data[pos : pos + 1].decode("utf-8", "replace") or "end of input"
+        raise ValueError(f"Expecting {char.decode()!r} at offset {pos}, found {found!r}")
+    return pos + 1
+
+
+def index_document(data: Buffer, sections: Collection[str]) -> Tuple[Dict[str, Any], Dict[str, List[Span]]]:
+    """Locate the items of top-level array members without decoding them.
+
+    `data` may be a read-only `mmap` of the file, so only the pages being scanned
+    are resident and no copy of the document is made. Returns `(members, spans)`: every member not named in `sections` (or not an
+    array) is decoded into `members`; for each named array member, `spans[name]`
+    lists the `(start, end)` byte offsets of its items in `data`. Malformed input
+    raises `ValueError`; item bodies are only checked for balanced brackets.
+    """
+
+    members: Dict[str, Any] = {}
+    spans: Dict[str, List[Span]] = {}
+    pos = _expect(data, 0, b"{")
+    pos = _WS.match(data, pos).end()
+    if data[pos : pos + 1] == b"}":
+        pos += 1
+    else:
+        while True:
+            pos = _WS.match(data, pos).end()
+            match = _STRING.match(data, pos)
+            if match is None:
+                raise ValueError(f"Expecting property name at offset {pos}")
+            key = json.loads(match.group())
+            pos = _WS.match(data, _expect(data, match.end(), b":")).end()
+            if key in sections and data[pos : pos + 1] == b"[":
+                items: List[Span] = []
+                pos = _WS.match(data, pos + 1).end()
+                if data[pos : pos + 1] == b"]":
+                    pos += 1
+                else:
+                    while True:
+                        end = _skip_value(data, pos)
+                        items.append((pos, end))
+                        pos = _WS.match(data, end).end()
+                        if data[pos : pos + 1] == b"]":
+                            pos += 1
+                            break
+                        pos = _WS.match(data, _expect(data, pos, b",")).end()
+                spans[key] = items
+            else:
+                end = _skip_value(data, pos)
+                members[key] = json.loads(data[pos:end])
+                pos = end
+            pos = _WS.match(data, pos).end()
+            if data[pos : pos + 1] == b"}":
+                pos += 1
+                break
+            pos = _expect(data, pos, b",")
+    if _WS.match(data, pos).end() != len(data):
+        raise ValueError(f"Extra data at offset {pos}")
+    return members, spans
+
+
+def index_file(path: "os.PathLike[str] | str", sections: Collection[str]) -> Tuple[Dict[str, Any], "LazySections"]:
+    """Run `index_document` over a memory map of `path`; return the members and lazy sections."""
+
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            members, spans = index_document(b"", sections)
+        else:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                members, spans = index_document(data, sections)
+    return members, LazySections(path, spans)
+
+
+class LazySections:
+    """Item spans of a JSON file on disk, decoded section by section on request."""
+
+    def __init__(self, path: "os.PathLike[str] | str", spans: Dict[str, List[Span]]) -> None:
+        self.path = os.fspath(path)
+        self.spans = spans
+        stat = os.stat(self.path)
+        self._signature = (stat.st_size, stat.st_mtime_ns)
+
+    def __contains__(self, section: str) -> bool:
+        return section in self.spans
+
+    def items(self, section: str, loads: Any = json.loads) -> List[Any]:
+        """Decode the items of `section`, reading only the bytes that hold them."""
+
+        spans = self.spans.get(section, [])
+        if not spans:
+            return []
+        stat = os.stat(self.path)
+        if (stat.st_size, stat.st_mtime_ns) != self._signature:
+            raise RuntimeError(f"{self.path} changed since it was indexed for lazy loading")
+        first = spans[0][0]
+        with open(self.path, "rb") as f:
+            f.seek(first)
+            block = f.read(spans[-1][1] - first)
+        return [loads(block[start - first : end - first]) for start, end in spans]
@@ -0,0 +1,33 @@
+# AUTO-GENERATED FROM THE PACKAGED R3XA SCHEMA.
+# DO NOT EDIT MANUALLY.
+
+from typing import Dict
+
+SCHEMA_SHA256 = "b315739367612a9bbc12a7923d08a3ba672aab9c64a14e9c7ec9cb701aa1dac4"
+
+SECTION_KINDS: Dict[str, Dict[str, str]] = {
+    "settings": {
+        "settings/generic": "#/$defs/settings/generic",
+        "settings/specimen": "#/$defs/settings/specimen",
+        "settings/testing_machine": "#/$defs/settings/testing_machine",
+        "settings/stereorig": "#/$defs/settings/stereorig",
+    },
+    "data_sources": {
+        "data_sources/generic": "#/$defs/data_sources/generic",
+        "data_sources/camera": "#/$defs/data_sources/camera",
+        "data_sources/infrared": "#/$defs/data_sources/infrared",
+        "data_sources/tomograph": "#/$defs/data_sources/tomograph",
+        "data_sources/load_cell": "#/$defs/data_sources/load_cell",
+        "data_sources/strain_gauge": "#/$defs/data_sources/strain_gauge",
+        "data_sources/point_temperature": "#/$defs/data_sources/point_temperature",
+        "data_sources/dic_measurement": "#/$defs/data_sources/dic_measurement",
+        "data_sources/mechanical_analysis": "#/$defs/data_sources/mechanical_analysis",
+        "data_sources/identification": "#/$defs/data_sources/identification",
+        "data_sources/strain_computation": "#/$defs/data_sources/strain_computation",
+    },
+    "data_sets": {
+        "data_sets/generic": "#/$defs/data_sets/generic",
+        "data_sets/file": "#/$defs/data_sets/file",
+        "data_sets/list": "#/$defs/data_sets/list",
+    },
+}
@@ -1,12 +1,15 @@
 from __future__ import annotations
 
+import json
 from pathlib import Path
 from typing import Any, Iterable
 
-from .core import _GUIDED_ALIAS_TARGETS, _guided_kind_specs
+from .core import _GUIDED_ALIAS_TARGETS, _guided_helper_source, _schema_guided_kind_specs
+from .schema import _packaged_schema_sha256
 
 
 _CORE_STUB_PATH = Path(__file__).with_name("core.pyi")
+_GUIDED_HELPERS_PATH = Path(__file__).with_name("_guided_helpers.py")
 
 
 def _indent(lines: Iterable[str], prefix: str = "    ") -> list[str]:
@@ -35,7 +38,7 @@ def _helper_sort_key(item: tuple[str, dict[str, Any]]) -> tuple[int, str]:
 
 
 def render_core_stub() -> str:
-    helper_specs = _guided_kind_specs()
+    helper_specs = _schema_guided_kind_specs()
     helper_by_name = {
         spec["helper_name"]: tuple(spec["required"]) for spec in helper_specs.values()
     }
@@ -78,13 +81,25 @@ def render_core_stub() -> str:
         "    def from_dict(cls, payload: Dict[str, Any]) -> R3XAFile: ...",
         "",
         "    @classmethod",
-        "    def load(cls, path: str | Path) -> R3XAFile: ...",
+        "    def load(",
+        "        cls,",
+        "        path: str | Path,",
+        "        format: Optional[str] = ...,",
+        "        *,",
+        "        mmap: bool = ...,",
+        "        lazy: bool = ...,",
+        "    ) -> R3XAFile: ...",
         "",
         "    @classmethod",
         "    def loads(cls, text: str) -> R3XAFile: ...",
         "",
         "    def set_header(self, **fields: Any) -> R3XAFile: ...",
         "",
+        "    def get(self, item_id: str, default: Any = ...) -> Any: ...",
+        "    def by_kind(self, kind: str) -> list[Dict[str, Any]]: ...",
+        "    def remove(self, item_id: str) -> Dict[str, Any]: ...",
+        "    def reindex(self) -> None: ...",
+        "",
         "    def add_item(self, kind: str, **fields: Any) -> Dict[str, Any]: ...",
         "    def add_setting(self, kind: str, **fields: Any) -> Dict[str, Any]: ...",
         "    def add_data_source(self, kind: str, **fields: Any) -> Dict[str, Any]: ...",
@@ -121,9 +136,16 @@ def render_core_stub() -> str:
     lines.extend(
         [
             "    def to_dict(self) -> Dict[str, Any]: ...",
-            "    def validate(self) -> None: ...",
+            "    def validate(self, check_references: bool = ...) -> None: ...",
             "    def dump(self, indent: int = ...) -> str: ...",
-            "    def save(self, path: str | Path, indent: int = ..., validate: bool = ...) -> Path: ...",
+            "    def save(",
+            "        self,",
+            "        path: str | Path,",
+            "        indent: int = ...,",
+            "        validate: bool = ...,",
+            "        format: str = ...,",
+            "        stream: bool = ...,",
+            "    ) -> Path: ...",
             "",
         ]
     )
@@ -134,3 +156,48 @@ def render_core_stub() -> str:
 def write_core_stub(path: Path = _CORE_STUB_PATH) -> Path:
     path.write_text(render_core_stub(), encoding="utf-8")
     return path
+
+
+def render_guided_helpers() -> str:
+    helper_specs = sorted(_schema_guided_kind_specs().items(), key=_helper_sort_key)
+
+    lines: list[str] = [
+        "# AUTO-GENERATED FROM THE PACKAGED R3XA SCHEMA.",
+        "# DO NOT EDIT MANUALLY.",
+        "",
+        "from __future__ import annotations",
+        "",
+        "from typing import Any, Dict",
+        "",
+        f"SCHEMA_SHA256 = {json.dumps(_packaged_schema_sha256())}",
+        "",
+        "KIND_SPECS: Dict[str, Dict[str, Any]] = {",
+    ]
+    for kind, spec in helper_specs:
+        lines.extend(
+            [
+                f"    {json.dumps(kind)}: {{",
+                f"        \"required\": {_render_tuple(spec['required'])},",
+                f"        \"array_fields\": {_render_tuple(spec['array_fields'])},",
+                f"        \"helper_name\": {json.dumps(spec['helper_name'])},",
+                "    },",
+            ]
+        )
+    lines.extend(["}", ""])
+
+    for kind, spec in helper_specs:
+        lines.extend(["", _guided_helper_source(spec["helper_name"], kind, spec["required"])])
+
+    return "\n".join(lines)
+
+
+def _render_tuple(values: Iterable[str]) -> str:
+    items = [json.dumps(value) for value in values]
+    if len(items) == 1:
+        return f"({items[0]},)"
+    return f"({', '.join(items)})"
+
+
+def write_guided_helpers(path: Path = _GUIDED_HELPERS_PATH) -> Path:
+    path.write_text(render_guided_helpers(), encoding="utf-8")
+    return path
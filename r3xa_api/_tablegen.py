@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from .schema import _packaged_schema_sha256, load_schema
+from .validate import _kind_dispatch_table
+
+
+_KIND_TABLE_PATH = Path(__file__).with_name("_kind_table.py")
+
+
+def render_kind_table() -> str:
+    table = _kind_dispatch_table(load_schema(copy=False))
+
+    lines: list[str] = [
+        "# AUTO-GENERATED FROM THE PACKAGED R3XA SCHEMA.",
+        "# DO NOT EDIT MANUALLY.",
+        "",
+        "from typing import Dict",
+        "",
+        f"SCHEMA_SHA256 = {json.dumps(_packaged_schema_sha256())}",
+        "",
+        "SECTION_KINDS: Dict[str, Dict[str, str]] = {",
+    ]
+    for section, kinds in table.items():
+        lines.append(f"    {json.dumps(section)}: {{")
+        for kind, ref in kinds.items():
+            lines.append(f"        {json.dumps(kind)}: {json.dumps(ref)},")
+        lines.append("    },")
+    lines.extend(["}", ""])
+
+    return "\n".join(lines)
+
+
+def write_kind_table(path: Path = _KIND_TABLE_PATH) -> Path:
+    path.write_text(render_kind_table(), encoding="utf-8")
+    return path
@@ -0,0 +1,211 @@
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+import sys
+import zipfile
+from array import array
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Union, overload
+
+from . import jsonio
+from ._arrays import materialize
+
+
+CONTAINER_FORMAT = "r3xa-container"
+CONTAINER_VERSION = 1
+
+_MANIFEST_NAME = "manifest.json"
+_DOCUMENT_NAME = "document.json"
+_PACKED_KEY = "$packed"
+# Shorter float lists stay inline in the JSON header.
+_PACK_MIN_LENGTH = 64
+_ZIP_MAGIC = b"PK\x03\x04"
+_LOCAL_HEADER = struct.Struct("<4s22xHH")
+
+
+class PackedFloatArray(Sequence[float]):
+    """Read-only float64 sequence backed by a memory-mapped container member."""
+
+    __slots__ = ("_view", "_owner")
+
+    def __init__(self, view: memoryview, owner: Any = None) -> None:
+        self._view = view
+        # Keeps the underlying mmap open for as long as the view is reachable.
+        self._owner = owner
+
+    def __len__(self) -> int:
+        return len(self._view)
+
+    @overload
+    def __getitem__(self, index: int) -> float: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "PackedFloatArray": ...
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            return PackedFloatArray(self._view[index], self._owner)
+        return self._view[index]
+
+    def __iter__(self) -> Iterator[float]:
+        return iter(self._view)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, PackedFloatArray):
+            return self._view == other._view
+        if isinstance(other, (list, tuple)):
+            return self.tolist() == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"PackedFloatArray(len={len(self)})"
+
+    def tolist(self) -> List[float]:
+        """Return the values as a list of Python floats."""
+
+        return self._view.tolist()
+
+    def tobytes(self) -> bytes:
+        """Return the raw little-endian float64 bytes."""
+
+        return self._view.tobytes()
+
+    def __array__(self, dtype: Any = None, copy: Any = None) -> Any:
+        import numpy
+
+        values = numpy.frombuffer(self._view, dtype="<f8")
+        return values if dtype is None else values.astype(dtype)
+
+
+def _float_bytes(values: Any) -> bytes:
+    if isinstance(values, PackedFloatArray):
+        return values.tobytes()
+    packed = array("d", values)
+    if sys.byteorder == "big":
+        packed.byteswap()
+    return packed.tobytes()
+
+
+def _is_packable(value: Any) -> bool:
+    if isinstance(value, PackedFloatArray):
+        return True
+    return type(value) is list and len(value) >= _PACK_MIN_LENGTH and set(map(type, value)) == {float}
+
+
+def _materialize_packed(payload: Any) -> Any:
+    # Array-likes become lists, except packed views which are re-packed byte for byte.
+
+    if isinstance(payload, PackedFloatArray):
+        return payload
+    if isinstance(payload, dict):
+        return {key: _materialize_packed(item) for key, item in payload.items()}
+    if isinstance(payload, list) and payload and isinstance(payload[0], (dict, list)):
+        return [_materialize_packed(item) for item in payload]
+    return materialize(payload)
+
+
+def is_container(path: Union[str, "os.PathLike[str]"]) -> bool:
+    """Return True when `path` starts with the zip signature used by containers."""
+
+    with open(path, "rb") as f:
+        return f.read(len(_ZIP_MAGIC)) == _ZIP_MAGIC
+
+
+def save_container(payload: Dict[str, Any], path: Union[str, "os.PathLike[str]"]) -> Path:
+    """Write a document as a zip container: JSON header plus packed float64 arrays.
+
+    Lists of at least 64 floats are stored uncompressed as little-endian float64
+    members (`arrays/NNNNNN.f64`) and replaced in the header by
+    `{"$packed": member}`; everything else stays JSON. Ints, bools and mixed lists
+    are never packed, so the round trip reproduces the JSON document exactly.
+    """
+
+    members: List[bytes] = []
+
+    def pack(value: Any) -> Any:
+        if isinstance(value, dict):
+            if _PACKED_KEY in value:
+                raise ValueError(f"{_PACKED_KEY!r} is a reserved key in R3XA containers")
+            return {key: pack(item) for key, item in value.items()}
+        if _is_packable(value):
+            members.append(_float_bytes(value))
+            return {_PACKED_KEY: f"arrays/{len(members) - 1:06d}.f64"}
+        if isinstance(value, list) and value and isinstance(value[0], (dict, list)):
+            return [pack(item) for item in value]
+        return value
+
+    header = pack(_materialize_packed(payload))
+    path = Path(path)
+    # Build the archive next to `path` and rename it over the target: truncating in
+    # place would corrupt `PackedFloatArray`s still mapped from the old file.
+    fd, tmp_path = jsonio._create_temporary(path)
+    try:
+        with open(fd, "wb") as f, zipfile.ZipFile(f, "w") as archive:
+            manifest = {"format": CONTAINER_FORMAT, "version": CONTAINER_VERSION, "document": _DOCUMENT_NAME}
+            archive.writestr(_MANIFEST_NAME, jsonio.dumps_bytes(manifest), compress_type=zipfile.ZIP_DEFLATED)
+            archive.writestr(_DOCUMENT_NAME, jsonio.dumps_bytes(header), compress_type=zipfile.ZIP_DEFLATED)
+            for index, data in enumerate(members):
+                archive.writestr(f"arrays/{index:06d}.f64", data, compress_type=zipfile.ZIP_STORED)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    return path
+
+
+def _member_view(path: Path, info: zipfile.ZipInfo, mapped: mmap.mmap) -> memoryview:
+    """Return a float64 view of an uncompressed member inside the mapped archive."""
+
+    signature, name_length, extra_length = _LOCAL_HEADER.unpack_from(mapped, info.header_offset)
+    if signature != _ZIP_MAGIC:
+        raise ValueError(f"Corrupt container member {info.filename} in {path}")
+    start = info.header_offset + _LOCAL_HEADER.size + name_length + extra_length
+    return memoryview(mapped)[start : start + info.file_size].cast("d")
+
+
+def load_container(path: Union[str, "os.PathLike[str]"], *, mmap_arrays: bool = False) -> Dict[str, Any]:
+    """Read a container written by `save_container(...)`.
+
+    Packed arrays come back as lists of floats, or as `PackedFloatArray` views over a
+    memory map of the file with `mmap_arrays=True` (numeric values are then read on
+    access and never copied into Python lists).
+    """
+
+    path = Path(path)
+    with zipfile.ZipFile(path) as archive:
+        manifest = jsonio.loads(archive.read(_MANIFEST_NAME))
+        if manifest.get("format") != CONTAINER_FORMAT or manifest.get("version") != CONTAINER_VERSION:
+            raise ValueError(f"Unsupported container format in {path}: {manifest}")
+        header = jsonio.loads(archive.read(manifest.get("document", _DOCUMENT_NAME)))
+        infos = {info.filename: info for info in archive.infolist()}
+
+        mapped: Optional[mmap.mmap] = None
+        if mmap_arrays and sys.byteorder == "little":
+            with open(path, "rb") as f:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        def array_value(member: str) -> Any:
+            info = infos[member]
+            if mapped is not None and info.compress_type == zipfile.ZIP_STORED:
+                return PackedFloatArray(_member_view(path, info, mapped), mapped)
+            values = array("d")
+            values.frombytes(archive.read(info))
+            if sys.byteorder == "big":
+                values.byteswap()
+            return values.tolist()
+
+        def unpack(value: Any) -> Any:
+            if isinstance(value, dict):
+                if len(value) == 1 and _PACKED_KEY in value:
+                    return array_value(value[_PACKED_KEY])
+                return {key: unpack(item) for key, item in value.items()}
+            if isinstance(value, list) and value and isinstance(value[0], (dict, list)):
+                return [unpack(item) for item in value]
+            return value
+
+        payload = unpack(header)
+    if not isinstance(payload, dict):
+        raise TypeError("R3XA document root must be a JSON object")
+    return payload
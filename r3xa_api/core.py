@@ -1,16 +1,21 @@
 from __future__ import annotations
 
-import json
 import inspect
+import math
 import random
 import string
+import threading
 from functools import lru_cache
 from pathlib import Path
-from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Union
+from types import ModuleType
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple, Union
 
-from .schema import load_schema, schema_version
+from . import _guided_helpers, _jsonstream, container, jsonio
+from ._arrays import check_timestamps, is_array_like, json_default, materialize
+from .references import ITEM_SECTIONS, iter_reference_errors
+from .schema import _packaged_schema_sha256, load_schema, schema_version
 from .typed import from_model
-from .validate import validate
+from .validate import _ItemErrorCache, _raise_for_errors
 
 
 def _random_id(n: int = 24) -> str:
@@ -91,10 +96,32 @@ _GUIDED_ALIAS_TARGETS = {
 
 
 @lru_cache(maxsize=1)
+def _precompiled_guided_helpers() -> Optional[ModuleType]:
+    """Return the generated helper module when it matches the packaged schema."""
+
+    if _guided_helpers.SCHEMA_SHA256 == _packaged_schema_sha256():
+        return _guided_helpers
+    return None
+
+
 def _guided_kind_specs() -> Dict[str, Dict[str, Any]]:
+    """Return helper metadata for every supported kind.
+
+    Uses the specs generated into `_guided_helpers.py` when the packaged schema is
+    unchanged, and derives them from the schema otherwise.
+    """
+
+    precompiled = _precompiled_guided_helpers()
+    if precompiled is not None:
+        return precompiled.KIND_SPECS
+    return _schema_guided_kind_specs()
+
+
+@lru_cache(maxsize=1)
+def _schema_guided_kind_specs() -> Dict[str, Dict[str, Any]]:
     """Return schema-derived helper metadata for every supported kind."""
 
-    schema = load_schema()
+    schema = load_schema(copy=False)
     specs: Dict[str, Dict[str, Any]] = {}
     for section, suffix in _GUIDED_SECTION_SUFFIX.items():
         section_defs = schema.get("$defs", {}).get(section, {})
@@ -128,8 +155,18 @@ def _guided_item_spec(kind: str) -> Dict[str, Any]:
         raise ValueError(f"Unsupported guided helper kind: {kind}") from exc
 
 
-def _make_guided_helper(method_name: str, kind: str, required_fields: Sequence[str]) -> Callable[..., Dict[str, Any]]:
-    """Create a guided helper with explicit required parameters for one kind."""
+def _guided_helper_doc(kind: str, required_fields: Sequence[str]) -> str:
+    """Return the docstring shared by runtime and generated guided helpers."""
+
+    return (
+        f"Add a `{kind}` item.\n\n"
+        f"Required fields: {', '.join(required_fields) if required_fields else '(none)'}.\n"
+        "Optional schema fields can be passed through `**extra`."
+    )
+
+
+def _guided_helper_source(method_name: str, kind: str, required_fields: Sequence[str]) -> str:
+    """Return the Python source of one guided helper function."""
 
     params = ["self"] + [f"{field}: Any" for field in required_fields] + ["**extra: Any"]
     header = ", ".join(params)
@@ -138,23 +175,26 @@ def _make_guided_helper(method_name: str, kind: str, required_fields: Sequence[s
     ) or "    fields = {}"
     if required_fields:
         field_lines = "    fields: Dict[str, Any] = {}\n" + field_lines
+    doc_lines = _guided_helper_doc(kind, required_fields).split("\n")
+    doc = "\n".join(doc_lines[:1] + [f"    {line}" if line else "" for line in doc_lines[1:]])
 
-    source = (
+    return (
         f"def {method_name}({header}) -> Dict[str, Any]:\n"
-        f"    \"\"\"Add a `{kind}` item.\"\"\"\n"
+        f"    \"\"\"{doc}\n    \"\"\"\n"
         f"{field_lines}\n"
         "    fields.update(extra)\n"
         f"    return self._add_guided_item({kind!r}, fields)\n"
     )
+
+
+def _make_guided_helper(method_name: str, kind: str, required_fields: Sequence[str]) -> Callable[..., Dict[str, Any]]:
+    """Create a guided helper with explicit required parameters for one kind."""
+
     namespace: Dict[str, Any] = {"Any": Any, "Dict": Dict}
-    exec(source, namespace)
+    exec(_guided_helper_source(method_name, kind, required_fields), namespace)
     helper = namespace[method_name]
     helper.__qualname__ = f"R3XAFile.{method_name}"
-    helper.__doc__ = (
-        f"Add a `{kind}` item.\n\n"
-        f"Required fields: {', '.join(required_fields) if required_fields else '(none)'}.\n"
-        "Optional schema fields can be passed through `**extra`."
-    )
+    helper.__doc__ = _guided_helper_doc(kind, required_fields)
     return helper
 
 
@@ -172,35 +212,277 @@ def _make_guided_alias(alias_name: str, target_name: str) -> Callable[..., Dict[
 
 
 class _ModelAwareList(list):
-    """List that accepts dicts and typed models exposing `model_dump`."""
+    """List that accepts dicts and typed models exposing `model_dump`.
+
+    Keeps a lazily built `id -> items` and `kind -> items` index, plus the item
+    positions, which every mutation keeps consistent in O(1): items placed before
+    the end (by `insert`, assignment, `sort` or `reverse`) mark their kind for
+    re-sorting, and inserts and removals before the end are logged as shifts that
+    position lookups apply to the recorded positions. The positions are recomputed
+    in one pass once about `sqrt(len)` shifts piled up, or after `sort`/`reverse`;
+    slice assignments drop the whole index. Changing the `id` or `kind` of an item
+    already in the list is not tracked; call `reindex()` afterwards.
+    """
+
+    _ids: Optional[Dict[str, List[Dict[str, Any]]]] = None
+    # kind -> {id(item): item}, in list order unless the kind is in `_unordered`.
+    _kinds: Optional[Dict[str, Dict[int, Dict[str, Any]]]] = None
+    _unordered: Optional[Set[str]] = None
+    # id(item) -> (position, number of `_shifts` already reflected in it).
+    _positions: Optional[Dict[int, Tuple[int, int]]] = None
+    # (position, +1 for an insert or -1 for a removal), in mutation order.
+    _shifts: Optional[List[Tuple[int, int]]] = None
 
     def __init__(self, values: Iterable[Any] = ()) -> None:
         super().__init__()
         self.extend(values)
 
+    def __reduce_ex__(self, protocol: Any) -> Any:
+        # The index is keyed by `id()`; copies and pickles rebuild it.
+        return type(self), (list(self),)
+
     @staticmethod
     def _normalize(value: Any) -> Dict[str, Any]:
         return from_model(value)
 
+    def _invalidate(self) -> None:
+        self._ids = None
+        self._kinds = None
+        self._unordered = None
+        self._positions = None
+
+    def _moved(self) -> None:
+        self._positions = None
+        if self._kinds is not None:
+            self._unordered.update(self._kinds)
+
+    def _shift(self, position: int, delta: int) -> None:
+        if self._positions is None:
+            return
+        self._shifts.append((position, delta))
+        if len(self._shifts) > 16 + math.isqrt(len(self)):
+            self._positions = None
+
+    def _index_item(self, item: Any, position: Optional[int], at_end: bool = True) -> None:
+        if not isinstance(item, dict):
+            return
+        item_id = item.get("id")
+        if isinstance(item_id, str):
+            self._ids.setdefault(item_id, []).append(item)
+        kind = item.get("kind")
+        if isinstance(kind, str):
+            self._kinds.setdefault(kind, {})[id(item)] = item
+            if not at_end:
+                self._unordered.add(kind)
+        if self._positions is not None and position is not None:
+            self._positions.setdefault(id(item), (position, len(self._shifts)))
+
+    def _unindex_item(self, item: Any) -> None:
+        if not isinstance(item, dict):
+            return
+        item_id = item.get("id")
+        items = self._ids.get(item_id) if isinstance(item_id, str) else None
+        if items is not None:
+            self._ids[item_id] = [entry for entry in items if entry is not item]
+            if not self._ids[item_id]:
+                del self._ids[item_id]
+        kind = item.get("kind")
+        indexed = self._kinds.get(kind) if isinstance(kind, str) else None
+        if indexed is not None and indexed.pop(id(item), None) is not None and not indexed:
+            del self._kinds[kind]
+        if self._positions is not None:
+            self._positions.pop(id(item), None)
+
+    def _build_index(self) -> None:
+        self._ids = {}
+        self._kinds = {}
+        self._unordered = set()
+        self._positions = {}
+        self._shifts = []
+        for position, item in enumerate(self):
+            self._index_item(item, position)
+
+    def _position_of(self, item: Dict[str, Any]) -> Optional[int]:
+        if self._positions is None:
+            self._positions = {}
+            self._shifts = []
+            for position, entry in enumerate(self):
+                self._positions.setdefault(id(entry), (position, 0))
+        recorded = self._positions.get(id(item))
+        if recorded is None:
+            return None
+        position, applied = recorded
+        for at, delta in self._shifts[applied:]:
+            if position > at or (delta > 0 and position == at):
+                position += delta
+        return position
+
+    def reindex(self) -> None:
+        """Rebuild the index after changing the `id` or `kind` of items in place."""
+
+        self._build_index()
+
+    def find(self, item_id: str) -> Optional[Dict[str, Any]]:
+        """Return the first item with `item_id`, or None."""
+
+        if self._ids is None:
+            self._build_index()
+        items = self._ids.get(item_id)
+        if not items:
+            return None
+        if len(items) == 1:
+            return items[0] if items[0].get("id") == item_id else None
+        first: Optional[Dict[str, Any]] = None
+        first_position = len(self)
+        for item in items:
+            position = self._position_of(item) if item.get("id") == item_id else None
+            if position is not None and position < first_position:
+                first, first_position = item, position
+        return first
+
+    def position(self, item_id: str) -> Optional[int]:
+        """Return the position of the first item with `item_id`, or None."""
+
+        item = self.find(item_id)
+        return None if item is None else self._position_of(item)
+
+    def of_kind(self, kind: str) -> List[Dict[str, Any]]:
+        """Return the items whose `kind` is `kind`, in list order."""
+
+        if self._kinds is None:
+            self._build_index()
+        indexed = self._kinds.get(kind)
+        if indexed is None:
+            return []
+        if kind in self._unordered:
+            positions = {key: self._position_of(item) for key, item in indexed.items()}
+            order = sorted(indexed, key=lambda key: len(self) if positions[key] is None else positions[key])
+            self._kinds[kind] = indexed = {key: indexed[key] for key in order}
+            self._unordered.discard(kind)
+        return [item for item in indexed.values() if item.get("kind") == kind]
+
     def append(self, value: Any) -> None:
-        super().append(self._normalize(value))
+        item = self._normalize(value)
+        super().append(item)
+        if self._ids is not None:
+            self._index_item(item, len(self) - 1)
 
     def extend(self, values: Iterable[Any]) -> None:
+        start = len(self)
         super().extend(self._normalize(value) for value in values)
+        if self._ids is not None:
+            for position in range(start, len(self)):
+                self._index_item(self[position], position)
 
     def insert(self, index: int, value: Any) -> None:
-        super().insert(index, self._normalize(value))
+        item = self._normalize(value)
+        size = len(self)
+        super().insert(index, item)
+        if self._ids is not None:
+            position = min(max(index + size if index < 0 else index, 0), size)
+            if position < size:
+                self._shift(position, 1)
+            self._index_item(item, position, at_end=position == size)
 
     def __setitem__(self, index: Any, value: Any) -> None:
         if isinstance(index, slice):
             super().__setitem__(index, [self._normalize(item) for item in value])
+            self._invalidate()
+            return
+        item = self._normalize(value)
+        previous = self[index]
+        super().__setitem__(index, item)
+        if self._ids is not None:
+            position = index if index >= 0 else index + len(self)
+            self._unindex_item(previous)
+            self._index_item(item, position, at_end=position == len(self) - 1)
+
+    def __delitem__(self, index: Any) -> None:
+        if isinstance(index, slice):
+            super().__delitem__(index)
+            self._invalidate()
             return
-        super().__setitem__(index, self._normalize(value))
+        self.pop(index)
 
+    def __iadd__(self, values: Iterable[Any]) -> "_ModelAwareList":
+        self.extend(values)
+        return self
+
+    def __imul__(self, count: int) -> "_ModelAwareList":
+        super().__imul__(count)
+        self._invalidate()
+        return self
+
+    def pop(self, index: int = -1) -> Dict[str, Any]:
+        item = super().pop(index)
+        if self._ids is not None:
+            self._unindex_item(item)
+            position = index + len(self) + 1 if index < 0 else index
+            if position < len(self):
+                self._shift(position, -1)
+        return item
+
+    def remove(self, value: Any) -> None:
+        self.pop(self.index(value))
+
+    def clear(self) -> None:
+        super().clear()
+        self._invalidate()
+
+    def sort(self, *args: Any, **kwargs: Any) -> None:
+        super().sort(*args, **kwargs)
+        self._moved()
+
+    def reverse(self) -> None:
+        super().reverse()
+        self._moved()
+
+
+class _LazySection:
+    """Non-data descriptor that decodes one section of a lazily loaded file on first access.
+
+    Builders store their sections as instance attributes, which take precedence,
+    so the descriptor only runs for sections `R3XAFile.load(..., lazy=True)` left
+    unread; the decoded list then replaces it in the instance dict.
+    """
+
+    _lock = threading.Lock()
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    def __get__(self, instance: Any, owner: Optional[type] = None) -> Any:
+        if instance is None:
+            return self
+        with self._lock:
+            if self.name not in instance.__dict__:
+                source = instance.__dict__.get("_lazy_sections")
+                if source is None or self.name not in source:
+                    raise AttributeError(self.name)
+                instance.__dict__[self.name] = _ModelAwareList(source.items(self.name, jsonio.loads))
+        return instance.__dict__[self.name]
+
+
+class _GuidedHelperMeta(type):
+    """Metaclass installing the schema-driven guided helpers on first lookup."""
+
+    def __getattr__(cls, name: str) -> Any:
+        if name.startswith("add_") and _install_guided_helpers():
+            return getattr(cls, name)
+        raise AttributeError(f"type object {cls.__name__!r} has no attribute {name!r}")
 
-class R3XAFile:
+    def __dir__(cls) -> List[str]:
+        _install_guided_helpers()
+        return super().__dir__()
+
+
+class R3XAFile(metaclass=_GuidedHelperMeta):
     """Mutable builder for an R3XA JSON document."""
 
+    settings = _LazySection()
+    data_sources = _LazySection()
+    data_sets = _LazySection()
+
     def __init__(self, version: Optional[str] = None, **header: Any):
         """Initialize an R3XA document with optional header overrides."""
 
@@ -209,6 +491,7 @@ class R3XAFile:
         self.settings: List[Dict[str, Any]] = _ModelAwareList()
         self.data_sources: List[Dict[str, Any]] = _ModelAwareList()
         self.data_sets: List[Dict[str, Any]] = _ModelAwareList()
+        self._validation_cache = _ItemErrorCache()
 
     @classmethod
     def from_dict(cls, payload: Dict[str, Any]) -> "R3XAFile":
@@ -223,20 +506,60 @@ class R3XAFile:
         return obj
 
     @classmethod
-    def load(cls, path: str | Path) -> "R3XAFile":
-        """Load an R3XA JSON file from disk."""
+    def load(
+        cls,
+        path: str | Path,
+        format: Optional[str] = None,
+        *,
+        mmap: bool = False,
+        lazy: bool = False,
+    ) -> "R3XAFile":
+        """Load an R3XA document from disk.
+
+        `format` is `"json"` or `"container"`; by default it is detected from the
+        file signature. `mmap=True` keeps container arrays memory-mapped (see
+        `r3xa_api.container.load_container`). `lazy=True` (JSON only) decodes the
+        header and records the byte offsets of every item; each of `settings`,
+        `data_sources` and `data_sets` is then read from the file and decoded on
+        its first access.
+        """
 
-        return cls.loads(Path(path).read_text(encoding="utf-8"))
+        path = Path(path)
+        if format is None:
+            format = "container" if container.is_container(path) else "json"
+        if format not in ("json", "container"):
+            raise ValueError(f"Unknown R3XA file format: {format!r} (expected 'json' or 'container')")
+        if lazy:
+            if format != "json":
+                raise ValueError("lazy=True is only supported for format='json'")
+            return cls._load_lazy(path)
+        if format == "container":
+            return cls.from_dict(container.load_container(path, mmap_arrays=mmap))
+        return cls.loads(path.read_bytes())
 
     @classmethod
-    def loads(cls, text: str) -> "R3XAFile":
-        """Load an R3XA document from a JSON string."""
+    def _load_lazy(cls, path: Path) -> "R3XAFile":
+        members, lazy_sections = _jsonstream.index_file(path, ITEM_SECTIONS)
+        obj = cls.from_dict(members)
+        for section in lazy_sections.spans:
+            del obj.__dict__[section]
+        obj._lazy_sections = lazy_sections
+        return obj
 
-        payload = json.loads(text)
+    @classmethod
+    def loads(cls, text: str | bytes) -> "R3XAFile":
+        """Load an R3XA document from a JSON string or UTF-8 bytes."""
+
+        payload = jsonio.loads(text)
         if not isinstance(payload, dict):
             raise TypeError("R3XA document root must be a JSON object")
         return cls.from_dict(payload)
 
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("add_") and _install_guided_helpers():
+            return getattr(self, name)
+        raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+
     def set_header(self, **fields: Any) -> "R3XAFile":
         """Update top-level header fields in place."""
 
@@ -255,6 +578,51 @@ class R3XAFile:
             return self.data_sets
         raise ValueError("kind must start with settings/, data_sources/, or data_sets/")
 
+    def _sections(self) -> List[List[Dict[str, Any]]]:
+        return [self.settings, self.data_sources, self.data_sets]
+
+    def get(self, item_id: str, default: Any = None) -> Any:
+        """Return the item with `item_id` from any section, or `default`."""
+
+        for collection in self._sections():
+            if isinstance(collection, _ModelAwareList):
+                item = collection.find(item_id)
+            else:
+                item = next((entry for entry in collection if entry.get("id") == item_id), None)
+            if item is not None:
+                return item
+        return default
+
+    def by_kind(self, kind: str) -> List[Dict[str, Any]]:
+        """Return the items of one `section/name` kind, in document order."""
+
+        try:
+            collection = self._target_collection(kind)
+        except ValueError:
+            return []
+        if isinstance(collection, _ModelAwareList):
+            return collection.of_kind(kind)
+        return [item for item in collection if item.get("kind") == kind]
+
+    def remove(self, item_id: str) -> Dict[str, Any]:
+        """Remove the item with `item_id` from its section and return it."""
+
+        for collection in self._sections():
+            if isinstance(collection, _ModelAwareList):
+                position = collection.position(item_id)
+            else:
+                position = next((i for i, entry in enumerate(collection) if entry.get("id") == item_id), None)
+            if position is not None:
+                return collection.pop(position)
+        raise KeyError(item_id)
+
+    def reindex(self) -> None:
+        """Rebuild the id/kind index after changing item `id`s or `kind`s in place."""
+
+        for collection in self._sections():
+            if isinstance(collection, _ModelAwareList):
+                collection.reindex()
+
     def add_item(self, kind: str, **fields: Any) -> Dict[str, Any]:
         """Append an item to the correct collection from its kind prefix."""
 
@@ -292,7 +660,8 @@ class R3XAFile:
             if field_name not in normalized or isinstance(normalized[field_name], list):
                 continue
             value = normalized[field_name]
-            if isinstance(value, (str, bytes, dict)):
+            if isinstance(value, (str, bytes, dict)) or is_array_like(value):
+                # Array objects are kept as-is and converted by to_dict().
                 continue
             normalized[field_name] = list(value)
 
@@ -304,6 +673,7 @@ class R3XAFile:
             time_reference = normalized["time_reference"]
             if not isinstance(time_reference, dict) or time_reference.get("kind") != "unit":
                 raise ValueError("time_reference for data_sets/list must be a unit payload")
+            check_timestamps(normalized["timestamps"])
 
         return normalized
 
@@ -318,47 +688,105 @@ class R3XAFile:
         return self.add_item(kind, **self._normalize_guided_fields(kind, fields))
 
     def to_dict(self) -> Dict[str, Any]:
-        """Return the complete JSON payload for this builder."""
+        """Return the complete JSON payload for this builder.
 
+        Array-like values (memory-mapped container arrays, numpy arrays) are
+        returned as lists; everything else is the live builder state.
+        """
+
+        return materialize(self._payload())
+
+    def _payload(self) -> Dict[str, Any]:
         payload = dict(self.header)
         payload["settings"] = self.settings
         payload["data_sources"] = self.data_sources
         payload["data_sets"] = self.data_sets
         return payload
 
-    def validate(self) -> None:
-        """Validate current payload against the active schema."""
+    def validate(self, check_references: bool = False) -> None:
+        """Validate current payload against the active schema.
+
+        Item results are cached by content hash, so repeated calls only revalidate
+        items added or changed since the previous call, plus the header.
+        `check_references=True` also reports duplicate ids, dangling references and
+        reference cycles.
+        """
 
-        validate(self.to_dict())
+        payload = self.to_dict()
+        errors = self._validation_cache.errors(payload)
+        if check_references:
+            errors.extend(iter_reference_errors(payload))
+        _raise_for_errors(errors)
 
     def dump(self, indent: int = 4) -> str:
         """Serialize payload as a JSON string."""
 
-        return json.dumps(self.to_dict(), indent=indent)
-
-    def save(self, path: str | Path, indent: int = 4, validate: bool = True) -> Path:
-        """Validate optionally, then serialize payload as JSON to disk."""
-
+        return jsonio.dumps(self.to_dict(), indent=indent)
+
+    def save(
+        self,
+        path: str | Path,
+        indent: int = 4,
+        validate: bool = True,
+        format: str = "json",
+        stream: bool = False,
+    ) -> Path:
+        """Validate optionally, then serialize payload to disk.
+
+        `format="container"` writes the zip container of `r3xa_api.container`
+        (`indent` is then ignored); the default writes JSON. `stream=True` encodes
+        the JSON item by item into a temporary file renamed over `path`, expanding
+        array values one at a time instead of building the whole text in memory.
+        """
+
+        if format not in ("json", "container"):
+            raise ValueError(f"Unknown R3XA file format: {format!r} (expected 'json' or 'container')")
+        if stream and format != "json":
+            raise ValueError("stream=True is only supported for format='json'")
         if validate:
             self.validate()
 
         path = Path(path)
-        path.write_text(self.dump(indent=indent) + "\n", encoding="utf-8")
+        if format == "container":
+            return container.save_container(self._payload(), path)
+        if stream:
+            jsonio.dump_path(path, self._payload(), indent=indent, default=json_default, stream=True)
+        else:
+            jsonio.dump_path(path, self.to_dict(), indent=indent)
         return path
 
 
-def _install_guided_helpers() -> None:
-    """Attach schema-driven guided helper methods to `R3XAFile`."""
-
-    for kind, spec in _guided_kind_specs().items():
-        setattr(
-            R3XAFile,
-            spec["helper_name"],
-            _make_guided_helper(spec["helper_name"], kind, spec["required"]),
-        )
-
-    for alias_name, target_name in _GUIDED_ALIAS_TARGETS.items():
-        setattr(R3XAFile, alias_name, _make_guided_alias(alias_name, target_name))
-
-
-_install_guided_helpers()
+_guided_helpers_installed = False
+_guided_helpers_lock = threading.RLock()
+
+
+def _install_guided_helpers() -> bool:
+    """Attach schema-driven guided helper methods to `R3XAFile`.
+
+    Runs on the first lookup of an `add_*` attribute rather than at import time, so
+    importing the package does not parse the schema or compile helpers. Helpers come
+    from the generated `_guided_helpers.py` module and are only built with `exec`
+    when the packaged schema no longer matches it. Returns True when this call
+    installed them.
+    """
+
+    global _guided_helpers_installed
+    if _guided_helpers_installed:
+        return False
+    with _guided_helpers_lock:
+        if _guided_helpers_installed:
+            return False
+        precompiled = _precompiled_guided_helpers()
+        for kind, spec in _guided_kind_specs().items():
+            if precompiled is not None:
+                helper = getattr(precompiled, spec["helper_name"])
+                helper.__qualname__ = f"R3XAFile.{spec['helper_name']}"
+                helper.__doc__ = _guided_helper_doc(kind, spec["required"])
+            else:
+                helper = _make_guided_helper(spec["helper_name"], kind, spec["required"])
+            setattr(R3XAFile, spec["helper_name"], helper)
+
+        for alias_name, target_name in _GUIDED_ALIAS_TARGETS.items():
+            setattr(R3XAFile, alias_name, _make_guided_alias(alias_name, target_name))
+        _guided_helpers_installed = True
+    return True
@@ -35,13 +35,25 @@ class R3XAFile:
     def from_dict(cls, payload: Dict[str, Any]) -> R3XAFile: ...
 
     @classmethod
-    def load(cls, path: str | Path) -> R3XAFile: ...
+    def load(
+        cls,
+        path: str | Path,
+        format: Optional[str] = ...,
+        *,
+        mmap: bool = ...,
+        lazy: bool = ...,
+    ) -> R3XAFile: ...
 
     @classmethod
     def loads(cls, text: str) -> R3XAFile: ...
 
     def set_header(self, **fields: Any) -> R3XAFile: ...
 
+    def get(self, item_id: str, default: Any = ...) -> Any: ...
+    def by_kind(self, kind: str) -> list[Dict[str, Any]]: ...
+    def remove(self, item_id: str) -> Dict[str, Any]: ...
+    def reindex(self) -> None: ...
+
     def add_item(self, kind: str, **fields: Any) -> Dict[str, Any]: ...
     def add_setting(self, kind: str, **fields: Any) -> Dict[str, Any]: ...
     def add_data_source(self, kind: str, **fields: Any) -> Dict[str, Any]: ...
@@ -244,6 +256,13 @@ class R3XAFile:
     ) -> Dict[str, Any]: ...
 
     def to_dict(self) -> Dict[str, Any]: ...
-    def validate(self) -> None: ...
+    def validate(self, check_references: bool = ...) -> None: ...
     def dump(self, indent: int = ...) -> str: ...
-    def save(self, path: str | Path, indent: int = ..., validate: bool = ...) -> Path: ...
+    def save(
+        self,
+        path: str | Path,
+        indent: int = ...,
+        validate: bool = ...,
+        format: str = ...,
+        stream: bool = ...,
+    ) -> Path: ...
@@ -0,0 +1,309 @@
+from __future__ import annotations
+
+import importlib
+import json
+import os
+import secrets
+import stat
+import threading
+from contextlib import contextmanager
+from typing import IO, Any, Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple, Union
+
+
+BACKEND_ENV_VAR = "R3XA_JSON_BACKEND"
+_AUTO_ORDER = ("orjson", "msgspec", "ujson")
+
+
+class _Backend(NamedTuple):
+    name: str
+    loads: Callable[[Union[str, bytes]], Any]
+    # None writes with the standard library (byte-identical output).
+    dumps: Optional[Callable[[Any, Optional[int], Optional[Callable[[Any], Any]]], bytes]]
+
+
+def _reindent(data: bytes, indent: int) -> bytes:
+    """Rewrite two-space pretty output to `indent` spaces per level.
+
+    Each leading two-space unit is swapped for a control byte one nesting level per
+    pass (encoders escape control characters inside strings, so the byte cannot
+    occur elsewhere), then the marker is expanded. Every pass is a C-level replace.
+    """
+
+    if indent == 2:
+        return data
+    data = data.replace(b"\n  ", b"\n\x01")
+    while True:
+        deeper = data.replace(b"\x01  ", b"\x01\x01")
+        if len(deeper) == len(data):
+            break
+        data = deeper
+    return data.replace(b"\x01", b" " * indent)
+
+
+def _stdlib_dumps(value: Any, indent: Optional[int], default: Optional[Callable[[Any], Any]]) -> bytes:
+    return json.dumps(value, indent=indent, default=default).encode("utf-8")
+
+
+def _orjson_backend() -> _Backend:
+    orjson = importlib.import_module("orjson")
+
+    def dumps(value: Any, indent: Optional[int], default: Optional[Callable[[Any], Any]]) -> bytes:
+        if indent is None:
+            return orjson.dumps(value, default=default)
+        return _reindent(orjson.dumps(value, default=default, option=orjson.OPT_INDENT_2), indent)
+
+    return _Backend("orjson", orjson.loads, dumps)
+
+
+def _msgspec_backend() -> _Backend:
+    msgspec_json = importlib.import_module("msgspec.json")
+    decoder = msgspec_json.Decoder()
+
+    def dumps(value: Any, indent: Optional[int], default: Optional[Callable[[Any], Any]]) -> bytes:
+        data = msgspec_json.encode(value, enc_hook=default)
+        return data if indent is None else msgspec_json.format(data, indent=indent)
+
+    return _Backend("msgspec", decoder.decode, dumps)
+
+
+def _ujson_backend() -> _Backend:
+    ujson = importlib.import_module("ujson")
+
+    def dumps(value: Any, indent: Optional[int], default: Optional[Callable[[Any], Any]]) -> bytes:
+        text = ujson.dumps(value, indent=indent or 0, ensure_ascii=False, escape_forward_slashes=False, default=default)
+        return text.encode("utf-8")
+
+    return _Backend("ujson", ujson.loads, dumps)
+
+
+_STDLIB = _Backend("json", json.loads, _stdlib_dumps)
+_FACTORIES: Dict[str, Callable[[], _Backend]] = {
+    "orjson": _orjson_backend,
+    "msgspec": _msgspec_backend,
+    "ujson": _ujson_backend,
+    "json": lambda: _STDLIB,
+}
+
+_backend: Optional[_Backend] = None
+_lock = threading.Lock()
+
+
+def _resolve(name: str) -> _Backend:
+    if name == "auto":
+        # Fast parsing only: fast encoders format floats and non-ASCII text
+        # differently, and saved documents must stay byte-identical.
+        for candidate in _AUTO_ORDER:
+            try:
+                return _FACTORIES[candidate]()._replace(dumps=None)
+            except ImportError:
+                continue
+        return _STDLIB
+    try:
+        factory = _FACTORIES[name]
+    except KeyError:
+        raise ValueError(f"Unknown JSON backend: {name!r} (expected auto, {', '.join(_FACTORIES)})") from None
+    return factory()
+
+
+def _active() -> _Backend:
+    global _backend
+    if _backend is None:
+        with _lock:
+            if _backend is None:
+                _backend = _resolve(os.environ.get(BACKEND_ENV_VAR, "auto").strip().lower() or "auto")
+    return _backend
+
+
+def set_json_backend(name: str = "auto") -> str:
+    """Select the JSON backend by name and return the name actually in use.
+
+    `auto` parses with the fastest installed library (`orjson`, `msgspec`, `ujson`)
+    and keeps writing with the standard library, so saved files are unchanged.
+    Naming a library uses it for writing too: output keeps the requested
+    indentation but floats, non-ASCII text and NaN may be written differently.
+    Raises `ValueError` for unknown names and `ImportError` when the requested
+    library is not installed.
+    """
+
+    global _backend
+    backend = _resolve(name.strip().lower())
+    with _lock:
+        _backend = backend
+    return backend.name
+
+
+def get_json_backend() -> str:
+    """Return the name of the library used for parsing."""
+
+    return _active().name
+
+
+def available_json_backends() -> List[str]:
+    """Return the names of the backends importable in this environment."""
+
+    names = []
+    for name, factory in _FACTORIES.items():
+        try:
+            factory()
+        except ImportError:
+            continue
+        names.append(name)
+    return names
+
+
+def loads(data: Union[str, bytes, bytearray]) -> Any:
+    """Parse JSON text or UTF-8 bytes."""
+
+    backend = _active()
+    if backend is not _STDLIB:
+        try:
+            return backend.loads(data)
+        except Exception:
+            pass
+    return json.loads(data)
+
+
+def dumps_bytes(value: Any, indent: Optional[int] = None, default: Optional[Callable[[Any], Any]] = None) -> bytes:
+    """Serialize `value` to UTF-8 JSON bytes, pretty-printed when `indent` is given."""
+
+    backend = _active()
+    if backend.dumps is not None and backend is not _STDLIB:
+        try:
+            return backend.dumps(value, indent, default)
+        except Exception:
+            pass
+    return _stdlib_dumps(value, indent, default)
+
+
+def dumps(value: Any, indent: Optional[int] = None, default: Optional[Callable[[Any], Any]] = None) -> str:
+    """Serialize `value` to a JSON string, pretty-printed when `indent` is given."""
+
+    backend = _active()
+    if backend.dumps is None or backend is _STDLIB:
+        return json.dumps(value, indent=indent, default=default)
+    return dumps_bytes(value, indent, default).decode("utf-8")
+
+
+def load_path(path: Union[str, "os.PathLike[str]"]) -> Any:
+    """Read and parse a JSON file as bytes."""
+
+    with open(path, "rb") as f:
+        return loads(f.read())
+
+
+def _temporary_path(path: Union[str, "os.PathLike[str]"], suffix: str = ".tmp") -> str:
+    directory, name = os.path.split(os.fspath(path))
+    return os.path.join(directory or ".", f".{name}.{secrets.token_hex(6)}{suffix}")
+
+
+def _create_temporary(path: Union[str, "os.PathLike[str]"]) -> Tuple[int, str]:
+    """Create a hidden file next to `path` to be renamed over it; return `(fd, name)`.
+
+    Unlike `tempfile.mkstemp` (always 0600), the file gets the mode of the file it
+    will replace, or `0o666 & ~umask` like any newly written file.
+    """
+
+    try:
+        mode: Optional[int] = stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        mode = None
+    tmp_path = _temporary_path(path)
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0), 0o666)
+    try:
+        if mode is not None and mode != stat.S_IMODE(os.fstat(fd).st_mode):
+            os.chmod(tmp_path, mode)
+    except BaseException:
+        os.close(fd)
+        os.unlink(tmp_path)
+        raise
+    return fd, tmp_path
+
+
+def _write_temporary(path: Union[str, "os.PathLike[str]"], data: bytes, *, fsync: bool = False) -> str:
+    """Write `data` to a new temporary file next to `path` and return its name."""
+
+    fd, tmp_path = _create_temporary(path)
+    try:
+        with open(fd, "wb") as f:
+            f.write(data)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    return tmp_path
+
+
+def _fsync_directory(directory: Union[str, "os.PathLike[str]"]) -> None:
+    # Makes renames durable; directories cannot be opened on Windows.
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _write_atomic(path: Union[str, "os.PathLike[str]"], data: bytes, *, fsync: bool = False) -> None:
+    """Replace `path` with `data` through a temporary file, so readers never see a partial file.
+
+    `fsync=True` flushes the file before the rename and its directory after it.
+    """
+
+    tmp_path = _write_temporary(path, data, fsync=fsync)
+    try:
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    if fsync:
+        _fsync_directory(os.path.dirname(os.fspath(path)) or ".")
+
+
+@contextmanager
+def _atomic_open(path: Union[str, "os.PathLike[str]"]) -> Iterator[IO[str]]:
+    """Open a temporary file next to `path` and move it over `path` on success."""
+
+    fd, tmp_path = _create_temporary(path)
+    try:
+        with open(fd, "w", encoding="utf-8", newline="") as f:
+            yield f
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+def dump_path(
+    path: Union[str, "os.PathLike[str]"],
+    value: Any,
+    indent: Optional[int] = None,
+    default: Optional[Callable[[Any], Any]] = None,
+    *,
+    stream: bool = False,
+) -> None:
+    """Serialize `value` and write it to `path` followed by a newline.
+
+    `stream=True` encodes chunk by chunk with the standard library straight into a
+    temporary file that replaces `path` once complete, so the whole document is
+    never held as one string and readers never see a partial file.
+    """
+
+    if stream:
+        encoder = json.JSONEncoder(indent=indent, default=default)
+        with _atomic_open(path) as f:
+            write = f.write
+            for chunk in encoder.iterencode(value):
+                write(chunk)
+            write("\n")
+        return
+    data = dumps_bytes(value, indent, default)
+    with open(path, "wb") as f:
+        f.write(data)
+        f.write(b"\n")
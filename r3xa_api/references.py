@@ -0,0 +1,222 @@
+from __future__ import annotations
+
+from typing import Any, Dict, Iterator, List, Mapping, NamedTuple, Optional, Tuple
+
+import jsonschema
+
+
+ITEM_SECTIONS = ("settings", "data_sources", "data_sets")
+
+# (section holding the referencing items, field, section the ids must belong to)
+REFERENCE_FIELDS = (
+    ("data_sources", "input_data_sets", "data_sets"),
+    ("data_sets", "data_sources", "data_sources"),
+)
+
+
+class IndexedItem(NamedTuple):
+    """Location and content of one identified item in a document."""
+
+    id: str
+    section: str
+    index: int
+    kind: Optional[str]
+    item: Mapping[str, Any]
+
+
+class IdIndex:
+    """Id -> item lookup table built in one pass over a document.
+
+    The first item declaring an id wins; later items with the same id are kept in
+    `duplicates`.
+    """
+
+    def __init__(self, instance: Mapping[str, Any]) -> None:
+        # id -> (section, index, item); IndexedItem records are built on lookup.
+        self._entries: Dict[str, Tuple[str, int, Dict[str, Any]]] = {}
+        self.duplicates: List[IndexedItem] = []
+        entries = self._entries
+        for section in ITEM_SECTIONS:
+            items = instance.get(section) if isinstance(instance, dict) else None
+            if not isinstance(items, list):
+                continue
+            for index, item in enumerate(items):
+                if not isinstance(item, dict):
+                    continue
+                item_id = item.get("id")
+                if not isinstance(item_id, str):
+                    continue
+                if item_id in entries:
+                    self.duplicates.append(_indexed_item(item_id, (section, index, item)))
+                else:
+                    entries[item_id] = (section, index, item)
+
+    def __contains__(self, item_id: object) -> bool:
+        return item_id in self._entries
+
+    def __getitem__(self, item_id: str) -> IndexedItem:
+        return _indexed_item(item_id, self._entries[item_id])
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, item_id: str) -> Optional[IndexedItem]:
+        """Return the indexed item for `item_id`, or None."""
+
+        entry = self._entries.get(item_id)
+        return _indexed_item(item_id, entry) if entry is not None else None
+
+    def ids(self, section: Optional[str] = None) -> List[str]:
+        """Return indexed ids, optionally restricted to one section, in document order."""
+
+        return [item_id for item_id, entry in self._entries.items() if section is None or entry[0] == section]
+
+
+def _indexed_item(item_id: str, entry: Tuple[str, int, Dict[str, Any]]) -> IndexedItem:
+    section, index, item = entry
+    kind = item.get("kind")
+    return IndexedItem(item_id, section, index, kind if isinstance(kind, str) else None, item)
+
+
+def build_id_index(instance: Mapping[str, Any]) -> IdIndex:
+    """Index the ids of all `settings`, `data_sources` and `data_sets` items."""
+
+    return IdIndex(instance)
+
+
+def _reference_values(item: Mapping[str, Any], field: str) -> List[Tuple[Any, Any]]:
+    """Return `(path key, id)` pairs for a reference field holding a list or mapping of ids."""
+
+    value = item.get(field)
+    if isinstance(value, list):
+        return list(enumerate(value))
+    if isinstance(value, dict):
+        return list(value.items())
+    return []
+
+
+def _reference_error(message: str, validator: str, path: List[Any], instance: Any) -> jsonschema.ValidationError:
+    return jsonschema.ValidationError(message, validator=validator, path=path, instance=instance)
+
+
+def _cyclic_nodes(edges: Dict[str, List[str]]) -> Dict[str, List[str]]:
+    """Peel off acyclic nodes (Kahn) and return the remaining subgraph."""
+
+    indegree: Dict[str, int] = dict.fromkeys(edges, 0)
+    for children in edges.values():
+        for child in children:
+            indegree[child] = indegree.get(child, 0) + 1
+    ready = [node for node, degree in indegree.items() if not degree]
+    while ready:
+        node = ready.pop()
+        for child in edges.get(node, ()):
+            indegree[child] -= 1
+            if not indegree[child]:
+                ready.append(child)
+    return {node: [child for child in edges[node] if indegree[child]] for node in edges if indegree[node]}
+
+
+def _cycles(edges: Dict[str, List[str]]) -> List[List[str]]:
+    """Return the strongly connected components that contain a cycle (iterative Tarjan)."""
+
+    edges = _cyclic_nodes(edges)
+    order: Dict[str, int] = {}
+    low: Dict[str, int] = {}
+    stack: List[str] = []
+    on_stack = set()
+    cycles: List[List[str]] = []
+
+    for root in edges:
+        if root in order:
+            continue
+        work = [(root, iter(edges[root]))]
+        order[root] = low[root] = len(order)
+        stack.append(root)
+        on_stack.add(root)
+        while work:
+            node, children = work[-1]
+            for child in children:
+                if child not in order:
+                    order[child] = low[child] = len(order)
+                    stack.append(child)
+                    on_stack.add(child)
+                    work.append((child, iter(edges.get(child, ()))))
+                    break
+                if child in on_stack:
+                    low[node] = min(low[node], order[child])
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    low[parent] = min(low[parent], low[node])
+                if low[node] == order[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    if len(component) > 1 or node in edges.get(node, ()):
+                        cycles.append(component[::-1])
+    return cycles
+
+
+def iter_reference_errors(
+    instance: Mapping[str, Any], index: Optional[IdIndex] = None
+) -> Iterator[jsonschema.ValidationError]:
+    """Yield referential-integrity errors for a document in linear time.
+
+    Reports duplicate ids (`validator="unique_id"`), references to missing ids or to
+    items of the wrong section (`validator="reference"`) and cycles in the
+    data-set/data-source graph (`validator="cycle"`).
+    """
+
+    if not isinstance(instance, dict):
+        return
+    if index is None:
+        index = IdIndex(instance)
+
+    for duplicate in index.duplicates:
+        first = index[duplicate.id]
+        yield _reference_error(
+            f"Duplicate id {duplicate.id!r} (first declared at {first.section}/{first.index})",
+            "unique_id",
+            [duplicate.section, duplicate.index, "id"],
+            duplicate.id,
+        )
+
+    # Edges point downstream: referenced id -> referencing item, i.e. data set ->
+    # consuming source and source -> produced data set.
+    entries = index._entries
+    edges: Dict[str, List[str]] = {}
+    for section, field, target in REFERENCE_FIELDS:
+        items = instance.get(section)
+        if not isinstance(items, list):
+            continue
+        for position, item in enumerate(items):
+            if not isinstance(item, dict):
+                continue
+            item_id = item.get("id")
+            for key, ref in _reference_values(item, field):
+                if not isinstance(ref, str):
+                    continue
+                entry = entries.get(ref)
+                if entry is None:
+                    path = [section, position, field, key]
+                    yield _reference_error(f"{ref!r} does not match any id in {target}", "reference", path, ref)
+                elif entry[0] != target:
+                    path = [section, position, field, key]
+                    yield _reference_error(
+                        f"{ref!r} refers to {entry[0]}/{entry[1]}, expected an id in {target}", "reference", path, ref
+                    )
+                elif isinstance(item_id, str):
+                    edges.setdefault(ref, []).append(item_id)
+
+    for component in _cycles(edges):
+        first = index.get(component[0])
+        path = [first.section, first.index] if first is not None else []
+        yield _reference_error(f"Reference cycle through ids: {', '.join(component)}", "cycle", path, component)
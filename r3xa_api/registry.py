@@ -1,13 +1,22 @@
 from __future__ import annotations
 
-import json
+import os
+import threading
+import time
+from collections import OrderedDict
 from collections.abc import Mapping, MutableMapping
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import Any, Dict, Iterator, Optional
+from typing import Any, Dict, Hashable, Iterable, Iterator, List, NamedTuple, Optional, Set, Tuple
 
 import jsonschema
 
-from .schema import load_schema
+from . import jsonio
+from .registry_backends import FileRegistryBackend, RegistryBackend, _item_bytes, get_backend
+from .registry_index import RegistryEntry
+from .registry_query import RegistryQueryIndex
+from .validate import CacheInfo, _compiled_schema, _report_error, get_item_validator
 
 
 def _coerce_item_payload(item: Mapping[str, Any] | RegistryItem) -> Dict[str, Any]:
@@ -21,8 +30,7 @@ def _coerce_item_payload(item: Mapping[str, Any] | RegistryItem) -> Dict[str, An
 def load_item(path: str | Path) -> Dict[str, Any]:
     """Load a JSON registry item from disk."""
 
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    return jsonio.load_path(path)
 
 
 def save_item(
@@ -40,7 +48,7 @@ def save_item(
 
     path = Path(path)
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+    jsonio._write_atomic(path, _item_bytes(payload))
     return path
 
 
@@ -52,6 +60,16 @@ def load_item_path(root: str | Path, tree_path: str) -> Dict[str, Any]:
     return load_item(path)
 
 
+def _tree_path_kind(tree_path: str, kind: Optional[str] = None) -> Optional[str]:
+    """Return `kind`, or the `section/kind` prefix of a tree path."""
+
+    if kind is None:
+        parts = tree_path.split("/")
+        if len(parts) >= 2:
+            kind = "/".join(parts[:2])
+    return kind
+
+
 def save_item_path(
     root: str | Path,
     tree_path: str,
@@ -62,25 +80,8 @@ def save_item_path(
 ) -> Path:
     """Validate then save a registry item addressed as `section/kind/name`."""
 
-    root = Path(root)
-    inferred_kind = kind
-    if inferred_kind is None:
-        parts = tree_path.split("/")
-        if len(parts) >= 2:
-            inferred_kind = "/".join(parts[:2])
-
-    path = root / f"{tree_path}.json"
-    return save_item(path, item, validate=validate, kind=inferred_kind)
-
-
-def _wrap_def(schema: Dict[str, Any], kind: str) -> Dict[str, Any]:
-    """Wrap a `$defs` item into a standalone schema root for validation."""
-
-    section, name = kind.split("/", 1)
-    return {
-        "$ref": f"#/$defs/{section}/{name}",
-        "$defs": schema.get("$defs", {}),
-    }
+    path = Path(root) / f"{tree_path}.json"
+    return save_item(path, item, validate=validate, kind=_tree_path_kind(tree_path, kind))
 
 
 def validate_item(
@@ -91,14 +92,12 @@ def validate_item(
     """Validate a registry item against its `$defs` entry."""
 
     item = _coerce_item_payload(item)
-    schema = schema or load_schema()
     if kind is None:
         kind = item.get("kind")
     if not kind:
         raise ValueError("Missing kind for item validation")
 
-    item_schema = _wrap_def(schema, kind)
-    validator = jsonschema.validators.Draft202012Validator(item_schema)
+    validator = get_item_validator(kind, schema or None)
     errors = sorted(validator.iter_errors(item), key=jsonschema.exceptions.relevance)
     if errors:
         msg = "\n".join([f"- {e.message}" for e in errors])
@@ -143,8 +142,13 @@ class RegistryItem(MutableMapping[str, Any]):
         *,
         registry_root: str | Path | None = None,
         tree_path: str | None = None,
+        registry: Registry | None = None,
     ) -> None:
         self._payload = dict(payload)
+        # Saves without an explicit path go through `registry` (any backend) when set.
+        self.registry = registry
+        if registry_root is None and registry is not None:
+            registry_root = registry.root
         self.registry_root = Path(registry_root) if registry_root is not None else None
         self.tree_path = tree_path
 
@@ -181,6 +185,8 @@ class RegistryItem(MutableMapping[str, Any]):
 
         if self.registry_root is None or self.tree_path is None:
             return None
+        if self.registry is not None and not isinstance(self.registry.backend, FileRegistryBackend):
+            return None
         return self.registry_root / f"{self.tree_path}.json"
 
     def to_dict(self) -> Dict[str, Any]:
@@ -200,6 +206,7 @@ class RegistryItem(MutableMapping[str, Any]):
             self._payload,
             registry_root=self.registry_root if registry_root is None else registry_root,
             tree_path=self.tree_path if tree_path is None else tree_path,
+            registry=self.registry if registry_root is None else None,
         )
 
     def validate(self, kind: Optional[str] = None, schema: Optional[Dict[str, Any]] = None) -> RegistryItem:
@@ -215,6 +222,7 @@ class RegistryItem(MutableMapping[str, Any]):
             merge_item(self._payload, **overrides),
             registry_root=self.registry_root,
             tree_path=self.tree_path,
+            registry=self.registry,
         )
 
     def save(
@@ -229,6 +237,8 @@ class RegistryItem(MutableMapping[str, Any]):
         if path is None:
             if self.registry_root is None or self.tree_path is None:
                 raise ValueError("RegistryItem.save() needs a file path or a bound registry tree path")
+            if self.registry is not None:
+                return self.registry.save(self.tree_path, self._payload, validate=validate, kind=kind)
             return save_item_path(self.registry_root, self.tree_path, self._payload, validate=validate, kind=kind)
         return save_item(path, self._payload, validate=validate, kind=kind)
 
@@ -242,25 +252,182 @@ class RegistryItem(MutableMapping[str, Any]):
     ) -> Path:
         """Save into a registry root with an explicit or bound tree path."""
 
-        registry_root = registry.root if isinstance(registry, Registry) else Path(registry)
         resolved_tree_path = tree_path or self.tree_path
         if resolved_tree_path is None:
             raise ValueError("RegistryItem.save_to() needs an explicit tree_path when the item is not bound")
-        return save_item_path(registry_root, resolved_tree_path, self._payload, validate=validate, kind=kind)
+        if isinstance(registry, Registry):
+            return registry.save(resolved_tree_path, self._payload, validate=validate, kind=kind)
+        return save_item_path(registry, resolved_tree_path, self._payload, validate=validate, kind=kind)
+
+
+# Kept for callers that imported the old name.
+RegistryCacheInfo = CacheInfo
+
+
+def _copy_json(value: Any) -> Any:
+    # JSON payloads only hold dicts, lists and immutable scalars; this is several
+    # times faster than copy.deepcopy for them.
+    if isinstance(value, dict):
+        return {key: _copy_json(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy_json(item) for item in value]
+    return value
+
+
+class _CachedItem:
+    __slots__ = ("signature", "payload", "validated")
+
+    def __init__(self, signature: Hashable, payload: Dict[str, Any]) -> None:
+        self.signature = signature
+        self.payload = payload
+        # `kind` arguments the payload already passed validation for.
+        self.validated: Set[Optional[str]] = set()
+
+
+class _ItemCache:
+    """Bounded LRU of parsed registry items keyed by tree path, checked against backend signatures."""
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, _CachedItem]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def load(self, backend: RegistryBackend, tree_path: str) -> _CachedItem:
+        # Signature before reading: a write racing with the read leaves a stale
+        # signature, which only costs one extra reload.
+        signature = backend.signature(tree_path)
+        with self._lock:
+            cached = self._entries.get(tree_path)
+            if cached is not None and cached.signature == signature:
+                self._entries.move_to_end(tree_path)
+                self.hits += 1
+                return cached
+            self.misses += 1
+        cached = _CachedItem(signature, backend.load(tree_path))
+        with self._lock:
+            self._entries[tree_path] = cached
+            self._entries.move_to_end(tree_path)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return cached
+
+    def discard(self, tree_path: str) -> None:
+        with self._lock:
+            self._entries.pop(tree_path, None)
+
+    def info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.maxsize, len(self._entries))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+
+class RegistryValidationResult(NamedTuple):
+    """Validation outcome of one registry file, as returned by `Registry.validate_all()`."""
+
+    tree_path: str
+    kind: Optional[str]
+    valid: bool
+    errors: List[Dict[str, Any]]
+    duration: float
+
+
+def _validation_result(backend: RegistryBackend, tree_path: str) -> RegistryValidationResult:
+    """Load and validate one registry file, turning every failure into a report."""
+
+    started = time.perf_counter()
+    kind: Optional[str] = None
+
+    def result(errors: List[Dict[str, Any]]) -> RegistryValidationResult:
+        return RegistryValidationResult(tree_path, kind, not errors, errors, time.perf_counter() - started)
+
+    def source_error(message: str, validator: str) -> RegistryValidationResult:
+        return result([{"path": "", "message": message, "validator": validator, "schema_path": ""}])
+
+    try:
+        item = backend.load(tree_path)
+    except OSError as exc:
+        return source_error(f"Unable to read item: {exc}", "file")
+    except ValueError as exc:
+        return source_error(f"Invalid JSON item: {exc}", "json")
+    if not isinstance(item, dict):
+        return source_error("Registry item must be a JSON object", "type")
+    # The directory decides the kind, as in `save()`: a misfiled item is invalid.
+    kind = tree_path.rpartition("/")[0]
+    try:
+        validator = get_item_validator(kind)
+    except ValueError as exc:
+        return source_error(str(exc), "kind")
+    errors = sorted(validator.iter_errors(item), key=jsonschema.exceptions.relevance)
+    return result([_report_error(error) for error in errors])
+
+
+def _init_validation_worker() -> None:
+    """Compile every item validator once, before the worker receives any path."""
+
+    _compiled_schema().item_validators()
+
+
+def _check_filters(section: Optional[str], kind: Optional[str]) -> None:
+    if kind is not None:
+        if "/" not in kind:
+            raise ValueError("kind filter must look like 'section/name'")
+        if section is not None and not kind.startswith(f"{section}/"):
+            raise ValueError("section and kind filters are inconsistent")
 
 
 class Registry:
     """Helper to load and validate registry items by tree path."""
 
-    def __init__(self, root: str | Path):
-        """Create a registry helper rooted at a local directory."""
-
-        self.root = Path(root)
+    def __init__(
+        self,
+        root: str | Path,
+        *,
+        index: bool = False,
+        cache_size: int = 0,
+        backend: str | RegistryBackend = "files",
+    ):
+        """Create a registry helper rooted at a local directory.
+
+        `index=True` keeps a persisted metadata index (`<root>/.r3xa-index.json`)
+        that answers `list()` and `entries()` by stat-only diffing of the tree.
+        `cache_size > 0` keeps up to that many parsed items in an LRU; each lookup
+        stats the file and reloads it when its mtime, size or inode changed.
+        `backend="sqlite"` stores items in the SQLite database at `root` instead of
+        one file per item (see `r3xa_api.registry_backends`); it is always indexed.
+        """
+
+        self.backend = get_backend(root, backend)
+        self.root = self.backend.root
+        self.indexed = index or not isinstance(self.backend, FileRegistryBackend)
+        self.index = self.backend.make_index(index)
+        self.queries = RegistryQueryIndex(self.index, load=self.backend.load)
+        self._cache = _ItemCache(cache_size) if cache_size > 0 else None
 
     def get(self, tree_path: str) -> Dict[str, Any]:
         """Load an item from `section/kind/name` path."""
 
-        return load_item_path(self.root, tree_path)
+        if self._cache is None:
+            return self.backend.load(tree_path)
+        return _copy_json(self._cache.load(self.backend, tree_path).payload)
+
+    def cache_info(self) -> CacheInfo:
+        """Return hit/miss counters and size of the item cache (zeros when disabled)."""
+
+        if self._cache is None:
+            return CacheInfo(0, 0, 0, 0)
+        return self._cache.info()
+
+    def clear_cache(self) -> None:
+        """Drop every cached item and reset the counters."""
+
+        if self._cache is not None:
+            self._cache.clear()
 
     def load(self, tree_path: str) -> Dict[str, Any]:
         """Alias for `get()` with a more discoverable name."""
@@ -270,13 +437,13 @@ class Registry:
     def wrap(self, item: Mapping[str, Any], tree_path: str | None = None) -> RegistryItem:
         """Wrap a plain item payload into a bound `RegistryItem`."""
 
-        return RegistryItem(item, registry_root=self.root, tree_path=tree_path)
+        return RegistryItem(item, tree_path=tree_path, registry=self)
 
     def get_item(self, tree_path: str, *, validated: bool = True, kind: Optional[str] = None) -> RegistryItem:
         """Load a registry item and return it as a `RegistryItem` wrapper."""
 
         item = self.get_validated(tree_path, kind=kind) if validated else self.get(tree_path)
-        return RegistryItem(item, registry_root=self.root, tree_path=tree_path)
+        return RegistryItem(item, tree_path=tree_path, registry=self)
 
     def save(
         self,
@@ -286,9 +453,72 @@ class Registry:
         validate: bool = True,
         kind: Optional[str] = None,
     ) -> Path:
-        """Validate then save an item to `section/kind/name` path."""
-
-        return save_item_path(self.root, tree_path, item, validate=validate, kind=kind)
+        """Validate then save an item to `section/kind/name` path.
+
+        The index is updated in memory; it is written by the next `list()`,
+        `entries()`, `query()` or `flush()`.
+        """
+
+        payload = _coerce_item_payload(item)
+        if validate:
+            validate_item(payload, kind=_tree_path_kind(tree_path, kind))
+        path = self.backend.save(tree_path, payload)
+        if self._cache is not None:
+            self._cache.discard(tree_path)
+        if self.queries.loaded:
+            self.queries.record(tree_path, _copy_json(payload))
+        elif self.indexed:
+            self.index.record(tree_path)
+        return path
+
+    def save_many(
+        self,
+        items: Mapping[str, Mapping[str, Any] | RegistryItem] | Iterable[Tuple[str, Mapping[str, Any] | RegistryItem]],
+        *,
+        validate: bool = True,
+        fsync: bool = False,
+    ) -> List[Path]:
+        """Validate then save many items given as `{tree_path: item}` or pairs.
+
+        Every item is validated against its tree path kind before anything is
+        written; failures are reported together in one `ValidationError`. The
+        backend then writes the batch at once (files: temporary files renamed into
+        place, one `mkdir` per kind; SQLite: one transaction) and the index is
+        updated in memory once (see `flush()`). `fsync=True` makes the batch durable before
+        returning. Returns the written paths in input order.
+        """
+
+        pairs = items.items() if isinstance(items, Mapping) else items
+        # Later duplicates win, as with repeated `save()` calls.
+        batch = {tree_path: _coerce_item_payload(item) for tree_path, item in pairs}
+        if validate:
+            failures = []
+            for tree_path, payload in batch.items():
+                try:
+                    validate_item(payload, kind=_tree_path_kind(tree_path))
+                except jsonschema.exceptions.ValidationError as exc:
+                    failures.append(f"{tree_path}:\n{exc.message}")
+            if failures:
+                raise jsonschema.exceptions.ValidationError("\n".join(failures))
+        paths = self.backend.save_many(list(batch.items()), fsync=fsync)
+        for tree_path, payload in batch.items():
+            if self._cache is not None:
+                self._cache.discard(tree_path)
+            if self.queries.loaded:
+                self.queries.record(tree_path, _copy_json(payload))
+            elif self.indexed:
+                self.index.record(tree_path)
+        return paths
+
+    def flush(self) -> None:
+        """Write the persisted index if saves changed it since it was last written.
+
+        `save()` and `save_many()` update the index in memory only; `list()`,
+        `entries()`, `query()` and `flush()` write it out. Call `flush()` before a
+        process that only saves exits.
+        """
+
+        self.index.save()
 
     def validate(self, item: Mapping[str, Any] | RegistryItem, kind: Optional[str] = None) -> None:
         """Validate an item using explicit `kind` or embedded `item.kind`."""
@@ -296,42 +526,72 @@ class Registry:
         validate_item(item, kind=kind)
 
     def get_validated(self, tree_path: str, kind: Optional[str] = None) -> Dict[str, Any]:
-        """Load then validate a registry item in one call."""
-
-        item = self.get(tree_path)
-        self.validate(item, kind=kind)
-        return item
+        """Load then validate a registry item in one call.
+
+        With the item cache enabled, an unchanged file is validated only once per
+        `kind` argument.
+        """
+
+        if self._cache is None:
+            item = self.get(tree_path)
+            self.validate(item, kind=kind)
+            return item
+        cached = self._cache.load(self.backend, tree_path)
+        if kind not in cached.validated:
+            self.validate(cached.payload, kind=kind)
+            cached.validated.add(kind)
+        return _copy_json(cached.payload)
 
     def load_validated(self, tree_path: str, kind: Optional[str] = None) -> Dict[str, Any]:
         """Alias for `get_validated()` with a more discoverable name."""
 
         return self.get_validated(tree_path, kind=kind)
 
+    def entries(self, section: Optional[str] = None, kind: Optional[str] = None) -> list[RegistryEntry]:
+        """Return index metadata (id, title, mtime, size, hash) for registry files.
+
+        Files whose mtime or size changed are re-read; the others are answered from
+        the index. Without `index=True` the index is kept in memory only.
+        """
+
+        _check_filters(section, kind)
+        self.index.refresh(section, kind, stat_files=True)
+        return self.index.entries(section=section, kind=kind)
+
+    def refresh(self, section: Optional[str] = None, kind: Optional[str] = None) -> bool:
+        """Stat every file in scope and re-read those edited in place; return True on change.
+
+        `list()` and `query()` only notice files added, removed or renamed (through
+        directory mtimes). Call this after other processes rewrote items in place;
+        later queries then see the new contents.
+        """
+
+        _check_filters(section, kind)
+        return self.index.refresh(section, kind, stat_files=True)
+
     def list(self, section: Optional[str] = None, kind: Optional[str] = None) -> list[str]:
         """List available registry tree paths, optionally filtered by section or kind."""
 
-        if kind is not None:
-            if "/" not in kind:
-                raise ValueError("kind filter must look like 'section/name'")
-            if section is not None and not kind.startswith(f"{section}/"):
-                raise ValueError("section and kind filters are inconsistent")
-
-            kind_dir = self.root / kind
-            if not kind_dir.exists():
-                return []
-            return sorted(f"{kind}/{path.stem}" for path in kind_dir.glob("*.json"))
-
-        sections = [section] if section is not None else ["settings", "data_sources", "data_sets"]
-        tree_paths: list[str] = []
-        for current_section in sections:
-            section_dir = self.root / current_section
-            if not section_dir.exists():
-                continue
-            for kind_dir in sorted(path for path in section_dir.iterdir() if path.is_dir()):
-                tree_paths.extend(
-                    sorted(f"{current_section}/{kind_dir.name}/{path.stem}" for path in kind_dir.glob("*.json"))
-                )
-        return tree_paths
+        _check_filters(section, kind)
+        if self.indexed and isinstance(self.backend, FileRegistryBackend):
+            self.index.refresh(section, kind)
+            return [entry.tree_path for entry in self.index.entries(section=section, kind=kind)]
+        return self.backend.list(section=section, kind=kind)
+
+    def query(self, section: Optional[str] = None, kind: Optional[str] = None, **lookups: Any) -> list[str]:
+        """Return the tree paths whose fields match every lookup, in `list()` order.
+
+        Keywords are field paths joined with `__` plus an optional lookup (`exact`,
+        `in`, `gt`, `gte`, `lt`, `lte`, `contains`), e.g.
+        `query(kind="data_sources/camera", manufacturer="AVT", image_size__width__gte=2048)`.
+        Lists match when any element matches and unit objects compare by `value`.
+        Answers come from in-memory secondary indexes (`self.queries`) that are built
+        on first use and kept up to date by `save()` and by directory-mtime refreshes;
+        items edited in place by other processes are seen after `refresh()`.
+        """
+
+        _check_filters(section, kind)
+        return self.queries.query(section, kind, **lookups)
 
     def iter_items(
         self,
@@ -350,6 +610,34 @@ class Registry:
                 item = self.get_validated(tree_path) if validated else self.get(tree_path)
             yield tree_path, item
 
+    def validate_all(
+        self,
+        section: Optional[str] = None,
+        kind: Optional[str] = None,
+        *,
+        workers: Optional[int] = None,
+    ) -> Dict[str, RegistryValidationResult]:
+        """Validate every registry file and return one result per tree path, in `list()` order.
+
+        Files are read and validated in a process pool whose workers compile the
+        item validators once. Unlike `iter_items(validated=True)` nothing is
+        raised: unreadable files, invalid JSON and unknown kinds give an invalid
+        result with the error in the `build_validation_report` shape. `workers`
+        defaults to the CPU count; `workers=1` validates serially in the current
+        process.
+        """
+
+        tree_paths = self.list(section=section, kind=kind)
+        workers = min(workers or os.cpu_count() or 1, len(tree_paths))
+        if workers <= 1:
+            results = [_validation_result(self.backend, tree_path) for tree_path in tree_paths]
+        else:
+            # Batches keep inter-process overhead small next to a ~1 ms validation.
+            chunksize = max(1, min(64, len(tree_paths) // (workers * 4)))
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_validation_worker) as executor:
+                results = list(executor.map(partial(_validation_result, self.backend), tree_paths, chunksize=chunksize))
+        return {result.tree_path: result for result in results}
+
     def merge(self, tree_path: str, **overrides: Any) -> RegistryItem:
         """Load a registry item and return a shallow merged copy with overrides."""
 
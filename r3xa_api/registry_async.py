@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from pathlib import Path
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, List, Mapping, Optional, Tuple, TypeVar
+
+from .registry import Registry, RegistryItem, RegistryValidationResult
+from .registry_index import RegistryEntry
+
+
+_T = TypeVar("_T")
+
+
+class AsyncRegistry:
+    """Coroutine counterpart of `Registry` for event-loop code such as the web app.
+
+    Every call runs the matching `Registry` method on a bounded thread pool
+    (`max_workers` threads), so file or database I/O never blocks the loop and a
+    burst of requests cannot start more than `max_workers` reads at once. Pass a
+    `Registry` instance, or a root plus `Registry` keyword arguments. Coroutines
+    must run in an asyncio event loop.
+    """
+
+    def __init__(self, root: str | Path | Registry, *, max_workers: int = 4, **registry_options: Any) -> None:
+        if isinstance(root, Registry):
+            if registry_options:
+                raise TypeError("Registry options cannot be combined with a Registry instance")
+            self.registry = root
+        else:
+            self.registry = Registry(root, **registry_options)
+        self.max_workers = max_workers
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="r3xa-registry")
+
+    @property
+    def root(self) -> Path:
+        return self.registry.root
+
+    async def _run(self, func: Callable[..., _T], *args: Any, **kwargs: Any) -> _T:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(func, *args, **kwargs))
+
+    async def get(self, tree_path: str) -> Dict[str, Any]:
+        """Load an item from `section/kind/name` path."""
+
+        return await self._run(self.registry.get, tree_path)
+
+    async def get_validated(self, tree_path: str, kind: Optional[str] = None) -> Dict[str, Any]:
+        """Load then validate a registry item."""
+
+        return await self._run(self.registry.get_validated, tree_path, kind=kind)
+
+    async def get_item(self, tree_path: str, *, validated: bool = True, kind: Optional[str] = None) -> RegistryItem:
+        """Load a registry item as a `RegistryItem` bound to the wrapped registry."""
+
+        return await self._run(self.registry.get_item, tree_path, validated=validated, kind=kind)
+
+    async def list(self, section: Optional[str] = None, kind: Optional[str] = None) -> List[str]:
+        """List registry tree paths, optionally filtered by section or kind."""
+
+        return await self._run(self.registry.list, section=section, kind=kind)
+
+    async def entries(self, section: Optional[str] = None, kind: Optional[str] = None) -> List[RegistryEntry]:
+        """Return index metadata for registry items."""
+
+        return await self._run(self.registry.entries, section=section, kind=kind)
+
+    async def refresh(self, section: Optional[str] = None, kind: Optional[str] = None) -> bool:
+        """Re-read items edited in place by other processes (see `Registry.refresh`)."""
+
+        return await self._run(self.registry.refresh, section, kind)
+
+    async def query(self, section: Optional[str] = None, kind: Optional[str] = None, **lookups: Any) -> List[str]:
+        """Return the tree paths matching every field lookup (see `Registry.query`)."""
+
+        return await self._run(self.registry.query, section, kind, **lookups)
+
+    async def iter_items(
+        self,
+        section: Optional[str] = None,
+        kind: Optional[str] = None,
+        *,
+        validated: bool = False,
+    ) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+        """Yield `(tree_path, item)` pairs in `list()` order.
+
+        Items are loaded `max_workers` at a time, so the pool stays busy while
+        the order of `list()` is kept.
+        """
+
+        load = self.registry.get_validated if validated else self.registry.get
+        tree_paths = await self.list(section=section, kind=kind)
+        for start in range(0, len(tree_paths), self.max_workers):
+            batch = tree_paths[start : start + self.max_workers]
+            items = await asyncio.gather(*(self._run(load, tree_path) for tree_path in batch))
+            for tree_path, item in zip(batch, items):
+                yield tree_path, item
+
+    async def save(
+        self,
+        tree_path: str,
+        item: Mapping[str, Any] | RegistryItem,
+        *,
+        validate: bool = True,
+        kind: Optional[str] = None,
+    ) -> Path:
+        """Validate then save an item to `section/kind/name` path."""
+
+        return await self._run(self.registry.save, tree_path, item, validate=validate, kind=kind)
+
+    async def save_many(
+        self,
+        items: Mapping[str, Mapping[str, Any] | RegistryItem] | Iterable[Tuple[str, Mapping[str, Any] | RegistryItem]],
+        *,
+        validate: bool = True,
+        fsync: bool = False,
+    ) -> List[Path]:
+        """Validate then save many items in one batch (see `Registry.save_many`)."""
+
+        return await self._run(self.registry.save_many, items, validate=validate, fsync=fsync)
+
+    async def validate(self, item: Mapping[str, Any] | RegistryItem, kind: Optional[str] = None) -> None:
+        """Validate an item using explicit `kind` or embedded `item.kind`."""
+
+        await self._run(self.registry.validate, item, kind=kind)
+
+    async def validate_all(
+        self,
+        section: Optional[str] = None,
+        kind: Optional[str] = None,
+        *,
+        workers: Optional[int] = None,
+    ) -> Dict[str, RegistryValidationResult]:
+        """Validate every registry file (see `Registry.validate_all`)."""
+
+        return await self._run(self.registry.validate_all, section, kind, workers=workers)
+
+    async def flush(self) -> None:
+        """Write the persisted index if saves changed it (see `Registry.flush`)."""
+
+        await self._run(self.registry.flush)
+
+    def close(self, wait: bool = True) -> None:
+        """Shut the thread pool down, waiting for running calls unless `wait=False`.
+
+        The registry index is flushed afterwards.
+        """
+
+        self._executor.shutdown(wait=wait)
+        self.registry.flush()
+
+    async def __aenter__(self) -> "AsyncRegistry":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        # Every call awaited in the block has finished; do not block the loop.
+        self.close(wait=False)
+
+    def __repr__(self) -> str:
+        return f"AsyncRegistry({str(self.registry.root)!r}, max_workers={self.max_workers})"
@@ -0,0 +1,454 @@
+from __future__ import annotations
+
+import contextlib
+import errno
+import hashlib
+import os
+import shutil
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Sequence, Tuple
+
+from . import jsonio
+from .registry_index import REGISTRY_SECTIONS, RegistryEntry, RegistryIndex
+
+
+def _split_tree_path(tree_path: str) -> Tuple[str, str, str]:
+    parts = tree_path.split("/")
+    if len(parts) != 3 or not all(parts):
+        raise ValueError(f"Registry tree path must look like 'section/kind/name', got {tree_path!r}")
+    return parts[0], f"{parts[0]}/{parts[1]}", parts[2]
+
+
+def _item_bytes(payload: Dict[str, Any]) -> bytes:
+    # Same bytes as `save_item(...)` writes to disk.
+    return jsonio.dumps_bytes(payload, 2) + b"\n"
+
+
+class RegistryBackend(ABC):
+    """Storage of registry items addressed by `section/kind/name` tree paths.
+
+    Subclasses implement the abstract `load`, `signature`, `save`, `list` and
+    `make_index` (instantiating an incomplete backend raises `TypeError`);
+    `Registry` adds validation, caching and queries on top.
+    """
+
+    name = ""
+
+    def __init__(self, root: str | Path) -> None:
+        self.root = Path(root)
+
+    @abstractmethod
+    def load(self, tree_path: str) -> Dict[str, Any]:
+        """Return the parsed item; raise `FileNotFoundError` when it does not exist."""
+
+    @abstractmethod
+    def signature(self, tree_path: str) -> Hashable:
+        """Return a cheap value that changes whenever the stored item changes."""
+
+    @abstractmethod
+    def save(self, tree_path: str, payload: Dict[str, Any]) -> Path:
+        """Store an (already validated) item and return where it was written."""
+
+    def save_many(self, items: Sequence[Tuple[str, Dict[str, Any]]], *, fsync: bool = False) -> List[Path]:
+        """Store several (already validated) items and return where each was written.
+
+        `fsync=True` makes the whole batch durable before returning. This default
+        calls `save` per item; backends override it to batch writes and honour `fsync`.
+        """
+
+        return [self.save(tree_path, payload) for tree_path, payload in items]
+
+    @abstractmethod
+    def list(self, section: Optional[str] = None, kind: Optional[str] = None) -> List[str]:
+        """Return stored tree paths: sections in schema order, then kinds and names sorted."""
+
+    @abstractmethod
+    def make_index(self, persist: bool) -> Any:
+        """Return the metadata index (`RegistryIndex` interface) used for listings and queries."""
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({str(self.root)!r})"
+
+
+def _replace_all(tmp_paths: Sequence[str], paths: Sequence[Path]) -> List[str]:
+    """Rename every temporary file over its target and return the backups to delete.
+
+    Existing targets are hard-linked (or copied) to a backup first. If a rename
+    fails, the targets already replaced are restored in reverse order before the
+    error propagates.
+    """
+
+    done: List[Tuple[Path, Optional[str]]] = []
+    try:
+        for tmp_path, path in zip(tmp_paths, paths):
+            backup: Optional[str] = None
+            if path.exists():
+                backup = jsonio._temporary_path(path, ".bak")
+                try:
+                    os.link(path, backup)
+                except OSError:
+                    shutil.copy2(path, backup)
+            try:
+                os.replace(tmp_path, path)
+            except BaseException:
+                if backup is not None:
+                    os.unlink(backup)
+                raise
+            done.append((path, backup))
+    except BaseException:
+        for path, backup in reversed(done):
+            with contextlib.suppress(OSError):
+                if backup is None:
+                    os.unlink(path)
+                else:
+                    os.replace(backup, path)
+        raise
+    return [backup for _, backup in done if backup is not None]
+
+
+class FileRegistryBackend(RegistryBackend):
+    """One `<root>/<section>/<kind>/<name>.json` file per item (the default layout)."""
+
+    name = "files"
+
+    def load(self, tree_path: str) -> Dict[str, Any]:
+        return jsonio.load_path(self.root / f"{tree_path}.json")
+
+    def signature(self, tree_path: str) -> Hashable:
+        stat = os.stat(self.root / f"{tree_path}.json")
+        return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+    def save(self, tree_path: str, payload: Dict[str, Any]) -> Path:
+        path = self.root / f"{tree_path}.json"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        jsonio._write_atomic(path, _item_bytes(payload))
+        return path
+
+    def save_many(self, items: Sequence[Tuple[str, Dict[str, Any]]], *, fsync: bool = False) -> List[Path]:
+        """Write every item to a temporary file first, then rename them all into place.
+
+        Each kind directory is created once. If a write fails, the temporary files
+        are removed and no item is touched. If a rename fails, the renames already
+        done are rolled back from hard-linked backups of the replaced files (new
+        files are removed), so the batch is applied entirely or not at all. With
+        `fsync=True` file contents are flushed before the renames and each
+        directory once after them.
+        """
+
+        paths = [self.root / f"{tree_path}.json" for tree_path, _ in items]
+        directories = {path.parent for path in paths}
+        for directory in directories:
+            directory.mkdir(parents=True, exist_ok=True)
+        pending: List[str] = []
+        try:
+            for path, (_, payload) in zip(paths, items):
+                pending.append(jsonio._write_temporary(path, _item_bytes(payload), fsync=fsync))
+            backups = _replace_all(pending, paths)
+        except BaseException:
+            for tmp_path in pending:
+                with contextlib.suppress(FileNotFoundError):
+                    os.unlink(tmp_path)
+            raise
+        for backup in backups:
+            os.unlink(backup)
+        if fsync:
+            for directory in directories:
+                jsonio._fsync_directory(directory)
+        return paths
+
+    def list(self, section: Optional[str] = None, kind: Optional[str] = None) -> List[str]:
+        if kind is not None:
+            kind_dir = self.root / kind
+            if not kind_dir.exists():
+                return []
+            return sorted(f"{kind}/{path.stem}" for path in kind_dir.glob("*.json"))
+
+        sections = [section] if section is not None else REGISTRY_SECTIONS
+        tree_paths: List[str] = []
+        for current_section in sections:
+            section_dir = self.root / current_section
+            if not section_dir.exists():
+                continue
+            for kind_dir in sorted(path for path in section_dir.iterdir() if path.is_dir()):
+                tree_paths.extend(
+                    sorted(f"{current_section}/{kind_dir.name}/{path.stem}" for path in kind_dir.glob("*.json"))
+                )
+        return tree_paths
+
+    def make_index(self, persist: bool) -> RegistryIndex:
+        return RegistryIndex(self.root, persist=persist)
+
+
+# Metadata and documents live in separate tables so listings never page through
+# JSON bodies.
+_SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS items (
+    tree_path TEXT PRIMARY KEY,
+    section TEXT NOT NULL,
+    section_rank INTEGER NOT NULL,
+    kind TEXT NOT NULL,
+    name TEXT NOT NULL,
+    id TEXT,
+    title TEXT,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    sha256 TEXT NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS documents (
+    tree_path TEXT PRIMARY KEY,
+    document TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS items_order ON items (section_rank, kind, name);
+CREATE INDEX IF NOT EXISTS items_kind ON items (kind, name);
+CREATE INDEX IF NOT EXISTS items_id ON items (id);
+CREATE INDEX IF NOT EXISTS items_title ON items (title);
+"""
+_ENTRY_COLUMNS = "tree_path, kind, id, title, mtime_ns, size, sha256"
+
+
+class SQLiteRegistryBackend(RegistryBackend):
+    """All items in one SQLite database: JSON documents plus indexed metadata columns.
+
+    `documents` keeps the exact text a file backend would hold for each item and
+    `items` its `kind`, `id`, `title`, `mtime_ns`, `size` and `sha256`, so the
+    backend doubles as its own metadata index. Connections are opened per thread (and per
+    process after pickling) in WAL mode, so readers never block on a writer.
+    """
+
+    name = "sqlite"
+
+    def __init__(self, root: str | Path) -> None:
+        super().__init__(root)
+        self._local = threading.local()
+        self._lock = threading.RLock()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return {"root": self.root}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__init__(state["root"])
+
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            self.root.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(self.root)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.executescript(_SQLITE_SCHEMA)
+            self._local.connection = connection
+        return connection
+
+    def close(self) -> None:
+        """Close the connection of the calling thread."""
+
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
+
+    @staticmethod
+    def _row(tree_path: str, data: bytes, mtime_ns: int) -> Tuple[Any, ...]:
+        section, kind, name = _split_tree_path(tree_path)
+        try:
+            item = jsonio.loads(data)
+        except ValueError:
+            item = None
+        if not isinstance(item, dict):
+            raise ValueError(f"Registry item {tree_path} is not a JSON object")
+        item_id, title = item.get("id"), item.get("title")
+        rank = REGISTRY_SECTIONS.index(section) if section in REGISTRY_SECTIONS else len(REGISTRY_SECTIONS)
+        return (
+            tree_path,
+            section,
+            rank,
+            kind,
+            name,
+            item_id if isinstance(item_id, str) else None,
+            title if isinstance(title, str) else None,
+            mtime_ns,
+            len(data),
+            hashlib.sha256(data).hexdigest(),
+            data.decode("utf-8"),
+        )
+
+    def _write_rows(self, rows: Iterable[Tuple[Any, ...]], *, fsync: bool = False) -> None:
+        # One transaction for every row; the document is the last column. With
+        # `fsync=True` the WAL is synced at commit (synchronous=FULL) instead of
+        # at the next checkpoint.
+        connection = self._connection()
+        rows = list(rows)
+        with self._lock:
+            if fsync:
+                connection.execute("PRAGMA synchronous=FULL")
+            try:
+                with connection:
+                    connection.executemany(
+                        "INSERT OR REPLACE INTO items VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", [row[:-1] for row in rows]
+                    )
+                    connection.executemany(
+                        "INSERT OR REPLACE INTO documents VALUES (?, ?)", [(row[0], row[-1]) for row in rows]
+                    )
+            finally:
+                if fsync:
+                    connection.execute("PRAGMA synchronous=NORMAL")
+
+    def load(self, tree_path: str) -> Dict[str, Any]:
+        row = self._connection().execute("SELECT document FROM documents WHERE tree_path = ?", (tree_path,)).fetchone()
+        if row is None:
+            raise FileNotFoundError(errno.ENOENT, "No such registry item", tree_path)
+        return jsonio.loads(row[0])
+
+    def signature(self, tree_path: str) -> Hashable:
+        row = self._connection().execute("SELECT sha256 FROM items WHERE tree_path = ?", (tree_path,)).fetchone()
+        if row is None:
+            raise FileNotFoundError(errno.ENOENT, "No such registry item", tree_path)
+        return row[0]
+
+    def save(self, tree_path: str, payload: Dict[str, Any]) -> Path:
+        self._write_rows([self._row(tree_path, _item_bytes(payload), time.time_ns())])
+        return self.root
+
+    def save_many(self, items: Sequence[Tuple[str, Dict[str, Any]]], *, fsync: bool = False) -> List[Path]:
+        """Store every item in a single transaction."""
+
+        mtime_ns = time.time_ns()
+        self._write_rows([self._row(tree_path, _item_bytes(payload), mtime_ns) for tree_path, payload in items], fsync=fsync)
+        return [self.root] * len(items)
+
+    def _select(self, columns: str, section: Optional[str], kind: Optional[str]) -> sqlite3.Cursor:
+        """Run `SELECT columns FROM items` filtered by section or kind, in listing order."""
+
+        if kind is not None:
+            where, params = "kind = ?", (kind,)
+        elif section is not None:
+            where, params = "section = ?", (section,)
+        else:
+            where, params = "section_rank < ?", (len(REGISTRY_SECTIONS),)
+        order = "name" if kind is not None else "section_rank, kind, name"
+        return self._connection().execute(f"SELECT {columns} FROM items WHERE {where} ORDER BY {order}", params)
+
+    def list(self, section: Optional[str] = None, kind: Optional[str] = None) -> List[str]:
+        return [row[0] for row in self._select("tree_path", section, kind)]
+
+    def make_index(self, persist: bool) -> "_SQLiteIndex":
+        return _SQLiteIndex(self)
+
+    # Bulk transfer from and to the directory layout.
+
+    def import_tree(self, directory: str | Path) -> int:
+        """Copy every item of a file registry into the database in one transaction.
+
+        Documents are stored byte for byte, so hashes match the source files and
+        `export_tree(...)` writes them back unchanged. Returns the number of items.
+        """
+
+        source = FileRegistryBackend(directory)
+
+        rows = []
+        for tree_path in source.list():
+            with open(source.root / f"{tree_path}.json", "rb") as f:
+                rows.append(self._row(tree_path, f.read(), os.fstat(f.fileno()).st_mtime_ns))
+        self._write_rows(rows)
+        return len(rows)
+
+    def export_tree(self, directory: str | Path) -> int:
+        """Write every item to `<directory>/<tree_path>.json` and return the number of items."""
+
+        directory = Path(directory)
+        created = set()
+        count = 0
+        query = (
+            "SELECT items.tree_path, kind, document FROM items JOIN documents USING (tree_path)"
+            " ORDER BY section_rank, kind, name"
+        )
+        for tree_path, kind, document in self._connection().execute(query):
+            if kind not in created:
+                (directory / kind).mkdir(parents=True, exist_ok=True)
+                created.add(kind)
+            (directory / f"{tree_path}.json").write_bytes(document.encode("utf-8"))
+            count += 1
+        return count
+
+
+class _SQLiteIndex:
+    """`RegistryIndex` interface answered from the metadata columns of a SQLite backend."""
+
+    def __init__(self, backend: SQLiteRegistryBackend) -> None:
+        self.backend = backend
+        self.root = backend.root
+        self.persist = True
+        self.generation = 0
+        # (generation, [(section_rank, kind), ...]) for `kinds()`.
+        self._kinds: Optional[Tuple[int, List[Tuple[int, str]]]] = None
+        self._data_versions = threading.local()
+        self._lock = threading.Lock()
+
+    def save(self) -> None:
+        """Nothing to do: the metadata is committed with each item."""
+
+    def refresh(self, section: Optional[str] = None, kind: Optional[str] = None, *, stat_files: bool = False) -> bool:
+        """Return True (and bump `generation`) when another connection committed a change."""
+
+        version = self.backend._connection().execute("PRAGMA data_version").fetchone()[0]
+        if version == getattr(self._data_versions, "value", None):
+            return False
+        self._data_versions.value = version
+        with self._lock:
+            self.generation += 1
+        return True
+
+    def record(self, tree_path: str) -> Optional[RegistryEntry]:
+        """Return the stored entry after a write through the backend."""
+
+        with self._lock:
+            self.generation += 1
+        return self.get(tree_path)
+
+    def kinds(self, section: Optional[str] = None, kind: Optional[str] = None) -> List[str]:
+        """Return the stored kinds, optionally filtered, in listing order."""
+
+        with self._lock:
+            if self._kinds is None or self._kinds[0] != self.generation:
+                query = "SELECT DISTINCT section_rank, kind FROM items ORDER BY section_rank, kind"
+                self._kinds = (self.generation, self.backend._connection().execute(query).fetchall())
+            ranked = self._kinds[1]
+        if kind is not None:
+            return [current for _, current in ranked if current == kind]
+        if section is not None:
+            return [current for _, current in ranked if current.startswith(f"{section}/")]
+        return [current for rank, current in ranked if rank < len(REGISTRY_SECTIONS)]
+
+    def entries(self, section: Optional[str] = None, kind: Optional[str] = None) -> List[RegistryEntry]:
+        """Return stored entries, optionally filtered by section or kind, in listing order."""
+
+        return [RegistryEntry(*row) for row in self.backend._select(_ENTRY_COLUMNS, section, kind)]
+
+    def get(self, tree_path: str) -> Optional[RegistryEntry]:
+        """Return the entry for `tree_path`, or None."""
+
+        query = f"SELECT {_ENTRY_COLUMNS} FROM items WHERE tree_path = ?"
+        row = self.backend._connection().execute(query, (tree_path,)).fetchone()
+        return None if row is None else RegistryEntry(*row)
+
+    def __len__(self) -> int:
+        return self.backend._connection().execute("SELECT COUNT(*) FROM items").fetchone()[0]
+
+
+BACKENDS = {"files": FileRegistryBackend, "sqlite": SQLiteRegistryBackend}
+
+
+def get_backend(root: str | Path, backend: str | RegistryBackend = "files") -> RegistryBackend:
+    """Return a backend instance from a name in `BACKENDS`, or `backend` itself."""
+
+    if isinstance(backend, RegistryBackend):
+        return backend
+    try:
+        factory = BACKENDS[backend]
+    except KeyError:
+        raise ValueError(f"Unknown registry backend: {backend!r} (expected {', '.join(BACKENDS)})") from None
+    return factory(root)
@@ -0,0 +1,266 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterator, List, NamedTuple, Optional
+
+from . import jsonio
+from .references import ITEM_SECTIONS
+
+
+INDEX_FILENAME = ".r3xa-index.json"
+INDEX_FORMAT = "r3xa-registry-index"
+INDEX_VERSION = 1
+# Registry trees have one directory per document item section.
+REGISTRY_SECTIONS = ITEM_SECTIONS
+# Directories modified this recently may still change within the same mtime tick
+# (coarse on NFS), so they are listed again on the next refresh.
+_RACY_WINDOW_NS = 2_000_000_000
+
+
+class RegistryEntry(NamedTuple):
+    """Metadata of one registry file, as recorded in the index."""
+
+    tree_path: str
+    kind: str
+    id: Optional[str]
+    title: Optional[str]
+    mtime_ns: int
+    size: int
+    sha256: str
+
+
+class _KindIndex:
+    __slots__ = ("mtime_ns", "entries", "listing")
+
+    def __init__(self, mtime_ns: int = -1, entries: Optional[Dict[str, RegistryEntry]] = None) -> None:
+        self.mtime_ns = mtime_ns
+        self.entries: Dict[str, RegistryEntry] = entries or {}
+        # Entries sorted by name, rebuilt after a change.
+        self.listing: Optional[List[RegistryEntry]] = None
+
+
+def _read_entry(path: Path, tree_path: str, kind: str) -> Optional[RegistryEntry]:
+    try:
+        with open(path, "rb") as f:
+            stat = os.fstat(f.fileno())
+            data = f.read()
+    except FileNotFoundError:
+        return None
+    try:
+        item = jsonio.loads(data)
+    except ValueError:
+        item = None
+    if not isinstance(item, dict):
+        item = {}
+    item_id, title = item.get("id"), item.get("title")
+    return RegistryEntry(
+        tree_path,
+        kind,
+        item_id if isinstance(item_id, str) else None,
+        title if isinstance(title, str) else None,
+        stat.st_mtime_ns,
+        stat.st_size,
+        hashlib.sha256(data).hexdigest(),
+    )
+
+
+def _scan_json_files(directory: str) -> Iterator["os.DirEntry[str]"]:
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.name.endswith(".json") and entry.is_file():
+                yield entry
+
+
+class RegistryIndex:
+    """Metadata index of a registry tree, refreshed by stat-only diffing.
+
+    Entries are grouped by kind directory together with the directory mtime.
+    `refresh()` lists only the kind directories whose mtime changed (files were
+    added, removed or renamed) and reads only new files; `refresh(stat_files=True)`
+    also stats every file and re-reads those whose mtime or size changed. Both can
+    be limited to one section or kind. With `persist=True` the index is loaded
+    from and saved to `<root>/.r3xa-index.json`.
+    """
+
+    def __init__(self, root: str | Path, *, persist: bool = True) -> None:
+        self.root = Path(root)
+        self.persist = persist
+        self.path = self.root / INDEX_FILENAME
+        self._kinds: Dict[str, _KindIndex] = {}
+        self._loaded = False
+        self._dirty = False
+        # Incremented on every change so dependent caches know when to resync.
+        self.generation = 0
+        self._lock = threading.RLock()
+
+    def _load(self) -> None:
+        if self._loaded:
+            return
+        self._loaded = True
+        if not self.persist:
+            return
+        try:
+            payload = jsonio.load_path(self.path)
+        except (OSError, ValueError):
+            return
+        if not isinstance(payload, dict) or (payload.get("format"), payload.get("version")) != (INDEX_FORMAT, INDEX_VERSION):
+            return
+        try:
+            for kind, record in payload["kinds"].items():
+                self._kinds[kind] = _KindIndex(
+                    int(record["mtime_ns"]),
+                    {row[0]: RegistryEntry(f"{kind}/{row[0]}", kind, *row[1:]) for row in record["entries"]},
+                )
+        except (KeyError, TypeError, ValueError, AttributeError):
+            self._kinds = {}
+
+    def save(self) -> None:
+        """Write the index file if it changed since it was loaded or last saved."""
+
+        with self._lock:
+            if not (self.persist and self._dirty):
+                return
+            kinds = {
+                kind: {
+                    "mtime_ns": record.mtime_ns,
+                    "entries": [[name, *entry[2:]] for name, entry in sorted(record.entries.items())],
+                }
+                for kind, record in sorted(self._kinds.items())
+            }
+            self.root.mkdir(parents=True, exist_ok=True)
+            # Atomic replace with regular (umask) permissions: on a shared registry
+            # other users must be able to read the index.
+            jsonio.dump_path(self.path, {"format": INDEX_FORMAT, "version": INDEX_VERSION, "kinds": kinds}, stream=True)
+            self._dirty = False
+
+    def refresh(self, section: Optional[str] = None, kind: Optional[str] = None, *, stat_files: bool = False) -> bool:
+        """Bring the index up to date with the tree and return True if anything changed."""
+
+        if kind is not None:
+            section = kind.split("/", 1)[0]
+        with self._lock:
+            self._load()
+            changed = False
+            for current_section in [section] if section is not None else REGISTRY_SECTIONS:
+                try:
+                    with os.scandir(self.root / current_section) as entries:
+                        kind_dirs = {f"{current_section}/{entry.name}": entry for entry in entries if entry.is_dir()}
+                except FileNotFoundError:
+                    kind_dirs = {}
+                prefix = f"{current_section}/"
+                for gone in [name for name in self._kinds if name.startswith(prefix) and name not in kind_dirs]:
+                    if kind is None or gone == kind:
+                        del self._kinds[gone]
+                        changed = True
+                for current_kind, kind_dir in kind_dirs.items():
+                    if kind is None or current_kind == kind:
+                        changed |= self._refresh_kind(current_kind, kind_dir, stat_files)
+            if changed:
+                self._dirty = True
+                self.generation += 1
+            self.save()
+            return changed
+
+    def _refresh_kind(self, kind: str, kind_dir: "os.DirEntry[str]", stat_files: bool) -> bool:
+        record = self._kinds.setdefault(kind, _KindIndex())
+        mtime_ns = kind_dir.stat().st_mtime_ns
+        if record.mtime_ns == mtime_ns and not stat_files:
+            return False
+        changed = False
+        stale = set(record.entries)
+        for entry in _scan_json_files(kind_dir.path):
+            name = entry.name[:-5]
+            stale.discard(name)
+            current = record.entries.get(name)
+            if current is not None:
+                if not stat_files:
+                    continue
+                stat = entry.stat()
+                if (stat.st_mtime_ns, stat.st_size) == (current.mtime_ns, current.size):
+                    continue
+            fresh = _read_entry(Path(entry.path), f"{kind}/{name}", kind)
+            if fresh is not None and fresh != current:
+                record.entries[name] = fresh
+                changed = True
+        for name in stale:
+            del record.entries[name]
+            changed = True
+        if time.time_ns() - mtime_ns < _RACY_WINDOW_NS:
+            mtime_ns = -1
+        if record.mtime_ns != mtime_ns:
+            record.mtime_ns = mtime_ns
+            changed = True
+        if changed:
+            record.listing = None
+        return changed
+
+    def record(self, tree_path: str) -> Optional[RegistryEntry]:
+        """Re-read one file after it was written, or drop it if it no longer exists.
+
+        Directory mtimes are left alone, so the next `refresh()` still lists the
+        directory once; files already recorded are not read again.
+        """
+
+        kind, _, name = tree_path.rpartition("/")
+        with self._lock:
+            self._load()
+            entry = _read_entry(self.root / f"{tree_path}.json", tree_path, kind)
+            record = self._kinds.setdefault(kind, _KindIndex())
+            if entry is None:
+                if record.entries.pop(name, None) is None:
+                    return None
+            elif record.entries.get(name) != entry:
+                record.entries[name] = entry
+            else:
+                return entry
+            record.listing = None
+            self._dirty = True
+            self.generation += 1
+            return entry
+
+    def kinds(self, section: Optional[str] = None, kind: Optional[str] = None) -> List[str]:
+        """Return the indexed kinds, optionally filtered, in listing order."""
+
+        with self._lock:
+            self._load()
+            if kind is not None:
+                return [kind] if kind in self._kinds else []
+            sections = [section] if section is not None else REGISTRY_SECTIONS
+            return [name for current in sections for name in sorted(self._kinds) if name.startswith(f"{current}/")]
+
+    def entries(self, section: Optional[str] = None, kind: Optional[str] = None) -> List[RegistryEntry]:
+        """Return indexed entries, optionally filtered by section or kind.
+
+        The order matches a directory walk: sections in schema order, then kinds
+        and names sorted.
+        """
+
+        with self._lock:
+            selected: List[RegistryEntry] = []
+            for name in self.kinds(section, kind):
+                record = self._kinds[name]
+                if record.listing is None:
+                    record.listing = [record.entries[key] for key in sorted(record.entries)]
+                selected.extend(record.listing)
+            return selected
+
+    def get(self, tree_path: str) -> Optional[RegistryEntry]:
+        """Return the entry for `tree_path`, or None."""
+
+        kind, _, name = tree_path.rpartition("/")
+        with self._lock:
+            self._load()
+            record = self._kinds.get(kind)
+            return None if record is None else record.entries.get(name)
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._load()
+            return sum(len(record.entries) for record in self._kinds.values())
+
+    def __repr__(self) -> str:
+        return f"RegistryIndex(root={str(self.root)!r}, persist={self.persist})"
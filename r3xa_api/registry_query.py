@@ -0,0 +1,272 @@
+from __future__ import annotations
+
+import operator
+import threading
+from bisect import bisect_left, bisect_right
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
+
+from . import jsonio
+from .registry_index import RegistryIndex
+
+
+LOOKUPS = ("exact", "in", "gt", "gte", "lt", "lte", "contains")
+_SCALARS = (str, int, float, bool, type(None))
+_COMPARISONS = {"gt": operator.gt, "gte": operator.ge, "lt": operator.lt, "lte": operator.le}
+
+
+def _key(value: Any) -> Any:
+    # True == 1 and hash alike; keep booleans apart from numbers.
+    return ("$bool", value) if isinstance(value, bool) else value
+
+
+def _field_values(value: Any, path: Tuple[str, ...]) -> Iterator[Any]:
+    """Yield the scalar values found at `path` inside a registry item.
+
+    Lists are searched element by element, so a field matches when any element
+    does. Unit objects stand for their `value`, and a path segment equal to a unit
+    `title` selects that unit inside a list (`("image_size", "width")`).
+    """
+
+    if isinstance(value, list):
+        for element in value:
+            yield from _field_values(element, path)
+        return
+    if isinstance(value, dict):
+        is_unit = value.get("kind") == "unit"
+        if not path:
+            if is_unit and isinstance(value.get("value"), _SCALARS):
+                yield value["value"]
+            return
+        if path[0] in value:
+            yield from _field_values(value[path[0]], path[1:])
+        elif is_unit and value.get("title") == path[0]:
+            yield from _field_values(value, path[1:])
+        return
+    if not path and isinstance(value, _SCALARS):
+        yield value
+
+
+def _value_matches(lookup: str, operand: Any, value: Any) -> bool:
+    """Apply a `contains` or range lookup to one value, like `_FieldIndex.match`."""
+
+    if lookup == "contains":
+        return isinstance(value, str) and operand in value
+    if value is None or isinstance(value, bool) or isinstance(value, str) != isinstance(operand, str):
+        return False
+    return _COMPARISONS[lookup](value, operand)
+
+
+def _parse_lookup(name: str, operand: Any) -> Tuple[Tuple[str, ...], str, Any]:
+    """Split a `field__subfield__lookup` keyword into `(path, lookup, operand)`."""
+
+    parts = name.split("__")
+    lookup = parts.pop() if len(parts) > 1 and parts[-1] in LOOKUPS else "exact"
+    if not all(parts):
+        raise ValueError(f"Invalid query field: {name!r}")
+    operands = operand if lookup == "in" else [operand]
+    if lookup == "in" and not isinstance(operand, (list, tuple, set, frozenset)):
+        raise TypeError(f"{name} expects a list of values")
+    if not all(isinstance(value, _SCALARS) for value in operands):
+        raise TypeError(f"{name} expects JSON scalar values")
+    if lookup == "contains" and not isinstance(operand, str):
+        raise TypeError(f"{name} expects a string")
+    if lookup in ("gt", "gte", "lt", "lte") and (operand is None or isinstance(operand, bool)):
+        raise TypeError(f"{name} expects a number or a string")
+    return tuple(parts), lookup, operand
+
+
+class _FieldIndex:
+    """Value -> tree paths table for one field path, with sorted keys for ranges."""
+
+    __slots__ = ("values", "_numbers", "_strings")
+
+    def __init__(self) -> None:
+        self.values: Dict[Any, Set[str]] = {}
+        self._numbers: Optional[List[Any]] = None
+        self._strings: Optional[List[str]] = None
+
+    def add(self, tree_path: str, values: Iterator[Any]) -> None:
+        for value in values:
+            key = _key(value)
+            paths = self.values.get(key)
+            if paths is None:
+                self.values[key] = paths = set()
+                self._numbers = self._strings = None
+            paths.add(tree_path)
+
+    def remove(self, tree_path: str, values: Iterator[Any]) -> None:
+        for value in values:
+            key = _key(value)
+            paths = self.values.get(key)
+            if paths is None:
+                continue
+            paths.discard(tree_path)
+            if not paths:
+                del self.values[key]
+                self._numbers = self._strings = None
+
+    def _sorted(self, operand: Any) -> List[Any]:
+        if isinstance(operand, str):
+            if self._strings is None:
+                self._strings = sorted(key for key in self.values if isinstance(key, str))
+            return self._strings
+        if self._numbers is None:
+            self._numbers = sorted(key for key in self.values if isinstance(key, (int, float)))
+        return self._numbers
+
+    def match(self, lookup: str, operand: Any) -> Set[str]:
+        if lookup == "exact":
+            return self.values.get(_key(operand), set())
+        if lookup == "in":
+            keys = [_key(value) for value in operand]
+        elif lookup == "contains":
+            keys = [key for key in self.values if isinstance(key, str) and operand in key]
+        else:
+            ordered = self._sorted(operand)
+            if lookup in ("gt", "gte"):
+                start = (bisect_right if lookup == "gt" else bisect_left)(ordered, operand)
+                keys = ordered[start:]
+            else:
+                stop = (bisect_left if lookup == "lt" else bisect_right)(ordered, operand)
+                keys = ordered[:stop]
+        matched: Set[str] = set()
+        for key in keys:
+            matched.update(self.values.get(key, ()))
+        return matched
+
+
+class RegistryQueryIndex:
+    """In-memory secondary indexes answering field queries over a registry tree.
+
+    Items are read once per kind, when a query first covers that kind, and kept in
+    memory. Each queried field path gets a value -> tree paths table built on first
+    use. Before every query the `RegistryIndex` is refreshed by directory mtime;
+    when it reports a change, only files whose SHA-256 changed are read again.
+    Files rewritten in place keep their old values until the index is refreshed
+    with `stat_files=True` (`Registry.refresh()`).
+    `record(...)` applies a save without reading the file back. `load` reads one
+    item by tree path (files under `index.root` by default).
+    """
+
+    def __init__(self, index: RegistryIndex, load: Optional[Callable[[str], Any]] = None) -> None:
+        self.index = index
+        self._load = load or (lambda tree_path: jsonio.load_path(index.root / f"{tree_path}.json"))
+        # tree_path -> (sha256, payload)
+        self._documents: Dict[str, Tuple[str, Dict[str, Any]]] = {}
+        self._kinds: Dict[str, Set[str]] = {}
+        self._fields: Dict[Tuple[str, ...], _FieldIndex] = {}
+        self._generation = -1
+        self._lock = threading.RLock()
+
+    @property
+    def loaded(self) -> bool:
+        """True once a query has loaded at least one kind."""
+
+        return bool(self._kinds)
+
+    def _put(self, tree_path: str, kind: str, sha256: str, payload: Dict[str, Any]) -> None:
+        self._remove(tree_path)
+        self._documents[tree_path] = (sha256, payload)
+        self._kinds.setdefault(kind, set()).add(tree_path)
+        for path, field in self._fields.items():
+            field.add(tree_path, _field_values(payload, path))
+
+    def _remove(self, tree_path: str) -> None:
+        document = self._documents.pop(tree_path, None)
+        if document is None:
+            return
+        self._kinds[tree_path.rpartition("/")[0]].discard(tree_path)
+        for path, field in self._fields.items():
+            field.remove(tree_path, _field_values(document[1], path))
+
+    def _sync_kind(self, kind: str) -> None:
+        current = {entry.tree_path: entry.sha256 for entry in self.index.entries(kind=kind)}
+        for tree_path in self._kinds.setdefault(kind, set()) - current.keys():
+            self._remove(tree_path)
+        for tree_path, sha256 in current.items():
+            document = self._documents.get(tree_path)
+            if document is not None and document[0] == sha256:
+                continue
+            try:
+                payload = self._load(tree_path)
+            except (OSError, ValueError):
+                payload = None
+            if isinstance(payload, dict):
+                self._put(tree_path, kind, sha256, payload)
+            else:
+                self._remove(tree_path)
+
+    def _field(self, path: Tuple[str, ...]) -> _FieldIndex:
+        field = self._fields.get(path)
+        if field is None:
+            field = _FieldIndex()
+            for tree_path, (_, payload) in self._documents.items():
+                field.add(tree_path, _field_values(payload, path))
+            self._fields[path] = field
+        return field
+
+    def record(self, tree_path: str, payload: Optional[Dict[str, Any]]) -> None:
+        """Record a saved (or deleted, with `payload=None`) item in both indexes."""
+
+        with self._lock:
+            generation = self.index.generation
+            entry = self.index.record(tree_path)
+            kind = tree_path.rpartition("/")[0]
+            if kind in self._kinds:
+                if entry is None or payload is None:
+                    self._remove(tree_path)
+                else:
+                    self._put(tree_path, kind, entry.sha256, payload)
+            if self._generation == generation:
+                self._generation = self.index.generation
+
+    def query(self, section: Optional[str] = None, kind: Optional[str] = None, **lookups: Any) -> List[str]:
+        """Return the tree paths matching every lookup, in `Registry.list()` order.
+
+        Keywords name a field path joined with `__`, optionally followed by a
+        lookup: `exact` (default), `in`, `gt`, `gte`, `lt`, `lte` or `contains`
+        (substring).
+        """
+
+        conditions = [_parse_lookup(name, operand) for name, operand in lookups.items()]
+        with self._lock:
+            self.index.refresh(section, kind)
+            generation = self.index.generation
+            if generation != self._generation:
+                for loaded in list(self._kinds):
+                    self._sync_kind(loaded)
+                self._generation = generation
+            kinds = self.index.kinds(section, kind)
+            for current in kinds:
+                if current not in self._kinds:
+                    self._sync_kind(current)
+
+            # Equality lookups are single table probes; range and substring lookups
+            # become per-item checks once an equality lookup has narrowed the set.
+            probes = [condition for condition in conditions if condition[1] in ("exact", "in")]
+            checks = [condition for condition in conditions if condition[1] not in ("exact", "in")]
+            if not probes and checks:
+                probes.append(checks.pop(0))
+            matches = sorted((self._field(path).match(lookup, operand) for path, lookup, operand in probes), key=len)
+            rank = {name: position for position, name in enumerate(kinds)}
+            if not matches:
+                candidates: Iterator[str] = (tree_path for name in kinds for tree_path in self._kinds[name])
+            else:
+                candidates = (
+                    tree_path
+                    for tree_path in matches[0]
+                    if tree_path.rpartition("/")[0] in rank and all(tree_path in other for other in matches[1:])
+                )
+            documents = self._documents
+            selected = [
+                tree_path
+                for tree_path in candidates
+                if all(
+                    any(_value_matches(lookup, operand, value) for value in _field_values(documents[tree_path][1], path))
+                    for path, lookup, operand in checks
+                )
+            ]
+        return sorted(selected, key=lambda tree_path: (rank[tree_path.rpartition("/")[0]], tree_path))
+
+    def __repr__(self) -> str:
+        return f"RegistryQueryIndex(root={str(self.index.root)!r})"
@@ -1,8 +1,10 @@
+import hashlib
 import json
 import importlib.resources
 from copy import deepcopy
 from functools import lru_cache
-from typing import Optional, Dict, Any
+from types import MappingProxyType
+from typing import Optional, Dict, Any, Literal, Mapping, Union, overload
 
 
 @lru_cache(maxsize=1)
@@ -14,21 +16,76 @@ def _load_packaged_schema_cached() -> Dict[str, Any]:
         return json.load(f)
 
 
-def load_schema(path: Optional[str] = None) -> Dict[str, Any]:
-    """Load a schema from explicit path or packaged default location."""
+@lru_cache(maxsize=1)
+def _packaged_schema_sha256() -> str:
+    """Return the SHA-256 digest of the packaged schema file."""
+
+    schema_path = importlib.resources.files("r3xa_api.resources").joinpath("schema.json")
+    return hashlib.sha256(schema_path.read_bytes()).hexdigest()
+
+
+def _freeze(value: Any) -> Any:
+    """Return a read-only view tree of a JSON value (mapping proxies and tuples)."""
+
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+@lru_cache(maxsize=1)
+def _packaged_schema_view() -> Mapping[str, Any]:
+    """Build the shared read-only view of the packaged schema once per process."""
+
+    return _freeze(_load_packaged_schema_cached())
+
+
+@overload
+def load_schema(path: Optional[str] = None, *, copy: Literal[True] = True) -> Dict[str, Any]: ...
+
+
+@overload
+def load_schema(path: Optional[str] = None, *, copy: Literal[False]) -> Mapping[str, Any]: ...
+
+
+def load_schema(path: Optional[str] = None, *, copy: bool = True) -> Union[Dict[str, Any], Mapping[str, Any]]:
+    """Load a schema from explicit path or packaged default location.
+
+    With `copy=False` a shared read-only view (mapping proxies and tuples) is
+    returned instead of a fresh mutable dictionary, which avoids copying the
+    whole schema on hot paths.
+    """
 
     if path:
         with open(path, "r", encoding="utf-8") as f:
-            return json.load(f)
+            schema = json.load(f)
+        return schema if copy else _freeze(schema)
 
     try:
+        if not copy:
+            return _packaged_schema_view()
         return deepcopy(_load_packaged_schema_cached())
     except Exception as exc:
         raise FileNotFoundError(f"Unable to load packaged schema.json ({exc})") from exc
 
 
+@lru_cache(maxsize=1)
+def _packaged_schema_version() -> Optional[str]:
+    """Return the packaged schema version, computed once per process."""
+
+    return _version_from_schema(load_schema(copy=False))
+
+
+def _version_from_schema(schema: Mapping[str, Any]) -> Optional[str]:
+    """Extract the version constant from a schema mapping."""
+
+    return str(schema.get("properties", {}).get("version", {}).get("const"))
+
+
 def schema_version(path: Optional[str] = None) -> Optional[str]:
     """Return the schema version constant declared in loaded schema."""
 
-    schema = load_schema(path)
-    return str(schema.get("properties", {}).get("version", {}).get("const"))
+    if path:
+        return _version_from_schema(load_schema(path))
+    return _packaged_schema_version()
@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import math
+from typing import Any, Iterator, List, Optional, Sequence, overload
+
+
+class TimestampRange(Sequence[float]):
+    """Affine timestamp series `start + i * step` for `i` in `range(count)`.
+
+    Values are computed on access, so indexing and slicing are O(1) whatever the
+    length; `tolist()` expands the series. `decimals` rounds every value with
+    `round(value, decimals)`, matching series written as
+    `[round(start + i * step, decimals) for i in range(count)]`.
+    """
+
+    __slots__ = ("start", "step", "decimals", "_indices")
+
+    def __init__(self, start: float, step: float, count: int, *, decimals: Optional[int] = None) -> None:
+        if count < 0:
+            raise ValueError("count must be >= 0")
+        self.start = start
+        self.step = step
+        self.decimals = decimals
+        self._indices = range(count)
+
+    @property
+    def count(self) -> int:
+        return len(self._indices)
+
+    def _value(self, i: int) -> float:
+        value = self.start + i * self.step
+        return value if self.decimals is None else round(value, self.decimals)
+
+    def __len__(self) -> int:
+        return len(self._indices)
+
+    @overload
+    def __getitem__(self, index: int) -> float: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "TimestampRange": ...
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            # Slices keep the original indices so values stay bit-identical.
+            series = TimestampRange(self.start, self.step, 0, decimals=self.decimals)
+            series._indices = self._indices[index]
+            return series
+        return self._value(self._indices[index])
+
+    def __iter__(self) -> Iterator[float]:
+        return map(self._value, self._indices)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, TimestampRange):
+            return (self.start, self.step, self.decimals, self._indices) == (
+                other.start,
+                other.step,
+                other.decimals,
+                other._indices,
+            ) or self.tolist() == other.tolist()
+        if isinstance(other, (list, tuple)):
+            return len(other) == len(self) and self.tolist() == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        if self._indices == range(len(self._indices)):
+            extra = "" if self.decimals is None else f", decimals={self.decimals}"
+            return f"TimestampRange(start={self.start!r}, step={self.step!r}, count={self.count}{extra})"
+        return f"TimestampRange(start={self.start!r}, step={self.step!r}, indices={self._indices!r})"
+
+    def is_monotonic(self) -> bool:
+        """Return True when the values are finite and non-decreasing, in O(1)."""
+
+        if len(self) <= 1:
+            return all(map(math.isfinite, self))
+        # Affine values are all finite when both ends are.
+        return self.step * self._indices.step >= 0 and math.isfinite(self[0]) and math.isfinite(self[-1])
+
+    def tolist(self) -> List[float]:
+        """Return the series as a list of floats."""
+
+        start, step, decimals = self.start, self.step, self.decimals
+        if decimals is None:
+            return [start + i * step for i in self._indices]
+        return [round(start + i * step, decimals) for i in self._indices]
+
+    def __array__(self, dtype: Any = None, copy: Any = None) -> Any:
+        import numpy
+
+        if self.decimals is None:
+            values = self.start + numpy.arange(
+                self._indices.start, self._indices.stop, self._indices.step, dtype=numpy.float64
+            ) * self.step
+        else:
+            # numpy.round does not round exactly like round(); keep values identical.
+            values = numpy.array(self.tolist(), dtype=numpy.float64)
+        return values if dtype is None else values.astype(dtype)
+
+
+class FilenameRange(Sequence[str]):
+    """Numbered file names `pattern % i` for `i` in `range(start, stop, step)`.
+
+    `pattern` is a printf-style pattern such as `"img_%06d.tif"`. Indexing and
+    slicing are O(1); `tolist()` expands the names.
+    """
+
+    __slots__ = ("pattern", "_indices")
+
+    def __init__(self, pattern: str, start: int, stop: int, step: int = 1) -> None:
+        try:
+            pattern % start
+        except (TypeError, ValueError) as exc:
+            raise ValueError(f"pattern must format a single integer, got {pattern!r}") from exc
+        self.pattern = pattern
+        self._indices = range(start, stop, step)
+
+    @property
+    def start(self) -> int:
+        return self._indices.start
+
+    @property
+    def stop(self) -> int:
+        return self._indices.stop
+
+    @property
+    def step(self) -> int:
+        return self._indices.step
+
+    def __len__(self) -> int:
+        return len(self._indices)
+
+    @overload
+    def __getitem__(self, index: int) -> str: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "FilenameRange": ...
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            indices = self._indices[index]
+            return FilenameRange(self.pattern, indices.start, indices.stop, indices.step)
+        return self.pattern % self._indices[index]
+
+    def __iter__(self) -> Iterator[str]:
+        pattern = self.pattern
+        return (pattern % i for i in self._indices)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, FilenameRange):
+            return (self.pattern, self._indices) == (other.pattern, other._indices) or self.tolist() == other.tolist()
+        if isinstance(other, (list, tuple)):
+            return len(other) == len(self) and self.tolist() == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        step = "" if self.step == 1 else f", step={self.step}"
+        return f"FilenameRange({self.pattern!r}, start={self.start}, stop={self.stop}{step})"
+
+    def tolist(self) -> List[str]:
+        """Return the file names as a list of strings."""
+
+        pattern = self.pattern
+        return [pattern % i for i in self._indices]
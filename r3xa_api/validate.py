@@ -1,6 +1,481 @@
-from typing import Any, Dict, Optional
+import copy
+import hashlib
+import itertools
+import json
+import os
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Deque, Dict, Hashable, Iterable, Iterator, List, Mapping, NamedTuple, Optional, TextIO, Union
+
 import jsonschema
-from .schema import load_schema
+from . import _jsonstream, _kind_table, jsonio
+from .references import ITEM_SECTIONS, iter_reference_errors
+from .schema import _load_packaged_schema_cached, _packaged_schema_sha256, load_schema
+
+
+_VALIDATOR_CACHE_SIZE = 16
+
+
+class CacheInfo(NamedTuple):
+    """Hit/miss counters and size of a bounded LRU, as returned by ``cache_info()`` helpers."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+def _kind_dispatch_table(schema: Mapping[str, Any]) -> Dict[str, Dict[str, str]]:
+    """Map each root array section to `{kind: $ref}` from its `anyOf` item branches.
+
+    A section is only dispatchable when every branch is a local `$defs` reference
+    whose target pins a distinct `kind` constant.
+    """
+
+    table: Dict[str, Dict[str, str]] = {}
+    for section, section_schema in schema.get("properties", {}).items():
+        items_schema = section_schema.get("items") if isinstance(section_schema, Mapping) else None
+        branches = items_schema.get("anyOf") if isinstance(items_schema, Mapping) else None
+        if not branches:
+            continue
+        kinds: Optional[Dict[str, str]] = {}
+        for branch in branches:
+            ref = branch.get("$ref", "")
+            if not ref.startswith("#/$defs/"):
+                kinds = None
+                break
+            target: Any = schema
+            for part in ref[2:].split("/"):
+                target = target.get(part, {}) if isinstance(target, Mapping) else {}
+            kind = target.get("properties", {}).get("kind", {}).get("const")
+            if kind is None or kind in kinds:
+                kinds = None
+                break
+            kinds[kind] = ref
+        if kinds:
+            table[section] = kinds
+    return table
+
+
+class _CompiledSchema:
+    """Compiled document validator plus lazily built per-kind item validators."""
+
+    def __init__(self, schema: Dict[str, Any], *, packaged: bool = False) -> None:
+        self.schema = schema
+        self.packaged = packaged
+        self.validator = jsonschema.validators.Draft202012Validator(schema)
+        self._item_validators: Optional[Dict[str, jsonschema.protocols.Validator]] = None
+        self._dispatch: Optional[Dict[str, Any]] = None
+
+    def item_validators(self) -> Dict[str, jsonschema.protocols.Validator]:
+        """Return validators for every `$defs/<section>/<name>` item kind."""
+
+        if self._item_validators is None:
+            defs = self.schema.get("$defs", {})
+            self._item_validators = {
+                f"{section}/{name}": self.validator.evolve(schema=item_schema)
+                for section in ITEM_SECTIONS
+                for name, item_schema in defs.get(section, {}).items()
+            }
+        return self._item_validators
+
+    def dispatch_table(self) -> Dict[str, Dict[str, str]]:
+        """Return the `{section: {kind: $ref}}` table, pre-generated for the packaged schema."""
+
+        if self.packaged and _kind_table.SCHEMA_SHA256 == _packaged_schema_sha256():
+            return _kind_table.SECTION_KINDS
+        return _kind_dispatch_table(self.schema)
+
+    def _dispatch_validators(self) -> Dict[str, Any]:
+        """Build the section-less shell validator and per-section fallbacks once."""
+
+        if self._dispatch is None:
+            table = self.dispatch_table()
+            properties = self.schema.get("properties", {})
+            shell = dict(self.schema)
+            shell["properties"] = {
+                name: {k: v for k, v in prop.items() if k != "items"} if name in table else prop
+                for name, prop in properties.items()
+            }
+            self._dispatch = {
+                "table": table,
+                "shell": self.validator.evolve(schema=shell),
+                "fallback": {
+                    section: self.validator.evolve(schema=properties[section]["items"])
+                    for section in table
+                },
+            }
+        return self._dispatch
+
+    def item_errors(self, section: str, item: Any) -> List[jsonschema.ValidationError]:
+        """Validate one section item against the `$defs` entry named by its `kind`.
+
+        Error paths are relative to the item; schema paths are absolute.
+        """
+
+        dispatch = self._dispatch_validators()
+        kinds = dispatch["table"].get(section, {})
+        kind = item.get("kind") if isinstance(item, dict) else None
+        if isinstance(kind, str) and kind in kinds:
+            validator = self.item_validators()[kind]
+            schema_prefix = kinds[kind][2:].split("/")
+        else:
+            validator = dispatch["fallback"][section]
+            schema_prefix = ["properties", section, "items"]
+        errors = list(validator.iter_errors(item))
+        for error in errors:
+            error.schema_path.extendleft(reversed(schema_prefix))
+        return errors
+
+    def iter_item_errors(self, section: str, index: int, item: Any) -> Iterator[jsonschema.ValidationError]:
+        """Yield errors for one item with paths rooted at the document."""
+
+        for error in self.item_errors(section, item):
+            error.path.extendleft((index, section))
+            yield error
+
+    def iter_dispatched_errors(self, instance: Any) -> Iterator[jsonschema.ValidationError]:
+        """Validate items against their `kind` definition instead of every `anyOf` branch."""
+
+        dispatch = self._dispatch_validators()
+        yield from dispatch["shell"].iter_errors(instance)
+        if not isinstance(instance, dict):
+            return
+
+        for section in dispatch["table"]:
+            items = instance.get(section)
+            if not isinstance(items, list):
+                continue
+            for index, item in enumerate(items):
+                yield from self.iter_item_errors(section, index, item)
+
+
+_validator_cache: "OrderedDict[Hashable, _CompiledSchema]" = OrderedDict()
+_validator_cache_lock = threading.Lock()
+
+
+def _validator_cache_key(schema: Optional[Dict[str, Any]], path: Optional[Union[str, Path]]) -> Hashable:
+    """Return the cache key identifying one compiled schema."""
+
+    if path is not None:
+        return ("path", str(Path(path).resolve()))
+    if schema is None:
+        return ("packaged",)
+    return ("object", id(schema))
+
+
+def _compiled_schema(
+    schema: Optional[Dict[str, Any]] = None,
+    path: Optional[Union[str, Path]] = None,
+) -> _CompiledSchema:
+    """Return the cached compiled form of a schema, compiling it on first use."""
+
+    key = _validator_cache_key(schema, path)
+    with _validator_cache_lock:
+        cached = _validator_cache.get(key)
+        if cached is not None and (schema is None or cached.schema is schema):
+            _validator_cache.move_to_end(key)
+            return cached
+
+    if path is not None:
+        schema = load_schema(str(path))
+    elif schema is None:
+        schema = _load_packaged_schema_cached()
+    compiled = _CompiledSchema(schema, packaged=key == ("packaged",))
+
+    with _validator_cache_lock:
+        _validator_cache[key] = compiled
+        _validator_cache.move_to_end(key)
+        while len(_validator_cache) > _VALIDATOR_CACHE_SIZE:
+            _validator_cache.popitem(last=False)
+    return compiled
+
+
+def get_validator(
+    schema: Optional[Dict[str, Any]] = None,
+    *,
+    path: Optional[Union[str, Path]] = None,
+) -> jsonschema.protocols.Validator:
+    """Return a compiled validator reused across calls for the same schema.
+
+    The packaged schema is compiled once per process. Explicit schema objects are
+    cached by identity and custom schema files by resolved path; call
+    `clear_validator_cache()` after mutating or rewriting either of them.
+    """
+
+    return _compiled_schema(schema, path).validator
+
+
+def get_item_validator(
+    kind: str,
+    schema: Optional[Dict[str, Any]] = None,
+    *,
+    path: Optional[Union[str, Path]] = None,
+) -> jsonschema.protocols.Validator:
+    """Return the cached validator for one `section/name` item kind."""
+
+    try:
+        return _compiled_schema(schema, path).item_validators()[kind]
+    except KeyError as exc:
+        raise ValueError(f"Unknown item kind: {kind}") from exc
+
+
+def clear_validator_cache(path: Optional[Union[str, Path]] = None) -> None:
+    """Drop every compiled validator, or only the one compiled from `path`."""
+
+    with _validator_cache_lock:
+        if path is None:
+            _validator_cache.clear()
+        else:
+            _validator_cache.pop(_validator_cache_key(None, path), None)
+
+
+def iter_validation_errors(
+    instance: Any,
+    schema: Optional[Dict[str, Any]] = None,
+    *,
+    dispatch: bool = False,
+    check_references: bool = False,
+) -> Iterator[jsonschema.ValidationError]:
+    """Yield schema errors for a document, optionally dispatching items on `kind`.
+
+    With `dispatch=True`, each `settings`/`data_sources`/`data_sets` item with a known
+    `kind` is checked only against its own `$defs` entry; items with a missing or
+    unknown kind fall back to the generic `anyOf` evaluation. With
+    `check_references=True`, duplicate ids, dangling references and reference cycles
+    are reported after the schema errors.
+    """
+
+    compiled = _compiled_schema(schema or None)
+    errors = compiled.iter_dispatched_errors(instance) if dispatch else compiled.validator.iter_errors(instance)
+    if check_references:
+        return itertools.chain(errors, iter_reference_errors(instance))
+    return errors
+
+
+def _content_hash(value: Any) -> Optional[str]:
+    """Return a canonical-JSON digest of a value, or None when it is not JSON-serializable."""
+
+    try:
+        text = json.dumps(value, sort_keys=True, separators=(",", ":"), ensure_ascii=False, allow_nan=True)
+    except (TypeError, ValueError):
+        return None
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _rooted_error(error: jsonschema.ValidationError, section: str, index: int) -> jsonschema.ValidationError:
+    """Return a copy of an item-relative error with its path rooted at the document."""
+
+    rooted = copy.copy(error)
+    rooted.path = rooted.relative_path = deque([section, index, *error.path])
+    return rooted
+
+
+class _ItemErrorCache:
+    """Per-document cache of item validation errors keyed by item content hash.
+
+    Header and section-shape checks run on every pass; only items whose canonical
+    JSON changed since the previous pass are validated again. Entries for items that
+    disappeared are dropped at the end of each pass.
+    """
+
+    def __init__(self) -> None:
+        self._compiled: Optional[_CompiledSchema] = None
+        self._entries: Dict[Any, List[jsonschema.ValidationError]] = {}
+        self.revalidated = 0
+
+    def errors(self, instance: Dict[str, Any]) -> List[jsonschema.ValidationError]:
+        """Return every schema error for `instance`, reusing results of unchanged items."""
+
+        compiled = _compiled_schema()
+        if compiled is not self._compiled:
+            self._compiled = compiled
+            self._entries = {}
+        dispatch = compiled._dispatch_validators()
+        table = dispatch["table"]
+
+        header = {
+            key: [] if key in table and isinstance(value, list) else value
+            for key, value in instance.items()
+        }
+        errors = list(dispatch["shell"].iter_errors(header))
+        entries: Dict[Any, List[jsonschema.ValidationError]] = {}
+        self.revalidated = 0
+        for section in table:
+            items = instance.get(section)
+            if not isinstance(items, list):
+                continue
+            for index, item in enumerate(items):
+                digest = _content_hash(item)
+                key = (section, digest)
+                item_errors = self._entries.get(key) if digest is not None else None
+                if item_errors is None:
+                    item_errors = compiled.item_errors(section, item)
+                    self.revalidated += 1
+                if digest is not None:
+                    entries[key] = item_errors
+                errors.extend(_rooted_error(error, section, index) for error in item_errors)
+        self._entries = entries
+        return errors
+
+
+def _path_to_string(path: Any) -> str:
+    """Serialize a jsonschema error path to slash-separated notation."""
+
+    return "/".join(map(str, path))
+
+
+def _schema_path_to_string(schema_path: Any) -> str:
+    """Serialize a schema path to `#/...` notation."""
+
+    return "#/" + "/".join(map(str, schema_path))
+
+
+def _build_report(
+    instance: Any,
+    schema: Optional[Dict[str, Any]] = None,
+    *,
+    dispatch: bool = False,
+    check_references: bool = False,
+) -> Dict[str, Any]:
+    """Return the `{"valid", "errors"}` report shared by the web helpers and batch API."""
+
+    errors = sorted(
+        iter_validation_errors(instance, schema, dispatch=dispatch, check_references=check_references),
+        key=jsonschema.exceptions.relevance,
+    )
+
+    if not errors:
+        return {"valid": True, "errors": []}
+
+    report_errors: List[Dict[str, Any]] = [_report_error(error) for error in errors]
+    return {"valid": False, "errors": report_errors}
+
+
+def _report_error(error: jsonschema.ValidationError) -> Dict[str, Any]:
+    """Convert one jsonschema error to the report error shape."""
+
+    return {
+        "path": _path_to_string(error.path),
+        "message": error.message,
+        "validator": error.validator,
+        "schema_path": _schema_path_to_string(error.schema_path),
+    }
+
+
+def stream_validation_errors(
+    source: Union[str, "os.PathLike[str]", TextIO],
+    schema: Optional[Dict[str, Any]] = None,
+    *,
+    chunk_size: int = 1 << 16,
+) -> Iterator[Dict[str, Any]]:
+    """Validate a JSON document file item by item, yielding report errors as found.
+
+    The document is parsed incrementally: each `settings`/`data_sources`/`data_sets`
+    item is decoded, validated against its `kind` definition and released before the
+    next one is read, so memory stays bounded by the largest single item. Header
+    errors are yielded once the whole document has been read. Malformed JSON yields
+    one error with `validator` set to `"json"` and stops the stream.
+    """
+
+    if not hasattr(source, "read"):
+        with open(source, "r", encoding="utf-8") as f:
+            yield from stream_validation_errors(f, schema, chunk_size=chunk_size)
+        return
+
+    compiled = _compiled_schema(schema or None)
+    dispatch = compiled._dispatch_validators()
+    header: Dict[str, Any] = {}
+    try:
+        for event, key, index, value in _jsonstream.iter_document(source, dispatch["table"], chunk_size):
+            if event == "item":
+                errors = sorted(compiled.iter_item_errors(key, index, value), key=jsonschema.exceptions.relevance)
+                for error in errors:
+                    yield _report_error(error)
+            else:
+                header[key] = value
+    except ValueError as exc:
+        yield _source_error_report(f"Invalid JSON document: {exc}", "json")["errors"][0]
+        return
+
+    for error in sorted(dispatch["shell"].iter_errors(header), key=jsonschema.exceptions.relevance):
+        yield _report_error(error)
+
+
+def _source_error_report(message: str, validator: str) -> Dict[str, Any]:
+    """Return a report for a document that could not be read or parsed."""
+
+    return {
+        "valid": False,
+        "errors": [{"path": "", "message": message, "validator": validator, "schema_path": ""}],
+    }
+
+
+_worker_schema: Optional[Dict[str, Any]] = None
+
+
+def _init_worker(schema: Optional[Dict[str, Any]], dispatch: bool) -> None:
+    """Compile the worker's validator once, before it receives any document."""
+
+    global _worker_schema
+    _worker_schema = schema
+    compiled = _compiled_schema(schema)
+    if dispatch:
+        compiled.item_validators()
+        compiled._dispatch_validators()
+
+
+def _validate_source(source: Any, schema: Optional[Dict[str, Any]], dispatch: bool) -> Dict[str, Any]:
+    """Load one path (or take one payload) and build its validation report."""
+
+    if isinstance(source, (str, os.PathLike)):
+        try:
+            source = jsonio.load_path(source)
+        except OSError as exc:
+            return _source_error_report(f"Unable to read document: {exc}", "file")
+        except ValueError as exc:
+            return _source_error_report(f"Invalid JSON document: {exc}", "json")
+    return _build_report(source, schema, dispatch=dispatch)
+
+
+def _validate_in_worker(source: Any, dispatch: bool) -> Dict[str, Any]:
+    """Validate one source with the schema installed by `_init_worker`."""
+
+    return _validate_source(source, _worker_schema, dispatch)
+
+
+def validate_many(
+    paths_or_payloads: Iterable[Union[str, "os.PathLike[str]", Mapping[str, Any]]],
+    *,
+    workers: Optional[int] = None,
+    schema: Optional[Dict[str, Any]] = None,
+    dispatch: bool = False,
+) -> Iterator[Dict[str, Any]]:
+    """Validate many documents in parallel and yield one report per input, in order.
+
+    Inputs are file paths (read inside the workers) or already parsed payloads.
+    Each report has the `build_validation_report` shape; unreadable files and
+    invalid JSON produce an invalid report instead of raising. `workers` defaults
+    to the CPU count; `workers=1` validates serially in the current process.
+    """
+
+    workers = workers or os.cpu_count() or 1
+    if workers <= 1:
+        for source in paths_or_payloads:
+            yield _validate_source(source, schema, dispatch)
+        return
+
+    max_pending = workers * 4
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(schema, dispatch)) as executor:
+        pending: Deque[Future] = deque()
+        for source in paths_or_payloads:
+            pending.append(executor.submit(_validate_in_worker, source, dispatch))
+            if len(pending) >= max_pending:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
 
 
 def _make_context_message(error: jsonschema.ValidationError, context_error: jsonschema.ValidationError) -> str:
@@ -10,12 +485,10 @@ def _make_context_message(error: jsonschema.ValidationError, context_error: json
     return context_error.message + " of " + error.validator_value[i]["$ref"].replace("#/$defs/", "")
 
 
-def validate(instance: Dict[str, Any], schema: Optional[Dict[str, Any]] = None) -> None:
-    """Validate an R3XA payload and raise ValidationError with aggregated details."""
+def _raise_for_errors(errors: Iterable[jsonschema.ValidationError]) -> None:
+    """Raise one ValidationError aggregating every error, most relevant first."""
 
-    schema = schema or load_schema()
-    validator = jsonschema.validators.Draft202012Validator(schema)
-    errors = sorted(validator.iter_errors(instance), key=jsonschema.exceptions.relevance)
+    errors = sorted(errors, key=jsonschema.exceptions.relevance)
 
     if not errors:
         return
@@ -31,3 +504,19 @@ def validate(instance: Dict[str, Any], schema: Optional[Dict[str, Any]] = None)
 
     msg = "\n".join([f"- {e}" for e in error_messages])
     raise jsonschema.exceptions.ValidationError(msg)
+
+
+def validate(
+    instance: Dict[str, Any],
+    schema: Optional[Dict[str, Any]] = None,
+    *,
+    dispatch: bool = False,
+    check_references: bool = False,
+) -> None:
+    """Validate an R3XA payload and raise ValidationError with aggregated details.
+
+    `check_references=True` also checks ids: duplicates, references to missing or
+    wrong-section items, and cycles between data sets and data sources.
+    """
+
+    _raise_for_errors(iter_validation_errors(instance, schema, dispatch=dispatch, check_references=check_references))
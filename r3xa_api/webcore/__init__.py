@@ -1,5 +1,5 @@
-from .reports import build_validation_report
+from .reports import build_validation_report, clear_report_cache, report_cache_info
 from .schema_summary import build_schema_summary
 from .graph import generate_svg
 
-__all__ = ["build_validation_report", "build_schema_summary", "generate_svg"]
+__all__ = ["build_validation_report", "build_schema_summary", "clear_report_cache", "generate_svg", "report_cache_info"]
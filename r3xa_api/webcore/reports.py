@@ -1,43 +1,111 @@
-from typing import Any, Dict, List, Optional
+import copy
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
 
-import jsonschema
+from ..schema import schema_version
+from ..validate import CacheInfo, _build_report, _content_hash
 
-from ..schema import load_schema
 
+_REPORT_CACHE_SIZE = 256
 
-def _path_to_string(path: Any) -> str:
-    """Serialize a jsonschema error path to slash-separated notation."""
 
-    return "/".join(map(str, path))
+# Kept for callers that imported the old name.
+ReportCacheInfo = CacheInfo
 
 
-def _schema_path_to_string(schema_path: Any) -> str:
-    """Serialize a schema path to `#/...` notation."""
+class _ReportCache:
+    """Bounded LRU of validation reports keyed by payload and schema digests."""
 
-    return "#/" + "/".join(map(str, schema_path))
+    def __init__(self, maxsize: int = _REPORT_CACHE_SIZE) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Tuple[Any, ...], Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Tuple[Any, ...]) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            report = self._entries.get(key)
+            if report is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return copy.deepcopy(report)
+
+    def put(self, key: Tuple[Any, ...], report: Dict[str, Any]) -> None:
+        with self._lock:
+            self._entries[key] = copy.deepcopy(report)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.maxsize, len(self._entries))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+
+_report_cache = _ReportCache()
+
+
+def _report_cache_key(
+    instance: Any, schema: Optional[Dict[str, Any]], dispatch: bool, check_references: bool
+) -> Optional[Tuple[Any, ...]]:
+    digest = _content_hash(instance)
+    if digest is None:
+        return None
+    if schema is None:
+        schema_key: Optional[str] = f"packaged:{schema_version()}"
+    else:
+        schema_key = _content_hash(schema)
+        if schema_key is None:
+            return None
+    return schema_key, dispatch, check_references, digest
 
 
 def build_validation_report(
-    instance: Dict[str, Any], schema: Optional[Dict[str, Any]] = None
+    instance: Dict[str, Any],
+    schema: Optional[Dict[str, Any]] = None,
+    *,
+    dispatch: bool = False,
+    check_references: bool = False,
+    cache: bool = False,
 ) -> Dict[str, Any]:
-    """Return a stable validation report for UI/API consumption."""
-
-    schema = schema or load_schema()
-    validator = jsonschema.validators.Draft202012Validator(schema)
-    errors = sorted(validator.iter_errors(instance), key=jsonschema.exceptions.relevance)
-
-    if not errors:
-        return {"valid": True, "errors": []}
-
-    report_errors: List[Dict[str, Any]] = []
-    for error in errors:
-        report_errors.append(
-            {
-                "path": _path_to_string(error.path),
-                "message": error.message,
-                "validator": error.validator,
-                "schema_path": _schema_path_to_string(error.schema_path),
-            }
-        )
-
-    return {"valid": False, "errors": report_errors}
+    """Return a stable validation report for UI/API consumption.
+
+    `dispatch=True` validates each item only against the `$defs` entry named by its
+    `kind`, which is faster and reports item errors directly instead of one `anyOf`
+    failure per item. `check_references=True` adds referential-integrity errors
+    (duplicate ids, dangling references, reference cycles).
+
+    `cache=True` looks the report up in a bounded LRU keyed by a canonical-JSON hash
+    of the payload and the schema, so identical documents are validated once.
+    """
+
+    key = _report_cache_key(instance, schema, dispatch, check_references) if cache else None
+    if key is not None:
+        report = _report_cache.get(key)
+        if report is not None:
+            return report
+    report = _build_report(instance, schema, dispatch=dispatch, check_references=check_references)
+    if key is not None:
+        _report_cache.put(key, report)
+    return report
+
+
+def report_cache_info() -> CacheInfo:
+    """Return hit/miss counters and the current size of the validation report cache."""
+
+    return _report_cache.info()
+
+
+def clear_report_cache() -> None:
+    """Drop all cached validation reports and reset the counters."""
+
+    _report_cache.clear()
@@ -1,15 +1,26 @@
+from collections.abc import Mapping
 from typing import Any, Dict, Optional
 
 from ..schema import load_schema
 
 
-def _summarize_node(node: Dict[str, Any]) -> Dict[str, Any]:
+def _plain(value: Any) -> Any:
+    """Return a plain JSON copy of a value taken from a read-only schema view."""
+
+    if isinstance(value, Mapping):
+        return {k: _plain(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_plain(v) for v in value]
+    return value
+
+
+def _summarize_node(node: Mapping[str, Any]) -> Dict[str, Any]:
     """Extract a compact, UI-oriented summary from a schema node."""
 
     summary: Dict[str, Any] = {}
     for key in ("title", "description", "type", "required", "enum", "const"):
         if key in node:
-            summary[key] = node[key]
+            summary[key] = _plain(node[key])
 
     if "$ref" in node:
         summary["ref"] = node["$ref"]
@@ -25,10 +36,10 @@ def _summarize_node(node: Dict[str, Any]) -> Dict[str, Any]:
     return summary
 
 
-def build_schema_summary(schema: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+def build_schema_summary(schema: Optional[Mapping[str, Any]] = None) -> Dict[str, Any]:
     """Build a normalized summary for top-level R3XA sections."""
 
-    schema = schema or load_schema()
+    schema = schema or load_schema(copy=False)
     version = schema.get("properties", {}).get("version", {}).get("const")
     properties = schema.get("properties", {})
 
@@ -0,0 +1,698 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+EXAMPLE_DOCUMENTS = (
+    "examples/valid_camera_list.json",
+    "examples/valid_tabular_file.json",
+    "examples/artifacts/dic_pipeline.json",
+    "examples/artifacts/qi_hu_from_scratch.json",
+)
+
+
+def _load_documents() -> list[dict[str, Any]]:
+    return [json.loads((ROOT / name).read_text(encoding="utf-8")) for name in EXAMPLE_DOCUMENTS]
+
+
+def _time_per_call(func: Callable[[], Any], repeat: int) -> float:
+    func()
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat
+
+
+def _report(label: str, seconds: float) -> None:
+    print(f"{label:<40} {seconds * 1e6:12.1f} us")
+
+
+def cmd_validation(args: argparse.Namespace) -> None:
+    import jsonschema
+
+    from r3xa_api.schema import load_schema
+    from r3xa_api.validate import validate
+
+    print(f"Per-document validation cost ({args.repeat} rounds)")
+    for name, document in zip(EXAMPLE_DOCUMENTS, _load_documents()):
+
+        def uncached() -> None:
+            validator = jsonschema.validators.Draft202012Validator(load_schema())
+            list(validator.iter_errors(document))
+
+        def cached() -> None:
+            validate(document)
+
+        def dispatched() -> None:
+            validate(document, dispatch=True)
+
+        before = _time_per_call(uncached, args.repeat)
+        after = _time_per_call(cached, args.repeat)
+        fast = _time_per_call(dispatched, args.repeat)
+        print(name)
+        _report("  fresh schema + validator per call", before)
+        _report("  cached compiled validator", after)
+        _report("  cached + kind dispatch", fast)
+        print(f"  speed-up: x{before / after:.2f} (cache), x{before / fast:.2f} (cache + dispatch)")
+
+
+def cmd_schema_access(args: argparse.Namespace) -> None:
+    from r3xa_api import R3XAFile
+    from r3xa_api.schema import load_schema
+
+    print(f"Schema access cost ({args.repeat} calls)")
+    _report("load_schema() deep copy", _time_per_call(load_schema, args.repeat))
+    _report("load_schema(copy=False) view", _time_per_call(lambda: load_schema(copy=False), args.repeat))
+    _report("R3XAFile() construction", _time_per_call(R3XAFile, args.repeat))
+
+
+def cmd_validate_many(args: argparse.Namespace) -> None:
+    import os
+    import tempfile
+
+    from r3xa_api import validate_many
+
+    workers = args.workers or os.cpu_count() or 1
+    documents = _load_documents()
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = []
+        for index in range(args.count):
+            path = Path(tmp) / f"document_{index:06d}.json"
+            path.write_text(json.dumps(documents[index % len(documents)]), encoding="utf-8")
+            paths.append(path)
+
+        print(f"Batch validation of {len(paths)} files")
+        for label, count in (("serial (workers=1)", 1), (f"process pool (workers={workers})", workers)):
+            start = time.perf_counter()
+            reports = list(validate_many(paths, workers=count, dispatch=args.dispatch))
+            elapsed = time.perf_counter() - start
+            assert all(report["valid"] for report in reports)
+            print(f"{label:<40} {elapsed:10.2f} s  ({len(paths) / elapsed:8.1f} docs/s)")
+
+
+def _large_document(frames: int, items: int = 1) -> dict[str, Any]:
+    document = json.loads((ROOT / "examples" / "valid_camera_list.json").read_text(encoding="utf-8"))
+    template = next(item for item in document["data_sets"] if item["kind"] == "data_sets/list")
+    document["data_sets"] = []
+    for index in range(items):
+        item = dict(template, id=f"images_{index}")
+        item["timestamps"] = [i * 0.001 for i in range(frames)]
+        item["data"] = [f"img_{i:06d}.tif" for i in range(frames)]
+        document["data_sets"].append(item)
+    return document
+
+
+def _peak_memory(func: Callable[[], Any]) -> tuple[float, float]:
+    import tracemalloc
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / 2**20
+
+
+def cmd_stream_validation(args: argparse.Namespace) -> None:
+    import tempfile
+
+    from r3xa_api.validate import stream_validation_errors, validate
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "large.json"
+        path.write_text(json.dumps(_large_document(args.frames, args.items)), encoding="utf-8")
+        print(f"{args.items} data_sets/list items x {args.frames} frames ({path.stat().st_size / 2**20:.1f} MiB)")
+
+        def full() -> None:
+            validate(json.loads(path.read_text(encoding="utf-8")), dispatch=True)
+
+        def streamed() -> None:
+            assert not list(stream_validation_errors(path))
+
+        for label, func in (("json.load + validate", full), ("stream_validation_errors", streamed)):
+            elapsed, peak = _peak_memory(func)
+            print(f"{label:<40} {elapsed:10.2f} s  peak {peak:8.1f} MiB")
+
+
+def cmd_incremental_validation(args: argparse.Namespace) -> None:
+    from r3xa_api import R3XAFile
+    from r3xa_api.validate import validate
+
+    r3xa = R3XAFile.from_dict(_large_document(args.frames, args.items))
+    r3xa.validate()
+    counter = iter(range(10**9))
+
+    def full() -> None:
+        r3xa.data_sets[0]["title"] = f"edit {next(counter)}"
+        validate(r3xa.to_dict(), dispatch=True)
+
+    def incremental() -> None:
+        r3xa.data_sets[0]["title"] = f"edit {next(counter)}"
+        r3xa.validate()
+
+    print(f"One-field edit then validate ({args.items} items x {args.frames} frames, {args.repeat} rounds)")
+    before = _time_per_call(full, args.repeat)
+    after = _time_per_call(incremental, args.repeat)
+    _report("validate(to_dict(), dispatch=True)", before)
+    _report("R3XAFile.validate() incremental", after)
+    print(f"  speed-up: x{before / after:.2f}")
+
+
+def cmd_report_cache(args: argparse.Namespace) -> None:
+    from r3xa_api.webcore import build_validation_report, clear_report_cache, report_cache_info
+
+    print(f"Repeated validation reports ({args.repeat} rounds)")
+    for name, document in zip(EXAMPLE_DOCUMENTS, _load_documents()):
+        clear_report_cache()
+        before = _time_per_call(lambda: build_validation_report(document), args.repeat)
+        after = _time_per_call(lambda: build_validation_report(document, cache=True), args.repeat)
+        print(name)
+        _report("  build_validation_report", before)
+        _report("  build_validation_report(cache=True)", after)
+        print(f"  speed-up: x{before / after:.2f}  {report_cache_info()}")
+
+
+def cmd_references(args: argparse.Namespace) -> None:
+    from r3xa_api.references import build_id_index, iter_reference_errors
+
+    document: dict[str, Any] = {"data_sources": [], "data_sets": []}
+    for i in range(args.items):
+        document["data_sources"].append({"id": f"s{i}", "input_data_sets": [f"d{i - 1}"] if i else []})
+        document["data_sets"].append({"id": f"d{i}", "data_sources": [f"s{i}"]})
+
+    print(f"Referential integrity on a {args.items}-step source/data-set chain ({args.repeat} rounds)")
+    _report("build_id_index", _time_per_call(lambda: build_id_index(document), args.repeat))
+    _report("iter_reference_errors", _time_per_call(lambda: list(iter_reference_errors(document)), args.repeat))
+
+
+def cmd_lookup(args: argparse.Namespace) -> None:
+    from r3xa_api import R3XAFile
+
+    def wire(indexed: bool) -> None:
+        r3xa = R3XAFile()
+        for i in range(args.items):
+            r3xa.data_sources.append({"id": f"s{i}", "kind": "data_sources/generic"})
+            upstream = f"s{i // 2}"
+            if indexed:
+                source = r3xa.get(upstream)
+            else:
+                source = next(item for item in r3xa.data_sources if item["id"] == upstream)
+            assert source is not None
+
+    print(f"Wiring {args.items} data sources with one id lookup each")
+    for label, indexed in (("linear scan", False), ("R3XAFile.get", True)):
+        start = time.perf_counter()
+        wire(indexed)
+        print(f"{label:<40} {time.perf_counter() - start:10.3f} s")
+
+
+def cmd_import_time(args: argparse.Namespace) -> None:
+    import statistics
+    import subprocess
+
+    example = ROOT / EXAMPLE_DOCUMENTS[0]
+    # (label, untimed setup, timed statement)
+    scenarios = (
+        ("import r3xa_api", "", "import r3xa_api"),
+        (
+            "import + guided helpers + models (eager)",
+            "",
+            "import r3xa_api; r3xa_api.R3XAFile.add_camera_source; r3xa_api.models",
+        ),
+        (
+            "import + validate one document",
+            "",
+            f"import json, r3xa_api; r3xa_api.validate(json.load(open({str(example)!r})))",
+        ),
+        ("guided helpers (precompiled module)", "import r3xa_api", "r3xa_api.R3XAFile.add_camera_source"),
+        (
+            "guided helpers (runtime exec fallback)",
+            "import r3xa_api, r3xa_api._guided_helpers as g; g.SCHEMA_SHA256 = ''",
+            "r3xa_api.R3XAFile.add_camera_source",
+        ),
+    )
+    print(f"Cold-start cost in fresh interpreters (median of {args.repeat} runs)")
+    for label, setup, statement in scenarios:
+        code = f"import time\n{setup}\nt = time.perf_counter(); {statement}; print(time.perf_counter() - t)"
+        samples = [
+            float(subprocess.run([sys.executable, "-c", code], check=True, capture_output=True, text=True, cwd=ROOT).stdout)
+            for _ in range(args.repeat)
+        ]
+        _report(label, statistics.median(samples))
+
+
+def cmd_json_backends(args: argparse.Namespace) -> None:
+    from r3xa_api import jsonio
+
+    documents = {
+        "qi_hu_from_scratch.json": json.loads((ROOT / "examples/artifacts/qi_hu_from_scratch.json").read_text(encoding="utf-8")),
+        f"{args.items} list data sets x {args.frames} frames": _large_document(args.frames, args.items),
+    }
+    try:
+        for label, document in documents.items():
+            text = json.dumps(document, indent=4).encode("utf-8")
+            size = len(text) / 2**20
+            print(f"{label} ({size:.1f} MiB, {args.repeat} rounds)")
+            for backend in jsonio.available_json_backends():
+                jsonio.set_json_backend(backend)
+                load = _time_per_call(lambda: jsonio.loads(text), args.repeat)
+                dump = _time_per_call(lambda: jsonio.dumps_bytes(document, indent=4), args.repeat)
+                print(f"  {backend:<10} loads {size / load:8.1f} MiB/s   dumps(indent=4) {size / dump:8.1f} MiB/s")
+    finally:
+        jsonio.set_json_backend()
+
+
+def cmd_container(args: argparse.Namespace) -> None:
+    import tempfile
+
+    from r3xa_api import R3XAFile
+
+    r3xa = R3XAFile.from_dict(_large_document(args.frames, args.items))
+    with tempfile.TemporaryDirectory() as tmp:
+        json_path = r3xa.save(Path(tmp) / "doc.json", validate=False)
+        container_path = r3xa.save(Path(tmp) / "doc.r3xa", validate=False, format="container")
+        print(f"{args.items} list data sets x {args.frames} frames")
+        print(f"  size             json {json_path.stat().st_size / 2**20:8.2f} MiB   container {container_path.stat().st_size / 2**20:8.2f} MiB")
+        timings = {
+            "save": (
+                lambda: r3xa.save(json_path, validate=False),
+                lambda: r3xa.save(container_path, validate=False, format="container"),
+            ),
+            "load": (lambda: R3XAFile.load(json_path), lambda: R3XAFile.load(container_path)),
+            "load(mmap=True)": (lambda: R3XAFile.load(json_path), lambda: R3XAFile.load(container_path, mmap=True)),
+        }
+        for label, (as_json, as_container) in timings.items():
+            json_time = _time_per_call(as_json, args.repeat)
+            container_time = _time_per_call(as_container, args.repeat)
+            print(f"  {label:<16} json {json_time * 1e3:8.1f} ms   container {container_time * 1e3:8.1f} ms")
+
+
+def cmd_array_timestamps(args: argparse.Namespace) -> None:
+    import tracemalloc
+
+    import numpy
+
+    from r3xa_api import R3XAFile, unit
+
+    def build(timestamps_factory: Callable[[], Any]) -> tuple[R3XAFile, float, float]:
+        tracemalloc.start()
+        start = time.perf_counter()
+        r3xa = R3XAFile(title="Timestamps", description="High-speed series", authors="bench", date="2026-03-01")
+        r3xa.add_list_data_set(
+            title="Images",
+            description="Image sequence",
+            file_type="image/tiff",
+            data_sources=["camera"],
+            time_reference=unit(unit="s"),
+            timestamps=timestamps_factory(),
+            data=["frames.tif"],
+        )
+        elapsed = time.perf_counter() - start
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return r3xa, elapsed, current / 2**20
+
+    samples = numpy.arange(args.frames, dtype=numpy.float64) * 1e-5
+    print(f"add_list_data_set with {args.frames} timestamps")
+    for label, factory in (("list", samples.tolist), ("numpy", samples.copy)):
+        r3xa, elapsed, memory = build(factory)
+        dump = _time_per_call(r3xa.dump, 1)
+        print(f"  {label:<6} build {elapsed * 1e3:8.1f} ms   retained {memory:8.1f} MiB   dump {dump * 1e3:8.1f} ms")
+
+
+def cmd_series(args: argparse.Namespace) -> None:
+    import tracemalloc
+
+    from r3xa_api import FilenameRange, TimestampRange
+
+    def retained(factory: Callable[[], Any]) -> float:
+        tracemalloc.start()
+        value = factory()
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del value
+        return current / 2**20
+
+    factories = {
+        "timestamps": (
+            lambda: [round(10.0861051 + i * 0.008347218, 7) for i in range(args.frames)],
+            lambda: TimestampRange(10.0861051, 0.008347218, args.frames, decimals=7),
+        ),
+        "filenames": (
+            lambda: [f"img_{i:06d}.tif" for i in range(1, args.frames + 1)],
+            lambda: FilenameRange("img_%06d.tif", 1, args.frames + 1),
+        ),
+    }
+    print(f"{args.frames} frames")
+    for label, (as_list, as_range) in factories.items():
+        expand = _time_per_call(lambda: as_range().tolist(), 1)
+        print(f"  {label:<10} list {retained(as_list):8.2f} MiB   range {retained(as_range):8.4f} MiB   tolist() {expand * 1e3:8.1f} ms")
+
+
+def cmd_stream_save(args: argparse.Namespace) -> None:
+    import tempfile
+
+    from r3xa_api import R3XAFile, TimestampRange
+
+    lists = R3XAFile.from_dict(_large_document(args.frames, args.items))
+    ranges = R3XAFile.from_dict(_large_document(1, args.items))
+    for item in ranges.data_sets:
+        item["timestamps"] = TimestampRange(0.0, 0.001, args.frames)
+        item["data"] = lists.data_sets[0]["data"]
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "doc.json"
+        print(f"{args.items} list data sets x {args.frames} frames")
+        for label, r3xa in (("lists", lists), ("TimestampRange", ranges)):
+            for stream in (False, True):
+                elapsed, peak = _peak_memory(lambda: r3xa.save(path, validate=False, stream=stream))
+                mode = "stream=True" if stream else "buffered"
+                print(f"  {label:<15} {mode:<12} {elapsed * 1e3:8.1f} ms   peak {peak:8.1f} MiB")
+
+
+def cmd_lazy_load(args: argparse.Namespace) -> None:
+    import tempfile
+
+    from r3xa_api import R3XAFile
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = R3XAFile.from_dict(_large_document(args.frames, args.items)).save(Path(tmp) / "doc.json", validate=False)
+        print(f"{args.items} list data sets x {args.frames} frames ({path.stat().st_size / 2**20:.1f} MiB)")
+        for label, func in (
+            ("load().data_sources", lambda: R3XAFile.load(path).data_sources),
+            ("load(lazy=True).data_sources", lambda: R3XAFile.load(path, lazy=True).data_sources),
+            ("load(lazy=True).to_dict()", lambda: R3XAFile.load(path, lazy=True).to_dict()),
+        ):
+            elapsed, peak = _peak_memory(func)
+            print(f"  {label:<30} {elapsed * 1e3:8.1f} ms   peak {peak:8.1f} MiB")
+
+
+def _generated_registry(root: Path, count: int) -> None:
+    source = ROOT / "registry" / "data_sources" / "camera" / "avt_dolphin_f145b.json"
+    item = json.loads(source.read_text(encoding="utf-8"))
+    kinds = ("data_sources/camera", "data_sources/generic", "settings/specimen", "settings/generic")
+    for kind in kinds:
+        (root / kind).mkdir(parents=True, exist_ok=True)
+    for index in range(count):
+        kind = kinds[index % len(kinds)]
+        payload = dict(item, id=f"item_{index:06d}", title=f"Instrument {index}")
+        (root / kind / f"item_{index:06d}.json").write_text(json.dumps(payload, indent=2), encoding="utf-8")
+
+
+def cmd_registry_index(args: argparse.Namespace) -> None:
+    import os
+    import tempfile
+
+    from r3xa_api import Registry
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        _generated_registry(root, args.items)
+        for directory in root.glob("*/*"):
+            os.utime(directory, ns=(0, 10**18))
+        print(f"{args.items} registry items ({args.repeat} rounds)")
+
+        def titles_by_walk() -> list[str]:
+            return [item["title"] for _, item in Registry(root).iter_items(kind="data_sources/camera")]
+
+        def titles_by_index() -> list[str]:
+            return [entry.title for entry in Registry(root, index=True).entries(kind="data_sources/camera")]
+
+        indexed = Registry(root, index=True)
+        start = time.perf_counter()
+        indexed.list()
+        print(f"  {'build index (first run)':<34} {(time.perf_counter() - start) * 1e3:8.1f} ms")
+        for label, func in (
+            ("list() directory walk", lambda: Registry(root).list()),
+            ("list() index, new Registry", lambda: Registry(root, index=True).list()),
+            ("list() index, same Registry", indexed.list),
+            ("camera titles via iter_items()", titles_by_walk),
+            ("camera titles via entries()", titles_by_index),
+        ):
+            print(f"  {label:<34} {_time_per_call(func, args.repeat) * 1e3:8.1f} ms")
+
+
+def cmd_registry_cache(args: argparse.Namespace) -> None:
+    from r3xa_api import Registry
+
+    tree_paths = [
+        "data_sources/camera/avt_dolphin_f145b",
+        "settings/specimen/openhole_sample",
+        "data_sources/generic/pyxel_dic_2d",
+    ]
+    print(f"get_item(validated=True) over {len(tree_paths)} registry items ({args.repeat} rounds)")
+    for label, registry in (("uncached", Registry(ROOT / "registry")), ("cache_size=256", Registry(ROOT / "registry", cache_size=256))):
+        elapsed = _time_per_call(lambda: [registry.get_item(tree_path) for tree_path in tree_paths], args.repeat)
+        print(f"  {label:<16} {elapsed / len(tree_paths) * 1e6:8.1f} us/item   {registry.cache_info()}")
+
+
+def cmd_registry_validate(args: argparse.Namespace) -> None:
+    import os
+    import tempfile
+
+    from r3xa_api import Registry
+
+    workers = args.workers or os.cpu_count() or 1
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        _generated_registry(root, args.items)
+        registry = Registry(root)
+        print(f"Registry-wide validation of {args.items} items")
+        runs = (
+            ("iter_items(validated=True)", lambda: list(registry.iter_items(validated=True))),
+            ("validate_all(workers=1)", lambda: registry.validate_all(workers=1)),
+            (f"validate_all(workers={workers})", lambda: registry.validate_all(workers=workers)),
+        )
+        for label, func in runs:
+            start = time.perf_counter()
+            func()
+            elapsed = time.perf_counter() - start
+            print(f"  {label:<32} {elapsed:8.2f} s  ({args.items / elapsed:8.1f} items/s)")
+
+
+def cmd_registry_query(args: argparse.Namespace) -> None:
+    import os
+    import tempfile
+
+    from r3xa_api import Registry
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        _generated_registry(root, args.items)
+        for directory in root.glob("*/*"):
+            os.utime(directory, ns=(0, 10**18))
+        registry = Registry(root)
+        lookups = {"kind": "data_sources/camera", "title__in": ["Instrument 4", "Instrument 8"], "image_size__width__gte": 1024}
+
+        def scan() -> list[str]:
+            return [
+                tree_path
+                for tree_path, item in registry.iter_items(kind="data_sources/camera")
+                if item["title"] in ("Instrument 4", "Instrument 8")
+                and any(size["title"] == "width" and size["value"] >= 1024 for size in item["image_size"])
+            ]
+
+        start = time.perf_counter()
+        expected = scan()
+        print(f"Field query over {args.items} registry items")
+        print(f"  {'load and scan every item':<32} {(time.perf_counter() - start) * 1e3:10.2f} ms")
+        start = time.perf_counter()
+        assert registry.query(**lookups) == expected
+        print(f"  {'query (first call, builds)':<32} {(time.perf_counter() - start) * 1e3:10.2f} ms")
+        elapsed = _time_per_call(lambda: registry.query(**lookups), args.repeat)
+        print(f"  {'query (indexed)':<32} {elapsed * 1e3:10.3f} ms")
+
+
+def cmd_registry_backends(args: argparse.Namespace) -> None:
+    import os
+    import tempfile
+
+    from r3xa_api import Registry
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp) / "registry"
+        _generated_registry(root, args.items)
+        for directory in root.glob("*/*"):
+            os.utime(directory, ns=(0, 10**18))
+        files = Registry(root)
+        database = Registry(Path(tmp) / "registry.sqlite", backend="sqlite")
+        start = time.perf_counter()
+        database.backend.import_tree(root)
+        print(f"{args.items} registry items, import into SQLite: {(time.perf_counter() - start) * 1e3:.1f} ms")
+
+        tree_paths = files.list()[:: max(1, args.items // 500)]
+        item = files.get(tree_paths[0])
+        print(f"  {'':<28} {'files':>12} {'sqlite':>12}")
+        for label, action, per_item in (
+            ("list()", lambda registry: registry.list(), False),
+            ("list(kind=...)", lambda registry: registry.list(kind="data_sources/camera"), False),
+            ("entries(kind=...)", lambda registry: registry.entries(kind="data_sources/camera"), False),
+            ("get() per item", lambda registry: [registry.get(tree_path) for tree_path in tree_paths], True),
+            (
+                "save() per item",
+                lambda registry: [registry.save(tree_path, item, validate=False) for tree_path in tree_paths],
+                True,
+            ),
+        ):
+            timings = []
+            for registry in (files, database):
+                elapsed = _time_per_call(lambda: action(registry), args.repeat)
+                timings.append(elapsed / len(tree_paths) if per_item else elapsed)
+            print(f"  {label:<28} {timings[0] * 1e3:9.3f} ms {timings[1] * 1e3:9.3f} ms")
+
+
+def cmd_registry_save_many(args: argparse.Namespace) -> None:
+    import tempfile
+
+    from r3xa_api import Registry
+
+    source = json.loads((ROOT / "registry" / "data_sources" / "camera" / "avt_dolphin_f145b.json").read_text(encoding="utf-8"))
+    batch = {
+        f"data_sources/camera/item_{index:06d}": dict(source, id=f"item_{index:06d}", title=f"Instrument {index}")
+        for index in range(args.items)
+    }
+
+    validate = not args.no_validate
+    print(f"Import {args.items} registry items ({'validated' if validate else 'not validated'})")
+    for backend in ("files", "sqlite"):
+        for label, save in (
+            ("save() per item", lambda registry: [registry.save(path, item, validate=validate) for path, item in batch.items()]),
+            ("save_many()", lambda registry: registry.save_many(batch, validate=validate)),
+            ("save_many(fsync=True)", lambda registry: registry.save_many(batch, validate=validate, fsync=True)),
+        ):
+            with tempfile.TemporaryDirectory() as tmp:
+                registry = Registry(Path(tmp) / ("registry" if backend == "files" else "registry.sqlite"), backend=backend)
+                start = time.perf_counter()
+                save(registry)
+                elapsed = time.perf_counter() - start
+            print(f"  {backend:<7} {label:<24} {elapsed:7.2f} s   {args.items / elapsed:9.0f} items/s")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Micro-benchmarks for R3XA_API hot paths.",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    validation = subparsers.add_parser("validation", help="compare per-document validation cost with and without the validator cache")
+    validation.add_argument("--repeat", type=int, default=200, help="number of timed rounds over the example documents")
+    validation.set_defaults(func=cmd_validation)
+
+    schema_access = subparsers.add_parser("schema-access", help="compare copied and read-only schema access and R3XAFile construction")
+    schema_access.add_argument("--repeat", type=int, default=10000, help="number of timed calls")
+    schema_access.set_defaults(func=cmd_schema_access)
+
+    validate_many = subparsers.add_parser("validate-many", help="compare serial and process-pool batch validation of many files")
+    validate_many.add_argument("--count", type=int, default=400, help="number of generated document files")
+    validate_many.add_argument("--workers", type=int, default=None, help="pool size (default: CPU count)")
+    validate_many.add_argument("--dispatch", action="store_true", help="use kind-dispatch validation")
+    validate_many.set_defaults(func=cmd_validate_many)
+
+    stream_validation = subparsers.add_parser("stream-validation", help="compare peak memory of full and streaming validation")
+    stream_validation.add_argument("--frames", type=int, default=20000, help="timestamps/data entries per data set")
+    stream_validation.add_argument("--items", type=int, default=8, help="number of data_sets/list items")
+    stream_validation.set_defaults(func=cmd_stream_validation)
+
+    incremental = subparsers.add_parser("incremental-validation", help="compare full and incremental R3XAFile validation after a small edit")
+    incremental.add_argument("--frames", type=int, default=2000, help="timestamps/data entries per data set")
+    incremental.add_argument("--items", type=int, default=8, help="number of data_sets/list items")
+    incremental.add_argument("--repeat", type=int, default=20, help="number of timed edit/validate rounds")
+    incremental.set_defaults(func=cmd_incremental_validation)
+
+    report_cache = subparsers.add_parser("report-cache", help="compare uncached and cached validation reports for repeated payloads")
+    report_cache.add_argument("--repeat", type=int, default=200, help="number of timed rounds per document")
+    report_cache.set_defaults(func=cmd_report_cache)
+
+    references = subparsers.add_parser("references", help="time the id index and referential-integrity checks on a long chain")
+    references.add_argument("--items", type=int, default=20000, help="number of data sources (and data sets) in the chain")
+    references.add_argument("--repeat", type=int, default=10, help="number of timed rounds")
+    references.set_defaults(func=cmd_references)
+
+    lookup = subparsers.add_parser("lookup", help="compare linear scans and indexed R3XAFile.get while wiring a pipeline")
+    lookup.add_argument("--items", type=int, default=5000, help="number of data sources appended")
+    lookup.set_defaults(func=cmd_lookup)
+
+    import_time = subparsers.add_parser("import-time", help="measure cold-start import cost in fresh interpreters")
+    import_time.add_argument("--repeat", type=int, default=10, help="number of fresh interpreter runs per scenario")
+    import_time.set_defaults(func=cmd_import_time)
+
+    json_backends = subparsers.add_parser("json-backends", help="compare load/dump throughput of the installed JSON backends")
+    json_backends.add_argument("--frames", type=int, default=20000, help="timestamps/data entries per generated data set")
+    json_backends.add_argument("--items", type=int, default=8, help="number of generated data_sets/list items")
+    json_backends.add_argument("--repeat", type=int, default=5, help="number of timed rounds")
+    json_backends.set_defaults(func=cmd_json_backends)
+
+    container = subparsers.add_parser("container", help="compare size and save/load time of JSON files and binary containers")
+    container.add_argument("--frames", type=int, default=20000, help="timestamps/data entries per generated data set")
+    container.add_argument("--items", type=int, default=8, help="number of generated data_sets/list items")
+    container.add_argument("--repeat", type=int, default=5, help="number of timed rounds")
+    container.set_defaults(func=cmd_container)
+
+    array_timestamps = subparsers.add_parser("array-timestamps", help="compare list and NumPy timestamps in add_list_data_set (requires numpy)")
+    array_timestamps.add_argument("--frames", type=int, default=1_000_000, help="number of timestamps")
+    array_timestamps.set_defaults(func=cmd_array_timestamps)
+
+    series = subparsers.add_parser("series", help="compare memory of expanded lists and TimestampRange/FilenameRange")
+    series.add_argument("--frames", type=int, default=263000, help="number of frames")
+    series.set_defaults(func=cmd_series)
+
+    stream_save = subparsers.add_parser("stream-save", help="compare peak memory of buffered and streamed R3XAFile.save")
+    stream_save.add_argument("--frames", type=int, default=1_000_000, help="timestamps/data entries per data set")
+    stream_save.add_argument("--items", type=int, default=1, help="number of data_sets/list items")
+    stream_save.set_defaults(func=cmd_stream_save)
+
+    lazy_load = subparsers.add_parser("lazy-load", help="compare full and lazy R3XAFile.load when only data_sources is needed")
+    lazy_load.add_argument("--frames", type=int, default=200000, help="timestamps/data entries per data set")
+    lazy_load.add_argument("--items", type=int, default=8, help="number of data_sets/list items")
+    lazy_load.set_defaults(func=cmd_lazy_load)
+
+    registry_index = subparsers.add_parser("registry-index", help="compare directory walks and the persisted registry index")
+    registry_index.add_argument("--items", type=int, default=20000, help="number of generated registry files")
+    registry_index.add_argument("--repeat", type=int, default=5, help="number of timed rounds")
+    registry_index.set_defaults(func=cmd_registry_index)
+
+    registry_cache = subparsers.add_parser("registry-cache", help="compare uncached and cached Registry.get_item lookups")
+    registry_cache.add_argument("--repeat", type=int, default=500, help="number of timed rounds")
+    registry_cache.set_defaults(func=cmd_registry_cache)
+
+    registry_validate = subparsers.add_parser("registry-validate", help="compare serial and process-pool registry-wide validation")
+    registry_validate.add_argument("--items", type=int, default=4000, help="number of generated registry files")
+    registry_validate.add_argument("--workers", type=int, default=None, help="pool size (default: CPU count)")
+    registry_validate.set_defaults(func=cmd_registry_validate)
+
+    registry_query = subparsers.add_parser("registry-query", help="compare scanning every registry item with indexed Registry.query")
+    registry_query.add_argument("--items", type=int, default=20000, help="number of generated registry files")
+    registry_query.add_argument("--repeat", type=int, default=1000, help="number of timed queries")
+    registry_query.set_defaults(func=cmd_registry_query)
+
+    registry_backends = subparsers.add_parser("registry-backends", help="compare the file and SQLite registry backends")
+    registry_backends.add_argument("--items", type=int, default=20000, help="number of generated registry items")
+    registry_backends.add_argument("--repeat", type=int, default=5, help="number of timed rounds")
+    registry_backends.set_defaults(func=cmd_registry_backends)
+
+    registry_save_many = subparsers.add_parser("registry-save-many", help="compare per-item Registry.save with batched save_many imports")
+    registry_save_many.add_argument("--items", type=int, default=10000, help="number of imported registry items")
+    registry_save_many.add_argument("--no-validate", action="store_true", help="time the writes only")
+    registry_save_many.set_defaults(func=cmd_registry_save_many)
+
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    args.func(args)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
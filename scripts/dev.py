@@ -93,6 +93,10 @@ def cmd_generate_stubs(_: argparse.Namespace) -> None:
     _run(project_python(), "scripts/generate_core_stub.py")
 
 
+def cmd_generate_kind_table(_: argparse.Namespace) -> None:
+    _run(project_python(), "scripts/generate_kind_table.py")
+
+
 def cmd_notebook_dic(args: argparse.Namespace) -> None:
     python = project_python()
     command = [
@@ -241,6 +245,7 @@ def cmd_setup_dev(args: argparse.Namespace) -> None:
             ),
             (python, "scripts/postprocess_models.py"),
             (python, "scripts/generate_core_stub.py"),
+            (python, "scripts/generate_kind_table.py"),
         ]
     )
 
@@ -291,9 +296,15 @@ def build_parser() -> argparse.ArgumentParser:
     generate_models = subparsers.add_parser("generate-models", help="regenerate typed Pydantic models from the packaged schema")
     generate_models.set_defaults(func=cmd_generate_models)
 
-    generate_stubs = subparsers.add_parser("generate-stubs", help="regenerate the IDE/type-checker stub for guided helpers")
+    generate_stubs = subparsers.add_parser("generate-stubs", help="regenerate the IDE/type-checker stub and the precompiled guided helpers")
     generate_stubs.set_defaults(func=cmd_generate_stubs)
 
+    generate_kind_table = subparsers.add_parser(
+        "generate-kind-table",
+        help="regenerate the kind dispatch table used by the fast-path validator",
+    )
+    generate_kind_table.set_defaults(func=cmd_generate_kind_table)
+
     setup_dev = subparsers.add_parser(
         "setup-dev",
         help="install the full contributor stack and regenerate schema-derived artifacts",
@@ -1,11 +1,11 @@
 from __future__ import annotations
 
-from r3xa_api._stubgen import write_core_stub
+from r3xa_api._stubgen import write_core_stub, write_guided_helpers
 
 
 def main() -> None:
-    path = write_core_stub()
-    print(f"Wrote {path}")
+    for path in (write_core_stub(), write_guided_helpers()):
+        print(f"Wrote {path}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,12 @@
+from __future__ import annotations
+
+from r3xa_api._tablegen import write_kind_table
+
+
+def main() -> None:
+    path = write_kind_table()
+    print(f"Wrote {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+import json
+import random
+from pathlib import Path
+
+import pytest
+
+from r3xa_api import R3XAFile
+from r3xa_api.container import PackedFloatArray, is_container, load_container, save_container
+
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def _payload() -> dict:
+    payload = json.loads((ROOT / "examples" / "artifacts" / "qi_hu_from_scratch.json").read_text(encoding="utf-8"))
+    rng = random.Random(0)
+    payload["data_sets"][0]["timestamps"] = [rng.uniform(0, 1e3) for _ in range(500)]
+    payload["data_sets"][0]["extra_ints"] = list(range(500))
+    return payload
+
+
+def test_container_round_trips_to_identical_json(tmp_path: Path) -> None:
+    payload = _payload()
+    path = R3XAFile.from_dict(payload).save(tmp_path / "doc.r3xa", validate=False, format="container")
+
+    assert is_container(path)
+    assert not is_container(ROOT / "examples" / "artifacts" / "qi_hu_from_scratch.json")
+    loaded = R3XAFile.load(path)
+    assert loaded.dump() == json.dumps(payload, indent=4)
+    assert load_container(path) == payload
+
+
+def test_container_arrays_can_be_memory_mapped(tmp_path: Path) -> None:
+    payload = _payload()
+    path = save_container(payload, tmp_path / "doc.r3xa")
+
+    mapped = load_container(path, mmap_arrays=True)
+    timestamps = mapped["data_sets"][0]["timestamps"]
+    assert isinstance(timestamps, PackedFloatArray)
+    assert timestamps[3] == payload["data_sets"][0]["timestamps"][3]
+    assert timestamps[10:20] == payload["data_sets"][0]["timestamps"][10:20]
+    assert mapped["data_sets"][0]["extra_ints"] == list(range(500))
+
+    r3xa = R3XAFile.load(path, mmap=True)
+    assert r3xa.to_dict() == payload
+    resaved = r3xa.save(tmp_path / "copy.r3xa", validate=False, format="container")
+    assert load_container(resaved) == payload
+
+
+def test_saving_over_a_mapped_container_keeps_old_views_intact(tmp_path: Path) -> None:
+    payload = _payload()
+    path = save_container(payload, tmp_path / "doc.r3xa")
+    mapped = load_container(path, mmap_arrays=True)
+    timestamps = mapped["data_sets"][0]["timestamps"]
+
+    changed = _payload()
+    changed["data_sets"][0]["timestamps"] = [float(index) for index in range(300)]
+    save_container(changed, path)
+
+    assert list(timestamps) == payload["data_sets"][0]["timestamps"]
+    assert load_container(path) == changed
+    assert sorted(item.name for item in tmp_path.iterdir()) == ["doc.r3xa"]
+
+
+def test_container_rejects_reserved_key_and_unknown_format(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="reserved key"):
+        save_container({"settings": [{"$packed": "x"}]}, tmp_path / "doc.r3xa")
+    with pytest.raises(ValueError, match="Unknown R3XA file format"):
+        R3XAFile().save(tmp_path / "doc.bin", validate=False, format="cbor")
@@ -1,7 +1,10 @@
+from array import array
+
 import jsonschema
 import pytest
 
 from r3xa_api import R3XAFile, data_set_file, load_schema, unit, validate
+from r3xa_api.core import _ModelAwareList
 
 
 class _FakeTypedModel:
@@ -193,6 +196,91 @@ def test_add_item_routes_to_expected_collection() -> None:
     validate(r3xa.to_dict())
 
 
+def test_r3xafile_indexes_items_by_id_and_kind() -> None:
+    r3xa = R3XAFile(title="Index", description="Index", authors="R3XA API", date="2026-03-01")
+    settings = [r3xa.add_item("settings/generic", title=f"S{i}", description="Setting") for i in range(3)]
+    specimen = r3xa.add_item("settings/specimen", title="Specimen", description="Specimen")
+
+    assert r3xa.get(settings[1]["id"]) is r3xa.settings[1]
+    assert r3xa.get("missing") is None
+    assert r3xa.get("missing", default=settings[0]) is settings[0]
+    assert r3xa.by_kind("settings/generic") == settings
+    assert r3xa.by_kind("settings/specimen") == [specimen]
+    assert r3xa.by_kind("data_sets/list") == []
+    assert r3xa.by_kind("unknown/kind") == []
+
+    assert r3xa.remove(settings[0]["id"]) == settings[0]
+    assert r3xa.get(settings[0]["id"]) is None
+    assert r3xa.get(settings[2]["id"]) == settings[2]
+    with pytest.raises(KeyError):
+        r3xa.remove(settings[0]["id"])
+
+    r3xa.settings.insert(0, settings[0])
+    r3xa.settings[1] = {"id": "replaced", "kind": "settings/specimen"}
+    assert r3xa.get(settings[0]["id"]) == settings[0]
+    assert r3xa.get(settings[1]["id"]) is None
+    assert [item["id"] for item in r3xa.by_kind("settings/specimen")] == ["replaced", specimen["id"]]
+
+    stored = r3xa.get(specimen["id"])
+    stored["id"] = "renamed"
+    stored["kind"] = "settings/generic"
+    assert r3xa.get("renamed") is None
+    r3xa.reindex()
+    assert r3xa.by_kind("settings/specimen") == [r3xa.settings[1]]
+    assert r3xa.get("renamed") is stored
+
+
+def test_r3xafile_index_follows_in_place_edits_and_mutations() -> None:
+    r3xa = R3XAFile(title="Index", description="Index", authors="R3XA API", date="2026-03-01")
+    for i in range(6):
+        r3xa.add_item("data_sources/generic", title=f"D{i}", description="Source")
+    sources = list(r3xa.data_sources)
+    assert r3xa.by_kind("data_sources/generic") == sources
+
+    sources[0]["id"] = "renamed"
+    sources[1]["kind"] = "data_sources/camera"
+    r3xa.reindex()
+    assert r3xa.get("renamed") is sources[0]
+    assert r3xa.remove("renamed") is sources[0]
+    assert r3xa.by_kind("data_sources/camera") == [sources[1]]
+
+    collection = r3xa.data_sources
+    collection.insert(1, {"id": "inserted", "kind": "data_sources/camera"})
+    collection[-1] = {"id": "assigned", "kind": "data_sources/generic"}
+    del collection[2]
+    collection.pop(0)
+    collection.remove(collection[1])
+    collection.reverse()
+    collection.append({"id": "appended", "kind": "data_sources/camera"})
+    for position, item in enumerate(collection):
+        assert r3xa.get(item["id"]) is item
+        assert collection.position(item["id"]) == position
+    for kind in ("data_sources/camera", "data_sources/generic"):
+        assert r3xa.by_kind(kind) == [item for item in collection if item["kind"] == kind]
+    assert collection._ids is not None
+
+
+def test_r3xafile_index_misses_do_not_rebuild(monkeypatch: pytest.MonkeyPatch) -> None:
+    r3xa = R3XAFile(title="Index", description="Index", authors="R3XA API", date="2026-03-01")
+    for i in range(3):
+        r3xa.add_item("data_sources/generic", title=f"D{i}", description="Source")
+    r3xa.get("warm")
+    r3xa.by_kind("data_sources/generic")
+
+    def fail(self: _ModelAwareList) -> None:
+        raise AssertionError("index rebuilt")
+
+    monkeypatch.setattr(_ModelAwareList, "_build_index", fail)
+    assert r3xa.by_kind("data_sources/camera") == []
+    for _ in range(3):
+        assert r3xa.get("missing") is None
+        if r3xa.get("late") is None:
+            r3xa.add_item("data_sources/camera", id="late", title="Late", description="Source")
+    assert r3xa.by_kind("data_sources/camera") == [r3xa.get("late")]
+    with pytest.raises(KeyError):
+        r3xa.remove("missing")
+
+
 def test_add_setting_rejects_wrong_kind_prefix() -> None:
     r3xa = R3XAFile(title="Kinds", description="Kinds", authors="R3XA API", date="2026-03-01")
     with pytest.raises(ValueError):
@@ -303,3 +391,117 @@ def test_new_guided_helpers_validate_against_schema() -> None:
     )
 
     validate(r3xa.to_dict())
+
+
+def test_r3xafile_validate_only_revalidates_changed_items() -> None:
+    r3xa = R3XAFile(
+        title="Incremental validation",
+        description="Revalidate only changed items",
+        authors="R3XA API",
+        date="2026-04-03",
+    )
+    source = r3xa.add_generic_source(
+        title="Load cell",
+        description="Force measurement",
+        output_components=1,
+        output_dimension="point",
+        output_units=[unit(unit="N")],
+        manufacturer="Instron",
+        model="5800",
+    )
+    r3xa.add_list_data_set(
+        title="Images",
+        description="Image sequence",
+        file_type="image/tiff",
+        data_sources=[source["id"]],
+        time_reference=unit(unit="s"),
+        timestamps=[0.0, 1.0],
+        data=["img_0.tif", "img_1.tif"],
+    )
+
+    r3xa.validate()
+    assert r3xa._validation_cache.revalidated == 2
+
+    r3xa.validate()
+    assert r3xa._validation_cache.revalidated == 0
+
+    r3xa.add_generic_setting(title="Lab", description="Room conditions")
+    r3xa.validate()
+    assert r3xa._validation_cache.revalidated == 1
+
+    r3xa.data_sets[0]["timestamps"].append("late")
+    with pytest.raises(jsonschema.ValidationError, match="data_sets/0/timestamps/2 validation error"):
+        r3xa.validate()
+    assert r3xa._validation_cache.revalidated == 1
+
+    r3xa.data_sets[0]["timestamps"][-1] = 2.0
+    r3xa.set_header(date="not-a-date")
+    with pytest.raises(jsonschema.ValidationError, match="date validation error"):
+        r3xa.validate()
+
+
+def _list_data_set_builder() -> tuple:
+    r3xa = R3XAFile(title="Array timestamps", description="High-speed series", authors="R3XA API", date="2026-03-01")
+    source = r3xa.add_generic_source(
+        title="Camera",
+        description="High-speed camera",
+        output_components=1,
+        output_dimension="surface",
+        output_units=[unit(unit="px")],
+        manufacturer="Photron",
+        model="SA-Z",
+    )
+    return r3xa, source["id"]
+
+
+def test_list_data_set_keeps_array_timestamps_until_serialization() -> None:
+    r3xa, source_id = _list_data_set_builder()
+    timestamps = array("d", [0.0, 0.5, 1.0])
+    item = r3xa.add_list_data_set(
+        title="Images",
+        description="Image sequence",
+        file_type="image/tiff",
+        data_sources=[source_id],
+        time_reference=unit(unit="s"),
+        timestamps=timestamps,
+        data=["a.tif", "b.tif", "c.tif"],
+    )
+
+    assert item["timestamps"] is timestamps
+    assert r3xa.to_dict()["data_sets"][0]["timestamps"] == [0.0, 0.5, 1.0]
+    assert '"timestamps": [\n' in r3xa.dump()
+    r3xa.validate()
+
+    for bad, message in (([0.0, 2.0, 1.0], "non-decreasing"), (array("d", [0.0, float("nan")]), "finite")):
+        with pytest.raises(ValueError, match=message):
+            r3xa.add_list_data_set(
+                title="Images",
+                description="Image sequence",
+                file_type="image/tiff",
+                data_sources=[source_id],
+                time_reference=unit(unit="s"),
+                timestamps=bad,
+                data=["a.tif", "b.tif"],
+            )
+
+
+def test_list_data_set_checks_numpy_timestamps_vectorized() -> None:
+    numpy = pytest.importorskip("numpy")
+
+    r3xa, source_id = _list_data_set_builder()
+    fields = dict(
+        title="Images",
+        description="Image sequence",
+        file_type="image/tiff",
+        data_sources=[source_id],
+        time_reference=unit(unit="s"),
+        data=["a.tif"] * 4,
+    )
+    item = r3xa.add_list_data_set(timestamps=numpy.linspace(0.0, 1.0, 4), **fields)
+    assert isinstance(item["timestamps"], numpy.ndarray)
+    r3xa.validate()
+
+    with pytest.raises(ValueError, match="non-decreasing"):
+        r3xa.add_list_data_set(timestamps=numpy.array([0.0, 1.0, 0.5, 2.0]), **fields)
+    with pytest.raises(ValueError, match="numeric"):
+        r3xa.add_list_data_set(timestamps=numpy.array(["0", "1"]), **fields)
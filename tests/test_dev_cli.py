@@ -50,6 +50,7 @@ def test_dev_cli_exposes_cross_platform_commands():
         "generate-models",
         "generate-spec",
         "generate-stubs",
+        "generate-kind-table",
         "setup-dev",
         "notebook-dic",
         "notebook-dic-export",
@@ -143,6 +144,7 @@ def test_setup_dev_dry_run_prints_bootstrap_plan(tmp_path: Path):
         assert "datamodel_code_generator" in output
         assert "scripts/postprocess_models.py" in output
         assert "scripts/generate_core_stub.py" in output
+        assert "scripts/generate_kind_table.py" in output
         assert "tools/generate_spec.py" in output
         assert "-m sphinx -b html docs docs/_build/html" in output
     finally:
@@ -0,0 +1,102 @@
+import json
+import math
+import os
+import stat
+from pathlib import Path
+
+import pytest
+
+from r3xa_api import FilenameRange, R3XAFile, TimestampRange, jsonio
+
+
+ROOT = Path(__file__).resolve().parents[1]
+BACKENDS = jsonio.available_json_backends()
+
+
+@pytest.fixture(autouse=True)
+def _restore_backend(monkeypatch):
+    monkeypatch.setattr(jsonio, "_backend", None)
+    yield
+    jsonio._backend = None
+
+
+def _load_example() -> dict:
+    return json.loads((ROOT / "examples" / "artifacts" / "qi_hu_from_scratch.json").read_text(encoding="utf-8"))
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_backends_round_trip_with_requested_indentation(backend: str) -> None:
+    payload = {"a": [1, 2.5, {"b": "text", "c": []}], "n": None, "e": {}, "t": True}
+    assert jsonio.set_json_backend(backend) == backend
+
+    assert jsonio.loads(json.dumps(payload)) == payload
+    assert jsonio.loads(json.dumps(payload).encode("utf-8")) == payload
+    for indent in (2, 4):
+        assert jsonio.dumps(payload, indent=indent) == json.dumps(payload, indent=indent)
+    assert json.loads(jsonio.dumps_bytes(_load_example(), indent=4)) == _load_example()
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_backends_fall_back_to_stdlib_semantics(backend: str) -> None:
+    jsonio.set_json_backend(backend)
+
+    assert math.isnan(jsonio.loads('{"x": NaN}')["x"])
+    assert jsonio.dumps({1: "a"}) == json.dumps({1: "a"})
+    with pytest.raises(json.JSONDecodeError):
+        jsonio.loads("{not json")
+
+
+def test_auto_backend_keeps_saved_files_byte_identical(tmp_path: Path) -> None:
+    payload = _load_example()
+    jsonio.set_json_backend("auto")
+
+    path = R3XAFile.from_dict(payload).save(tmp_path / "doc.json", validate=False)
+
+    assert path.read_text(encoding="utf-8") == json.dumps(payload, indent=4) + "\n"
+    assert R3XAFile.load(path).to_dict() == payload
+
+
+def test_backend_selection_from_environment(monkeypatch) -> None:
+    monkeypatch.setenv(jsonio.BACKEND_ENV_VAR, "json")
+    assert jsonio.get_json_backend() == "json"
+
+    with pytest.raises(ValueError, match="Unknown JSON backend"):
+        jsonio.set_json_backend("yaml")
+
+
+def test_streamed_save_matches_buffered_save(tmp_path: Path) -> None:
+    r3xa = R3XAFile.from_dict(_load_example())
+    item = r3xa.data_sets[0]
+    item["timestamps"] = TimestampRange(0.0, 0.01, 500)
+    item["data"] = FilenameRange("img_%06d.tif", 0, 500)
+
+    buffered = r3xa.save(tmp_path / "buffered.json", validate=False)
+    streamed = r3xa.save(tmp_path / "streamed.json", validate=False, stream=True)
+
+    assert streamed.read_bytes() == buffered.read_bytes()
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["buffered.json", "streamed.json"]
+
+
+def test_streamed_write_keeps_previous_file_on_error(tmp_path: Path) -> None:
+    path = tmp_path / "doc.json"
+    jsonio.dump_path(path, {"ok": True}, indent=4, stream=True)
+
+    with pytest.raises(TypeError, match="not JSON serializable"):
+        jsonio.dump_path(path, {"ok": [1, 2], "bad": object()}, indent=4, stream=True)
+
+    assert json.loads(path.read_text(encoding="utf-8")) == {"ok": True}
+    assert [p.name for p in tmp_path.iterdir()] == ["doc.json"]
+
+
+def test_streamed_write_uses_regular_file_modes(tmp_path: Path) -> None:
+    umask = os.umask(0o022)
+    try:
+        buffered = R3XAFile.from_dict(_load_example()).save(tmp_path / "buffered.json", validate=False)
+        streamed = R3XAFile.from_dict(_load_example()).save(tmp_path / "streamed.json", validate=False, stream=True)
+        assert stat.S_IMODE(streamed.stat().st_mode) == stat.S_IMODE(buffered.stat().st_mode) == 0o644
+
+        os.chmod(streamed, 0o640)
+        jsonio.dump_path(streamed, {"ok": True}, stream=True)
+        assert stat.S_IMODE(streamed.stat().st_mode) == 0o640
+    finally:
+        os.umask(umask)
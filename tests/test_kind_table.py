@@ -0,0 +1,24 @@
+import ast
+from pathlib import Path
+
+from r3xa_api._tablegen import render_kind_table
+from r3xa_api.schema import load_schema
+from r3xa_api.validate import _kind_dispatch_table
+
+
+def test_generated_kind_table_matches_checked_in_file() -> None:
+    table_path = Path("r3xa_api/_kind_table.py")
+    assert table_path.read_text(encoding="utf-8") == render_kind_table()
+
+
+def test_generated_kind_table_is_valid_python_syntax() -> None:
+    ast.parse(Path("r3xa_api/_kind_table.py").read_text(encoding="utf-8"))
+
+
+def test_kind_table_covers_every_section_kind() -> None:
+    schema = load_schema()
+    table = _kind_dispatch_table(schema)
+
+    for section in ("settings", "data_sources", "data_sets"):
+        expected = {f"{section}/{name}" for name in schema["$defs"][section]}
+        assert set(table[section]) == expected
@@ -0,0 +1,73 @@
+import json
+import mmap
+from pathlib import Path
+
+import pytest
+
+from r3xa_api import R3XAFile, _jsonstream
+from r3xa_api._jsonstream import index_document
+
+
+ROOT = Path(__file__).resolve().parents[1]
+SECTIONS = ("settings", "data_sources", "data_sets")
+
+
+@pytest.mark.parametrize(
+    "path",
+    sorted((ROOT / "examples").glob("*.json")) + sorted((ROOT / "examples" / "artifacts").glob("*.json")),
+)
+def test_lazy_load_matches_eager_load(path: Path) -> None:
+    assert R3XAFile.load(path, lazy=True).to_dict() == R3XAFile.load(path).to_dict()
+
+
+def test_lazy_load_decodes_sections_on_first_access(tmp_path: Path, monkeypatch) -> None:
+    path = ROOT / "examples" / "artifacts" / "dic_pipeline.json"
+    payload = json.loads(path.read_text(encoding="utf-8"))
+
+    r3xa = R3XAFile.load(path, lazy=True)
+    assert r3xa.header["title"] == payload["title"]
+    assert not set(SECTIONS) & set(vars(r3xa))
+
+    assert r3xa.data_sources == payload["data_sources"]
+    assert r3xa.data_sources is r3xa.data_sources
+    assert "data_sets" not in vars(r3xa)
+
+    # The file is indexed through a memory map, never read whole.
+    monkeypatch.setattr(Path, "read_bytes", lambda self: pytest.fail(f"read {self}"))
+    assert R3XAFile.load(path, lazy=True).data_sets == payload["data_sets"]
+    monkeypatch.undo()
+
+    copy = tmp_path / "doc.json"
+    copy.write_bytes(path.read_bytes())
+    stale = R3XAFile.load(copy, lazy=True)
+    copy.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    with pytest.raises(RuntimeError, match="changed since it was indexed"):
+        stale.data_sets
+
+
+@pytest.mark.parametrize("use_mmap", [False, True])
+def test_index_document_skips_brackets_and_escapes_in_strings(tmp_path: Path, monkeypatch, use_mmap: bool) -> None:
+    payload = {
+        "title": 'a [b] {c} "quoted" \\',
+        "settings": [],
+        "data_sources": [{"id": "x", "values": [1, [2, {"k": "]}"}]]}, {"note": '\\"]'}, {"long": "q" * 40}],
+        "n": None,
+    }
+    # Tiny chunks make quote counting cross chunk boundaries.
+    monkeypatch.setattr(_jsonstream, "_MMAP_CHUNK_SIZE", 7)
+    for indent in (None, 4):
+        data = json.dumps(payload, indent=indent).encode("utf-8")
+        if use_mmap:
+            path = tmp_path / f"doc{indent}.json"
+            path.write_bytes(data)
+            with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                members, spans = index_document(mapped, SECTIONS)
+        else:
+            members, spans = index_document(data, SECTIONS)
+
+        assert members == {"title": payload["title"], "n": None}
+        decoded = {section: [json.loads(data[start:end]) for start, end in items] for section, items in spans.items()}
+        assert decoded == {"settings": [], "data_sources": payload["data_sources"]}
+
+    with pytest.raises(ValueError, match="Unterminated"):
+        index_document(b'{"settings": [{"id": "x"', SECTIONS)
@@ -1,4 +1,6 @@
 import inspect
+import subprocess
+import sys
 
 import pytest
 import r3xa_api
@@ -12,10 +14,13 @@ def test_public_api_surface() -> None:
         "new_item",
         "unit",
         "data_set_file",
+        "TimestampRange",
+        "FilenameRange",
         "from_model",
         "load_schema",
         "schema_version",
         "validate",
+        "validate_many",
         "Registry",
         "RegistryItem",
         "models",
@@ -62,3 +67,19 @@ def test_guided_helper_contract(kind: str, spec: dict[str, object]) -> None:
         parameter.kind == inspect.Parameter.VAR_KEYWORD
         for parameter in signature.parameters.values()
     ), kind
+
+
+def test_import_defers_models_and_guided_helpers() -> None:
+    code = (
+        "import sys\n"
+        "import r3xa_api\n"
+        "assert 'r3xa_api.models' not in sys.modules\n"
+        "assert 'pydantic' not in sys.modules\n"
+        "assert 'add_camera_source' not in vars(r3xa_api.R3XAFile)\n"
+        "r3xa = r3xa_api.R3XAFile()\n"
+        "assert callable(r3xa.add_camera_source)\n"
+        "assert 'add_camera_source' in vars(r3xa_api.R3XAFile)\n"
+        "assert r3xa_api.models is None or 'r3xa_api.models' in sys.modules\n"
+    )
+    proc = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+    assert proc.returncode == 0, proc.stderr + proc.stdout
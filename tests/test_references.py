@@ -0,0 +1,104 @@
+import json
+from pathlib import Path
+
+import jsonschema
+import pytest
+
+from r3xa_api import R3XAFile
+from r3xa_api.references import build_id_index, iter_reference_errors
+from r3xa_api.validate import validate
+from r3xa_api.webcore import build_validation_report
+
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def _load_example() -> dict:
+    return json.loads((ROOT / "examples" / "artifacts" / "dic_pipeline.json").read_text(encoding="utf-8"))
+
+
+def _errors(payload: dict) -> list:
+    return [(error.validator, "/".join(map(str, error.path))) for error in iter_reference_errors(payload)]
+
+
+def test_id_index_locates_items() -> None:
+    payload = _load_example()
+    index = build_id_index(payload)
+
+    entry = index["yzqbcxrpkpmgokzvybbaoaie"]
+    assert (entry.section, entry.index, entry.kind) == ("data_sets", 0, "data_sets/list")
+    assert entry.item is payload["data_sets"][0]
+    assert len(index) == 5
+    assert index.ids("data_sources") == ["gpwojlubbxomeyrlimsmtaoq", "epjeqxqznutkbdhstnvlzstv"]
+    assert index.get("missing") is None
+    assert "missing" not in index
+
+
+@pytest.mark.parametrize(
+    "path",
+    sorted((ROOT / "examples").glob("*.json")) + sorted((ROOT / "examples" / "artifacts").glob("*.json")),
+)
+def test_examples_have_no_reference_errors(path: Path) -> None:
+    assert _errors(json.loads(path.read_text(encoding="utf-8"))) == []
+
+
+def test_reports_dangling_and_wrong_section_references() -> None:
+    payload = _load_example()
+    payload["data_sets"][0]["data_sources"].append("missing")
+    payload["data_sources"][1]["input_data_sets"].append("gpwojlubbxomeyrlimsmtaoq")
+
+    assert _errors(payload) == [
+        ("reference", "data_sources/1/input_data_sets/1"),
+        ("reference", "data_sets/0/data_sources/1"),
+    ]
+
+
+def test_reports_duplicate_ids() -> None:
+    payload = _load_example()
+    payload["data_sets"][1]["id"] = payload["settings"][0]["id"]
+
+    assert ("unique_id", "data_sets/1/id") in _errors(payload)
+
+
+def test_reports_reference_cycles() -> None:
+    payload = _load_example()
+    # dseyy... is produced by epjeq..., which now also consumes it.
+    payload["data_sources"][1]["input_data_sets"].append("dseyyjnjhhassfgktihvuzga")
+
+    errors = list(iter_reference_errors(payload))
+
+    assert [error.validator for error in errors] == ["cycle"]
+    assert set(errors[0].instance) == {"epjeqxqznutkbdhstnvlzstv", "dseyyjnjhhassfgktihvuzga"}
+
+
+def test_cycle_detection_scales_to_long_chains() -> None:
+    count = 20000
+    payload = {"data_sources": [], "data_sets": []}
+    for i in range(count):
+        payload["data_sources"].append({"id": f"s{i}", "input_data_sets": [f"d{i - 1}"] if i else []})
+        payload["data_sets"].append({"id": f"d{i}", "data_sources": [f"s{i}"]})
+    assert _errors(payload) == []
+
+    payload["data_sources"][0]["input_data_sets"] = [f"d{count - 1}"]
+    errors = list(iter_reference_errors(payload))
+    assert [error.validator for error in errors] == ["cycle"]
+    assert len(errors[0].instance) == 2 * count
+
+
+def test_reference_checks_are_opt_in() -> None:
+    payload = _load_example()
+    payload["data_sets"][0]["data_sources"] = ["missing"]
+
+    validate(payload)
+    assert build_validation_report(payload)["valid"] is True
+    with pytest.raises(jsonschema.ValidationError, match="data_sets/0/data_sources/0 validation error"):
+        validate(payload, check_references=True)
+
+    report = build_validation_report(payload, check_references=True)
+    assert report["valid"] is False
+    assert report["errors"][0]["validator"] == "reference"
+
+    r3xa = R3XAFile.from_dict(payload)
+    r3xa.validate()
+    with pytest.raises(jsonschema.ValidationError, match="does not match any id"):
+        r3xa.validate(check_references=True)
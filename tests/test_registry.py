@@ -1,8 +1,20 @@
+import asyncio
+import hashlib
+import json
+import os
+import shutil
+import stat
+import threading
 from pathlib import Path
 
 import jsonschema
+import pytest
 
 from r3xa_api import R3XAFile, Registry, RegistryItem, load_item, load_registry, merge_item, unit, validate_item
+from r3xa_api import registry as registry_module
+from r3xa_api import registry_index, registry_query
+from r3xa_api.registry_async import AsyncRegistry
+from r3xa_api.registry_backends import RegistryBackend
 
 
 def test_validate_registry_items():
@@ -138,3 +150,302 @@ def test_load_registry_structure():
     assert "settings/specimen" in reg["settings"]
     assert "data_sources/camera" in reg["data_sources"]
     assert "data_sets/list" in reg["data_sets"]
+
+
+def test_validate_item_reports_unknown_kind() -> None:
+    root = Path(__file__).parents[1] / "registry"
+    item = load_item(root / "data_sources" / "camera" / "avt_dolphin_f145b.json")
+
+    with pytest.raises(ValueError, match="Unknown item kind"):
+        validate_item(item, kind="data_sources/unknown")
+
+
+def _copy_registry(tmp_path: Path) -> Path:
+    root = tmp_path / "registry"
+    shutil.copytree(Path(__file__).parents[1] / "registry", root)
+    return root
+
+
+def _age_directories(root: Path) -> None:
+    for directory in root.glob("*/*"):
+        if directory.is_dir():
+            os.utime(directory, ns=(0, 10**18))
+
+
+def test_registry_index_matches_directory_walk(tmp_path: Path, monkeypatch) -> None:
+    root = _copy_registry(tmp_path)
+    _age_directories(root)
+    registry = Registry(root, index=True)
+
+    umask = os.umask(0o022)
+    try:
+        assert registry.list() == Registry(root).list()
+    finally:
+        os.umask(umask)
+    # Other users of a shared registry must be able to read the index.
+    assert stat.S_IMODE((root / ".r3xa-index.json").stat().st_mode) == 0o644
+    assert registry.list(section="settings") == Registry(root).list(section="settings")
+    assert registry.list(kind="data_sources/camera") == Registry(root).list(kind="data_sources/camera")
+    assert (root / ".r3xa-index.json").exists()
+
+    entry = registry.index.get("data_sources/camera/avt_dolphin_f145b")
+    path = root / "data_sources" / "camera" / "avt_dolphin_f145b.json"
+    assert entry.kind == "data_sources/camera"
+    assert (entry.id, entry.title) == (json.loads(path.read_text())["id"], json.loads(path.read_text())["title"])
+    assert entry.sha256 == hashlib.sha256(path.read_bytes()).hexdigest()
+
+    # A new process answers listings from the index file without opening items.
+    def fail(*args):
+        raise AssertionError("item file read")
+
+    monkeypatch.setattr(registry_index, "_read_entry", fail)
+    assert Registry(root, index=True).list() == registry.list()
+
+
+def test_registry_index_tracks_saves_and_external_changes(tmp_path: Path) -> None:
+    root = _copy_registry(tmp_path)
+    registry = Registry(root, index=True)
+    registry.list()
+
+    camera = registry.load("data_sources/camera/avt_dolphin_f145b")
+    registry.save("data_sources/camera/copied_camera", dict(camera, title="Copied camera"))
+    assert registry.index.get("data_sources/camera/copied_camera").title == "Copied camera"
+    # Saves only update the index in memory; it is written on demand.
+    assert "copied_camera" not in (root / ".r3xa-index.json").read_text()
+    registry.flush()
+    assert "copied_camera" in (root / ".r3xa-index.json").read_text()
+    assert "data_sources/camera/copied_camera" in registry.list(kind="data_sources/camera")
+
+    shutil.copy(root / "data_sources" / "camera" / "copied_camera.json", root / "data_sources" / "camera" / "external.json")
+    (root / "data_sources" / "camera" / "copied_camera.json").unlink()
+    assert "data_sources/camera/external" in registry.list()
+    assert "data_sources/camera/copied_camera" not in registry.list()
+
+    path = root / "data_sources" / "camera" / "external.json"
+    path.write_text(path.read_text().replace("Copied camera", "Edited outside the registry"))
+    titles = {entry.tree_path: entry.title for entry in registry.entries(kind="data_sources/camera")}
+    assert titles["data_sources/camera/external"] == "Edited outside the registry"
+
+
+def test_registry_item_cache_hits_and_invalidation(tmp_path: Path, monkeypatch) -> None:
+    root = _copy_registry(tmp_path)
+    registry = Registry(root, cache_size=2)
+    tree_path = "data_sources/camera/avt_dolphin_f145b"
+
+    first = registry.get(tree_path)
+    first["title"] = "mutated by caller"
+    assert registry.get(tree_path)["title"] != "mutated by caller"
+    assert registry.cache_info() == registry_module.RegistryCacheInfo(hits=1, misses=1, maxsize=2, currsize=1)
+
+    validations = []
+    monkeypatch.setattr(registry_module, "validate_item", lambda item, kind=None: validations.append(kind))
+    for _ in range(3):
+        registry.get_item(tree_path)
+        registry.merge(tree_path, description="merged")
+    assert validations == [None]
+
+    path = root / f"{tree_path}.json"
+    path.write_text(path.read_text().replace('"title": "', '"title": "Edited '))
+    assert registry.get(tree_path)["title"].startswith("Edited ")
+    assert validations == [None]
+    registry.get_validated(tree_path)
+    assert validations == [None, None]
+
+    registry.get("settings/specimen/openhole_sample")
+    registry.get("data_sources/generic/pyxel_dic_2d")
+    assert registry.cache_info().currsize == 2
+
+    registry.clear_cache()
+    assert registry.cache_info() == registry_module.RegistryCacheInfo(0, 0, 2, 0)
+    assert Registry(root).cache_info().maxsize == 0
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_registry_validate_all_reports_every_item(tmp_path: Path, workers: int) -> None:
+    root = _copy_registry(tmp_path)
+    camera = root / "data_sources" / "camera"
+    broken = load_item(camera / "avt_dolphin_f145b.json")
+    broken["title"] = 42
+    (camera / "broken.json").write_text(json.dumps(broken), encoding="utf-8")
+    (camera / "truncated.json").write_text("{not json", encoding="utf-8")
+    shutil.copy(camera / "avt_dolphin_f145b.json", root / "data_sources" / "generic" / "misfiled.json")
+    registry = Registry(root)
+
+    results = registry.validate_all(workers=workers)
+
+    assert list(results) == registry.list()
+    assert [path for path, result in results.items() if not result.valid] == [
+        "data_sources/camera/broken",
+        "data_sources/camera/truncated",
+        "data_sources/generic/misfiled",
+    ]
+    assert results["data_sources/generic/misfiled"].kind == "data_sources/generic"
+    assert results["data_sources/camera/broken"].kind == "data_sources/camera"
+    assert results["data_sources/camera/broken"].errors[0]["path"] == "title"
+    assert results["data_sources/camera/truncated"].errors[0]["validator"] == "json"
+    assert all(result.duration >= 0 for result in results.values())
+    assert list(registry.validate_all(kind="settings/specimen", workers=workers)) == registry.list(kind="settings/specimen")
+
+
+def test_registry_query_uses_field_indexes_maintained_on_save(tmp_path: Path, monkeypatch) -> None:
+    root = _copy_registry(tmp_path)
+    registry = Registry(root)
+    avt = "data_sources/camera/avt_dolphin_f145b"
+    generated = "data_sources/camera/example_generated_camera"
+
+    assert registry.query(kind="data_sources/camera", image_size__width__gte=2048) == [generated]
+    assert registry.query(image_size__gte=1392, focal_length__lt=30) == [avt]
+    assert registry.query(section="data_sets", data_sources="ds_cam_avt_dolphin_f145b") == [
+        "data_sets/list/camera_images_template"
+    ]
+    assert registry.query(title__in=["CCD Camera", "Testing machine"]) == ["settings/generic/instron_5800", avt]
+    assert registry.query(manufacturer__contains="Vision") == [avt]
+    assert registry.query(section="settings") == registry.list(section="settings")
+    with pytest.raises(TypeError):
+        registry.query(title__in="CCD Camera")
+
+    # Saved items are applied to the indexes without reading any file back.
+    camera = registry.load(avt)
+    camera["image_size"][0]["value"] = 4096
+    monkeypatch.setattr(registry_query.jsonio, "load_path", lambda path: pytest.fail(f"read {path}"))
+    registry.save(avt, camera)
+    registry.save("data_sources/camera/copied", dict(camera, id="ds_cam_copied", manufacturer="Other"))
+    assert registry.query(image_size__width__gte=2048) == [avt, "data_sources/camera/copied", generated]
+    assert registry.query(manufacturer="Other") == ["data_sources/camera/copied"]
+    monkeypatch.undo()
+
+    shutil.copy(root / f"{generated}.json", root / "data_sources" / "camera" / "external.json")
+    (root / f"{avt}.json").unlink()
+    assert registry.query(image_size__width__gte=2048) == [
+        "data_sources/camera/copied",
+        generated,
+        "data_sources/camera/external",
+    ]
+
+    # Files rewritten in place by other processes are seen after an explicit refresh.
+    external = root / "data_sources" / "camera" / "external.json"
+    external.write_text(external.read_text().replace('"manufacturer": "', '"manufacturer": "ACME '))
+    assert registry.refresh(kind="data_sources/camera")
+    assert registry.query(manufacturer__contains="ACME") == ["data_sources/camera/external"]
+
+
+def test_sqlite_backend_matches_file_backend(tmp_path: Path) -> None:
+    root = _copy_registry(tmp_path)
+    files = Registry(root)
+    database = Registry(tmp_path / "registry.sqlite", backend="sqlite", cache_size=8)
+
+    assert database.backend.import_tree(root) == len(files.list())
+    assert database.list() == files.list()
+    assert database.list(section="settings") == files.list(section="settings")
+    assert database.list(kind="data_sources/camera") == files.list(kind="data_sources/camera")
+    assert [tuple(entry)[:4] + tuple(entry)[5:] for entry in database.entries()] == [
+        tuple(entry)[:4] + tuple(entry)[5:] for entry in files.entries()
+    ]
+    assert dict(database.iter_items(validated=True)) == dict(files.iter_items(validated=True))
+    with pytest.raises(FileNotFoundError):
+        database.get("data_sources/camera/missing")
+
+    tree_path = "data_sources/camera/avt_dolphin_f145b"
+    item = database.get_item(tree_path).merge(title="Stored in SQLite")
+    assert item.path is None
+    item.save()
+    files.save(tree_path, files.get_item(tree_path).merge(title="Stored in SQLite"))
+    assert database.get(tree_path)["title"] == "Stored in SQLite"
+    assert database.index.get(tree_path).sha256 == files.entries(kind="data_sources/camera")[0].sha256
+    assert database.query(title="Stored in SQLite") == [tree_path]
+    assert all(result.valid for result in database.validate_all(workers=2).values())
+
+    exported = tmp_path / "exported"
+    assert database.backend.export_tree(exported) == len(files.list())
+    for path in root.rglob("*.json"):
+        assert (exported / path.relative_to(root)).read_bytes() == path.read_bytes()
+
+    with pytest.raises(ValueError, match="Unknown registry backend"):
+        Registry(root, backend="postgres")
+
+    class ReadOnlyBackend(RegistryBackend):
+        def load(self, tree_path):
+            return {}
+
+    with pytest.raises(TypeError, match="abstract"):
+        ReadOnlyBackend(root)
+
+
+def test_async_registry_offloads_registry_calls(tmp_path: Path) -> None:
+    root = _copy_registry(tmp_path)
+    expected = Registry(root).list()
+    threads = set()
+
+    class RecordingRegistry(Registry):
+        def get(self, tree_path):
+            threads.add(threading.current_thread().name)
+            return super().get(tree_path)
+
+    async def scenario():
+        async with AsyncRegistry(RecordingRegistry(root), max_workers=2) as registry:
+            items = [pair async for pair in registry.iter_items(validated=True)]
+            camera = await registry.get("data_sources/camera/avt_dolphin_f145b")
+            await registry.save("data_sources/camera/async_copy", dict(camera, title="Saved from a coroutine"))
+            found = await registry.query(title="Saved from a coroutine")
+            listed = await registry.list(kind="data_sources/camera")
+        return items, found, listed
+
+    items, found, listed = asyncio.run(scenario())
+    assert [tree_path for tree_path, _ in items] == expected
+    assert found == ["data_sources/camera/async_copy"]
+    assert "data_sources/camera/async_copy" in listed
+    assert threads and all(name.startswith("r3xa-registry") for name in threads)
+
+
+@pytest.mark.parametrize("backend", ["files", "sqlite"])
+def test_registry_save_many_validates_before_writing(tmp_path: Path, backend: str) -> None:
+    source = Registry(Path(__file__).parents[1] / "registry")
+    camera = source.get("data_sources/camera/avt_dolphin_f145b")
+    root = tmp_path / ("registry" if backend == "files" else "registry.sqlite")
+    registry = Registry(root, backend=backend, index=True)
+    assert registry.query(title="Camera 0") == []
+
+    batch = {f"data_sources/camera/copy_{index}": dict(camera, title=f"Camera {index}") for index in range(5)}
+    broken = dict(batch, **{"data_sources/camera/broken": dict(camera, title=12)})
+    with pytest.raises(jsonschema.ValidationError, match="data_sources/camera/broken"):
+        registry.save_many(broken)
+    assert registry.list() == []
+
+    paths = registry.save_many(list(batch.items()), fsync=True)
+    assert len(paths) == len(batch)
+    assert registry.list() == sorted(batch)
+    assert registry.query(title="Camera 3") == ["data_sources/camera/copy_3"]
+    assert registry.get("data_sources/camera/copy_0") == batch["data_sources/camera/copy_0"]
+    if backend == "files":
+        assert paths[0] == root / "data_sources" / "camera" / "copy_0.json"
+        assert [path.name for path in (root / "data_sources" / "camera").iterdir() if path.suffix != ".json"] == []
+        assert Registry(root, index=True).entries() == registry.entries()
+
+
+def test_file_registry_save_many_rolls_back_a_failed_rename(tmp_path: Path, monkeypatch) -> None:
+    root = _copy_registry(tmp_path)
+    registry = Registry(root)
+    camera_dir = root / "data_sources" / "camera"
+    before = {path.name: path.read_bytes() for path in camera_dir.iterdir()}
+    camera = registry.get("data_sources/camera/avt_dolphin_f145b")
+    batch = {
+        "data_sources/camera/avt_dolphin_f145b": dict(camera, title="Replaced"),
+        "data_sources/camera/new_one": dict(camera, title="New"),
+        "data_sources/camera/new_two": dict(camera, title="New"),
+    }
+
+    replace = os.replace
+    calls = []
+
+    def failing_replace(source, target):
+        calls.append(target)
+        if len(calls) == 3:
+            raise OSError("disk went away")
+        replace(source, target)
+
+    monkeypatch.setattr(os, "replace", failing_replace)
+    with pytest.raises(OSError, match="disk went away"):
+        registry.save_many(batch)
+    monkeypatch.undo()
+
+    assert {path.name: path.read_bytes() for path in camera_dir.iterdir()} == before
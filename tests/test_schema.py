@@ -1,3 +1,7 @@
+import json
+
+import pytest
+
 from r3xa_api.schema import load_schema, schema_version
 
 
@@ -17,3 +21,30 @@ def test_load_schema_cached_content_is_not_mutated_by_callers() -> None:
 
     reloaded = load_schema()
     assert reloaded["properties"]["version"]["const"] == expected_version
+
+
+def test_load_schema_view_is_shared_and_read_only() -> None:
+    view = load_schema(copy=False)
+
+    assert view is load_schema(copy=False)
+    assert view["properties"]["version"]["const"] == schema_version()
+    with pytest.raises(TypeError):
+        view["properties"]["version"]["const"] = "mutated-version"  # type: ignore[index]
+    assert isinstance(view["required"], tuple)
+
+
+def test_load_schema_view_matches_copied_schema() -> None:
+    view = load_schema(copy=False)
+    copied = load_schema()
+
+    assert json.loads(json.dumps(view, default=dict)) == copied
+
+
+def test_schema_version_reads_custom_path(tmp_path) -> None:
+    schema = load_schema()
+    schema["properties"]["version"]["const"] = "custom-version"
+    path = tmp_path / "schema.json"
+    path.write_text(json.dumps(schema), encoding="utf-8")
+
+    assert schema_version(str(path)) == "custom-version"
+    assert schema_version() != "custom-version"
@@ -0,0 +1,89 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from r3xa_api import FilenameRange, R3XAFile, TimestampRange, unit
+
+
+def _ir_timestamps() -> list:
+    return [round(10.0861051 + i * 0.008347218, 7) for i in range(263)]
+
+
+def test_timestamp_range_matches_expanded_series() -> None:
+    series = TimestampRange(10.0861051, 0.008347218, 263, decimals=7)
+    expected = _ir_timestamps()
+
+    assert len(series) == 263
+    assert series.tolist() == expected
+    assert series[-1] == expected[-1]
+    assert series[10:200:7] == expected[10:200:7]
+    assert series[10:200:7][3] == expected[10:200:7][3]
+    assert series == expected
+    assert TimestampRange(0.0, 0.5, 4).tolist() == [0.0, 0.5, 1.0, 1.5]
+
+
+def test_timestamp_range_indexing_is_constant_time() -> None:
+    series = TimestampRange(0.0, 1e-6, 10**12)
+
+    assert series[10**12 - 1] == (10**12 - 1) * 1e-6
+    assert len(series[::1000]) == 10**9
+    assert series.is_monotonic()
+    assert not TimestampRange(1.0, -0.1, 3).is_monotonic()
+    assert not TimestampRange(0.0, float("nan"), 3).is_monotonic()
+
+
+def test_filename_range_formats_names_on_demand() -> None:
+    names = FilenameRange("img_%06d.tif", 1, 263001)
+
+    assert len(names) == 263000
+    assert names[0] == "img_000001.tif"
+    assert names[-1] == "img_263000.tif"
+    assert names[1:4].tolist() == ["img_000002.tif", "img_000003.tif", "img_000004.tif"]
+    assert names[::-1][0] == "img_263000.tif"
+    assert FilenameRange("original visible images/%06d.tif", 294, 358) == [
+        f"original visible images/{index:06d}.tif" for index in range(294, 358)
+    ]
+    with pytest.raises(ValueError, match="single integer"):
+        FilenameRange("img_%s_%s.tif", 0, 3)
+
+
+def test_r3xa_file_holds_ranges_until_serialization(tmp_path: Path) -> None:
+    r3xa = R3XAFile(title="Ranges", description="Lazy series", authors="R3XA API", date="2026-03-01")
+    source = r3xa.add_camera_source(
+        title="IR camera",
+        output_components=1,
+        output_dimension="surface",
+        output_units=[unit(unit="K")],
+        image_size=[unit(title="width", value=320, unit="px"), unit(title="height", value=256, unit="px")],
+        manufacturer="FLIR",
+        model="X6540sc",
+    )
+    timestamps = TimestampRange(10.0861051, 0.008347218, 263, decimals=7)
+    data = FilenameRange("img_%06d.tif", 1, 264)
+    item = r3xa.add_list_data_set(
+        title="IR images",
+        description="Infrared sequence",
+        file_type="image/tiff",
+        data_sources=[source["id"]],
+        time_reference=unit(unit="s"),
+        timestamps=timestamps,
+        data=data,
+    )
+
+    assert item["timestamps"] is timestamps and item["data"] is data
+    r3xa.validate()
+    saved = json.loads(r3xa.save(tmp_path / "doc.json").read_text(encoding="utf-8"))
+    assert saved["data_sets"][0]["timestamps"] == _ir_timestamps()
+    assert saved["data_sets"][0]["data"][-1] == "img_000263.tif"
+
+    with pytest.raises(ValueError, match="non-decreasing"):
+        r3xa.add_list_data_set(
+            title="IR images",
+            description="Infrared sequence",
+            file_type="image/tiff",
+            data_sources=[source["id"]],
+            time_reference=unit(unit="s"),
+            timestamps=TimestampRange(1.0, -0.1, 3),
+            data=data[:3],
+        )
@@ -1,7 +1,9 @@
 import ast
+import inspect
 from pathlib import Path
 
-from r3xa_api._stubgen import render_core_stub
+from r3xa_api import _guided_helpers, core
+from r3xa_api._stubgen import render_core_stub, render_guided_helpers
 
 
 def test_generated_core_stub_matches_checked_in_file() -> None:
@@ -12,3 +14,25 @@ def test_generated_core_stub_matches_checked_in_file() -> None:
 def test_generated_core_stub_is_valid_python_syntax() -> None:
     source = Path("r3xa_api/core.pyi").read_text(encoding="utf-8")
     ast.parse(source)
+
+
+def test_generated_guided_helpers_match_checked_in_file() -> None:
+    helpers_path = Path("r3xa_api/_guided_helpers.py")
+    assert helpers_path.read_text(encoding="utf-8") == render_guided_helpers()
+
+
+def test_guided_helpers_fall_back_to_schema_when_hash_differs(monkeypatch) -> None:
+    monkeypatch.setattr(_guided_helpers, "SCHEMA_SHA256", "stale")
+    core._precompiled_guided_helpers.cache_clear()
+    try:
+        assert core._precompiled_guided_helpers() is None
+        assert core._guided_kind_specs() == core._schema_guided_kind_specs()
+    finally:
+        monkeypatch.undo()
+        core._precompiled_guided_helpers.cache_clear()
+    assert core._precompiled_guided_helpers() is _guided_helpers
+    assert core._guided_kind_specs() == core._schema_guided_kind_specs()
+
+    required = _guided_helpers.KIND_SPECS["data_sources/camera"]["required"]
+    helper = core._make_guided_helper("add_camera_source", "data_sources/camera", required)
+    assert inspect.signature(helper) == inspect.signature(_guided_helpers.add_camera_source)
@@ -0,0 +1,210 @@
+import io
+import json
+from pathlib import Path
+
+import jsonschema
+import pytest
+
+from r3xa_api.schema import load_schema
+from r3xa_api.registry import load_item
+from r3xa_api.validate import (
+    clear_validator_cache,
+    get_item_validator,
+    get_validator,
+    iter_validation_errors,
+    stream_validation_errors,
+    validate,
+    validate_many,
+)
+from r3xa_api.webcore import build_validation_report
+
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def _load_example() -> dict:
+    return json.loads((ROOT / "examples" / "artifacts" / "dic_pipeline.json").read_text(encoding="utf-8"))
+
+
+def _example_documents() -> list:
+    paths = sorted((ROOT / "examples").glob("*.json")) + sorted((ROOT / "examples" / "artifacts").glob("*.json"))
+    return [json.loads(path.read_text(encoding="utf-8")) for path in paths]
+
+
+def _registry_documents() -> list:
+    documents = []
+    for path in sorted((ROOT / "registry").rglob("*.json")):
+        item = load_item(path)
+        section = item["kind"].split("/", 1)[0]
+        document = {"version": "2024.7.1", "settings": [], "data_sources": [], "data_sets": []}
+        document[section].append(item)
+        documents.append(document)
+    return documents
+
+
+def _invalid_variants(document: dict) -> list:
+    variants = []
+    for section in ("settings", "data_sources", "data_sets"):
+        for index, item in enumerate(document.get(section, []) if isinstance(document, dict) else []):
+            broken = json.loads(json.dumps(document))
+            broken[section][index].pop("title", None)
+            broken[section][index]["unexpected_field"] = True
+            variants.append((f"{section}/{index}", broken))
+    return variants
+
+
+def test_packaged_validator_is_compiled_once() -> None:
+    assert get_validator() is get_validator()
+
+
+def test_explicit_schema_validator_is_cached_by_identity() -> None:
+    schema = load_schema()
+    other = load_schema()
+
+    assert get_validator(schema) is get_validator(schema)
+    assert get_validator(schema) is not get_validator(other)
+
+
+def test_custom_schema_path_validator_can_be_invalidated(tmp_path: Path) -> None:
+    schema_path = tmp_path / "schema.json"
+    schema = load_schema()
+    schema_path.write_text(json.dumps(schema), encoding="utf-8")
+
+    first = get_validator(path=schema_path)
+    assert get_validator(path=schema_path) is first
+
+    schema["properties"]["version"]["const"] = "custom-version"
+    schema_path.write_text(json.dumps(schema), encoding="utf-8")
+    assert get_validator(path=schema_path) is first
+
+    clear_validator_cache(schema_path)
+    refreshed = get_validator(path=schema_path)
+    assert refreshed is not first
+    assert refreshed.schema["properties"]["version"]["const"] == "custom-version"
+
+
+def test_validate_uses_cached_validator_results() -> None:
+    payload = _load_example()
+    validate(payload)
+    validate(payload)
+
+    payload["version"] = "invalid"
+    with pytest.raises(jsonschema.ValidationError):
+        validate(payload)
+
+
+def test_item_validators_are_built_once_per_kind() -> None:
+    camera = get_item_validator("data_sources/camera")
+
+    assert get_item_validator("data_sources/camera") is camera
+    assert get_item_validator("data_sets/list") is not camera
+
+
+def test_item_validator_rejects_unknown_kind() -> None:
+    with pytest.raises(ValueError, match="Unknown item kind"):
+        get_item_validator("data_sources/unknown")
+
+
+@pytest.mark.parametrize("document", _example_documents() + _registry_documents())
+def test_dispatched_validation_agrees_with_jsonschema(document: dict) -> None:
+    generic = build_validation_report(document)
+    dispatched = build_validation_report(document, dispatch=True)
+
+    assert dispatched["valid"] is generic["valid"]
+    assert {error["path"] for error in dispatched["errors"] if "/" not in error["path"]} == {
+        error["path"] for error in generic["errors"] if "/" not in error["path"]
+    }
+
+    for item_path, broken in _invalid_variants(document):
+        generic = build_validation_report(broken)
+        dispatched = build_validation_report(broken, dispatch=True)
+        assert dispatched["valid"] is generic["valid"] is False
+        assert any(error["path"] == item_path for error in generic["errors"])
+        assert dispatched["errors"]
+        assert all(error["path"].startswith(item_path) for error in dispatched["errors"] if error["path"] != "")
+
+
+def test_dispatched_errors_point_at_item_fields() -> None:
+    payload = _load_example()
+    payload["data_sets"][0]["timestamps"] = ["not-a-number"]
+
+    errors = list(iter_validation_errors(payload, dispatch=True))
+
+    assert [list(error.path) for error in errors] == [["data_sets", 0, "timestamps", 0]]
+    assert list(errors[0].schema_path)[:3] == ["$defs", "data_sets", payload["data_sets"][0]["kind"].split("/")[1]]
+
+
+def test_dispatched_validation_falls_back_for_unknown_kind() -> None:
+    payload = _load_example()
+    payload["data_sources"][0]["kind"] = "data_sources/unknown"
+
+    report = build_validation_report(payload, dispatch=True)
+
+    assert report["valid"] is False
+    assert report["errors"][0]["path"] == "data_sources/0"
+    assert report["errors"][0]["validator"] == "anyOf"
+    with pytest.raises(jsonschema.ValidationError, match="data_sources/0 validation error"):
+        validate(payload, dispatch=True)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_validate_many_streams_reports_in_input_order(tmp_path: Path, workers: int) -> None:
+    valid = _load_example()
+    invalid = _load_example()
+    invalid["version"] = "invalid"
+    valid_path = tmp_path / "valid.json"
+    valid_path.write_text(json.dumps(valid), encoding="utf-8")
+    broken_path = tmp_path / "broken.json"
+    broken_path.write_text("{not json", encoding="utf-8")
+
+    sources = [valid_path, invalid, str(valid_path), broken_path, tmp_path / "missing.json"]
+    reports = list(validate_many(sources, workers=workers))
+
+    assert [report["valid"] for report in reports] == [True, False, True, False, False]
+    assert reports[1] == build_validation_report(invalid)
+    assert reports[3]["errors"][0]["validator"] == "json"
+    assert reports[4]["errors"][0]["validator"] == "file"
+    assert {"path", "message", "validator", "schema_path"} <= set(reports[1]["errors"][0])
+
+
+def test_validate_many_accepts_custom_schema_and_dispatch() -> None:
+    schema = load_schema()
+    schema["properties"]["version"]["const"] = "custom-version"
+    payload = _load_example()
+
+    reports = list(validate_many([payload], workers=2, schema=schema, dispatch=True))
+
+    assert reports[0]["valid"] is False
+    assert reports[0]["errors"][0]["path"] == "version"
+
+
+@pytest.mark.parametrize("document", _example_documents())
+def test_stream_validation_matches_dispatched_report(document: dict) -> None:
+    text = json.dumps(document, indent=2)
+    report = build_validation_report(document, dispatch=True)
+
+    streamed = list(stream_validation_errors(io.StringIO(text), chunk_size=64))
+
+    key = lambda error: (error["path"], error["message"], error["schema_path"])  # noqa: E731
+    assert sorted(map(key, streamed)) == sorted(map(key, report["errors"]))
+
+
+def test_stream_validation_reports_item_paths_in_file_order(tmp_path: Path) -> None:
+    payload = _load_example()
+    list_index = next(i for i, item in enumerate(payload["data_sets"]) if item["kind"] == "data_sets/list")
+    payload["data_sets"][list_index]["timestamps"] = [float(i) for i in range(20000)] + ["late"]
+    payload["data_sets"][list_index]["data"] = [f"img_{i:06d}.tif" for i in range(20001)]
+    payload["version"] = "invalid"
+    path = tmp_path / "large.json"
+    path.write_text(json.dumps(payload), encoding="utf-8")
+
+    errors = list(stream_validation_errors(path, chunk_size=1024))
+
+    assert [error["path"] for error in errors] == [f"data_sets/{list_index}/timestamps/20000", "version"]
+
+
+def test_stream_validation_reports_malformed_json() -> None:
+    errors = list(stream_validation_errors(io.StringIO('{"settings": [{"id": 1},')))
+
+    assert [error["path"] for error in errors] == ["settings/0", ""]
+    assert errors[-1]["validator"] == "json"
@@ -7,6 +7,7 @@ import pytest
 pytest.importorskip("fastapi")
 
 from httpx import ASGITransport
+from r3xa_api.registry_async import AsyncRegistry
 from web.app import api as api_module
 from web.app.main import create_app
 
@@ -100,6 +101,19 @@ async def test_api_registry_validate_invalid() -> None:
     assert report["errors"]
 
 
+@pytest.mark.anyio
+async def test_api_registry_validate_unknown_kind() -> None:
+    app = create_app()
+    transport = ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        item = _load_registry_item()
+        response = await client.post("/api/registry/validate", json={"item": item, "kind": "data_sources/unknown"})
+    assert response.status_code == 200
+    report = response.json()
+    assert report["valid"] is False
+    assert report["errors"] == ["Unknown item kind: data_sources/unknown"]
+
+
 @pytest.mark.anyio
 async def test_registry_page_available() -> None:
     app = create_app()
@@ -157,3 +171,74 @@ async def test_health_endpoint() -> None:
     assert payload["status"] == "ok"
     assert "version" in payload
     assert "timestamp" in payload
+
+
+# AsyncRegistry offloads to an asyncio executor, so registry endpoints run on asyncio only.
+@pytest.mark.anyio
+@pytest.mark.parametrize("anyio_backend", ["asyncio"])
+async def test_api_registry_items_are_paginated() -> None:
+    app = create_app()
+    transport = ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        everything = (await client.get("/api/registry/items", params={"limit": 500})).json()
+        page = (await client.get("/api/registry/items", params={"offset": 1, "limit": 2})).json()
+        cameras = (await client.get("/api/registry/items", params={"kind": "data_sources/camera"})).json()
+        bad_filter = await client.get("/api/registry/items", params={"kind": "camera"})
+        outside = await client.get("/api/registry/items", params={"kind": "data_sources/.."})
+        too_large = await client.get("/api/registry/items", params={"limit": 501})
+    assert page == {"total": everything["total"], "offset": 1, "limit": 2, "items": everything["items"][1:3]}
+    assert "data_sources/camera/avt_dolphin_f145b" in cameras["items"]
+    assert bad_filter.status_code == 400
+    assert outside.status_code == 400
+    assert too_large.status_code == 422
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("anyio_backend", ["asyncio"])
+async def test_api_registry_get_item() -> None:
+    app = create_app()
+    transport = ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.get("/api/registry/items/data_sources/camera/avt_dolphin_f145b")
+        missing = await client.get("/api/registry/items/data_sources/camera/missing")
+        outside = await client.get("/api/registry/items/data_sources/%2E%2E/%2E%2E")
+    assert response.status_code == 200
+    assert response.json() == _load_registry_item()
+    assert missing.status_code == 404
+    assert outside.status_code == 404
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("anyio_backend", ["asyncio"])
+async def test_api_registry_item_reports_unreadable_files(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    broken = tmp_path / "data_sources" / "camera" / "broken.json"
+    broken.parent.mkdir(parents=True)
+    broken.write_text("{not json", encoding="utf-8")
+    registry = AsyncRegistry(tmp_path, max_workers=1)
+    monkeypatch.setattr(api_module, "_registry", lambda: registry)
+
+    app = create_app()
+    transport = ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.get("/api/registry/items/data_sources/camera/broken")
+    registry.close()
+    assert response.status_code == 500
+    assert "data_sources/camera/broken" in response.json()["detail"]
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("anyio_backend", ["asyncio"])
+async def test_api_registry_search() -> None:
+    app = create_app()
+    transport = ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        wide = await client.get(
+            "/api/registry/search", params={"kind": "data_sources/camera", "image_size__width__gte": "2048"}
+        )
+        titles = await client.get(
+            "/api/registry/search", params=[("title__in", "CCD Camera"), ("title__in", "Testing machine")]
+        )
+        invalid = await client.get("/api/registry/search", params={"title__gt": "true"})
+    assert wide.json()["items"] == ["data_sources/camera/example_generated_camera"]
+    assert titles.json()["items"] == ["settings/generic/instron_5800", "data_sources/camera/avt_dolphin_f145b"]
+    assert invalid.status_code == 400
@@ -1,7 +1,7 @@
 import json
 from pathlib import Path
 
-from r3xa_api.webcore import build_validation_report
+from r3xa_api.webcore import build_validation_report, clear_report_cache, report_cache_info
 
 
 def _load_example() -> dict:
@@ -25,3 +25,23 @@ def test_validation_report_invalid() -> None:
     assert report["errors"]
     error = report["errors"][0]
     assert {"path", "message", "validator", "schema_path"} <= set(error.keys())
+
+
+def test_validation_report_cache_reuses_identical_payloads() -> None:
+    clear_report_cache()
+    payload = _load_example()
+
+    first = build_validation_report(payload, cache=True)
+    first["errors"].append("caller mutation")
+    second = build_validation_report(json.loads(json.dumps(payload)), cache=True)
+    assert second == {"valid": True, "errors": []}
+    assert report_cache_info()[:2] == (1, 1)
+
+    payload["version"] = "invalid"
+    assert build_validation_report(payload, cache=True)["valid"] is False
+    assert build_validation_report(payload, cache=True, dispatch=True)["valid"] is False
+    info = report_cache_info()
+    assert (info.hits, info.misses, info.currsize) == (1, 3, 3)
+
+    clear_report_cache()
+    assert report_cache_info().currsize == 0
@@ -1,23 +1,30 @@
-from typing import Any, Dict
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
 
-from fastapi import APIRouter, Request, Response, HTTPException
+from fastapi import APIRouter, Query, Request, Response, HTTPException
 from jsonschema.exceptions import ValidationError
+from r3xa_api import jsonio
 from r3xa_api.registry import validate_item
+from r3xa_api.registry_async import AsyncRegistry
+from r3xa_api.registry_index import REGISTRY_SECTIONS
 from r3xa_api.schema import load_schema
 from r3xa_api.webcore import build_schema_summary, build_validation_report, generate_svg
 
+from .settings import REGISTRY_BACKEND, REGISTRY_DIR, REGISTRY_WORKERS
+
 router = APIRouter()
+_PAGE_PARAMS = {"section", "kind", "offset", "limit"}
 
 
 @router.post("/validate")
 async def validate_payload(request: Request) -> Dict[str, Any]:
-    payload = await request.json()
-    return build_validation_report(payload)
+    payload = jsonio.loads(await request.body())
+    return build_validation_report(payload, cache=True)
 
 
 @router.post("/registry/validate")
 async def validate_registry_item(request: Request) -> Dict[str, Any]:
-    payload = await request.json()
+    payload = jsonio.loads(await request.body())
     item = payload.get("item", payload)
     kind = payload.get("kind")
     try:
@@ -27,18 +34,109 @@ async def validate_registry_item(request: Request) -> Dict[str, Any]:
     return {"valid": True, "errors": []}
 
 
+@lru_cache(maxsize=1)
+def _registry() -> AsyncRegistry:
+    return AsyncRegistry(REGISTRY_DIR, max_workers=REGISTRY_WORKERS, backend=REGISTRY_BACKEND, cache_size=1024)
+
+
+def _is_name(part: str) -> bool:
+    return part not in ("", ".", "..") and "/" not in part and "\\" not in part
+
+
+def _check_registry_filters(section: Optional[str], kind: Optional[str]) -> None:
+    # Filters become paths for the file backend; never let them leave the registry root.
+    if section is not None and section not in REGISTRY_SECTIONS:
+        raise HTTPException(status_code=400, detail=f"Unknown registry section: {section}")
+    if kind is not None:
+        kind_section, _, name = kind.partition("/")
+        if kind_section not in REGISTRY_SECTIONS or not _is_name(name):
+            raise HTTPException(status_code=400, detail=f"Unknown registry kind: {kind}")
+
+
+def _page(tree_paths: List[str], offset: int, limit: int) -> Dict[str, Any]:
+    return {"total": len(tree_paths), "offset": offset, "limit": limit, "items": tree_paths[offset : offset + limit]}
+
+
+def _query_value(value: str) -> Any:
+    # Query strings carry text only; numbers, booleans and null are read as JSON.
+    try:
+        parsed = jsonio.loads(value)
+    except ValueError:
+        return value
+    return parsed if isinstance(parsed, (int, float, bool)) or parsed is None else value
+
+
+@router.get("/registry/items")
+async def list_registry_items(
+    section: Optional[str] = None,
+    kind: Optional[str] = None,
+    offset: int = Query(0, ge=0),
+    limit: int = Query(50, ge=1, le=500),
+) -> Dict[str, Any]:
+    _check_registry_filters(section, kind)
+    try:
+        tree_paths = await _registry().list(section=section, kind=kind)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    return _page(tree_paths, offset, limit)
+
+
+@router.get("/registry/items/{tree_path:path}")
+async def get_registry_item(tree_path: str) -> Dict[str, Any]:
+    parts = tree_path.split("/")
+    if len(parts) != 3 or parts[0] not in REGISTRY_SECTIONS or not all(map(_is_name, parts[1:])):
+        raise HTTPException(status_code=404, detail=f"Unknown registry item: {tree_path}")
+    try:
+        return await _registry().get(tree_path)
+    except FileNotFoundError as exc:
+        raise HTTPException(status_code=404, detail=f"Unknown registry item: {tree_path}") from exc
+    except ValueError as exc:
+        # The stored file is not a JSON object: a server-side data error.
+        raise HTTPException(status_code=500, detail=f"Unreadable registry item {tree_path}: {exc}") from exc
+
+
+@router.get("/registry/search")
+async def search_registry_items(
+    request: Request,
+    section: Optional[str] = None,
+    kind: Optional[str] = None,
+    offset: int = Query(0, ge=0),
+    limit: int = Query(50, ge=1, le=500),
+) -> Dict[str, Any]:
+    _check_registry_filters(section, kind)
+    lookups: Dict[str, Any] = {}
+    for name in request.query_params:
+        if name in _PAGE_PARAMS:
+            continue
+        values = request.query_params.getlist(name)
+        if name.endswith("__in"):
+            lookups[name] = [_query_value(value) for value in values]
+        else:
+            lookups[name] = _query_value(values[-1])
+    try:
+        tree_paths = await _registry().query(section, kind, **lookups)
+    except (TypeError, ValueError) as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    return _page(tree_paths, offset, limit)
+
+
 @router.post("/graph")
 async def graph_svg(request: Request) -> Response:
-    payload = await request.json()
+    payload = jsonio.loads(await request.body())
     try:
         svg_bytes = generate_svg(payload)
     except RuntimeError as exc:
         raise HTTPException(status_code=503, detail=str(exc)) from exc
     return Response(content=svg_bytes, media_type="image/svg+xml")
 
+@lru_cache(maxsize=1)
+def _schema_json() -> bytes:
+    return jsonio.dumps_bytes(load_schema(copy=False), default=dict)
+
+
 @router.get("/schema")
-async def schema_raw() -> Dict[str, Any]:
-    return load_schema()
+async def schema_raw() -> Response:
+    return Response(content=_schema_json(), media_type="application/json")
 
 
 @router.get("/schema/summary")
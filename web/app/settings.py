@@ -1,3 +1,4 @@
+import os
 from pathlib import Path
 from time import time
 
@@ -5,3 +6,6 @@ BASE_DIR = Path(__file__).resolve().parents[1]
 TEMPLATES_DIR = BASE_DIR / "templates"
 STATIC_DIR = BASE_DIR / "static"
 APP_START = int(time())
+REGISTRY_DIR = Path(os.getenv("R3XA_REGISTRY_DIR", str(BASE_DIR.parent / "registry")))
+REGISTRY_BACKEND = os.getenv("R3XA_REGISTRY_BACKEND", "files")
+REGISTRY_WORKERS = int(os.getenv("R3XA_REGISTRY_WORKERS", "4"))